@@ -0,0 +1,5 @@
+"""
+Standalone benchmarks, run as modules from backend/ (``python -m
+benchmarks.<name> --help``). Each writes a JSON report so two runs can be
+compared.
+"""
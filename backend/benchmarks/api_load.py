@@ -0,0 +1,389 @@
+"""
+Latency, throughput, queries and memory of the public API endpoints.
+
+    python -m benchmarks.api_load --posts 10000 --projects 1000 --output after.json
+    python -m benchmarks.api_load --compare before.json after.json
+
+Seeds a throwaway SQLite database (benchmarks/settings.py) in a child
+process, then requests every endpoint in ENDPOINTS, first through Django's
+test client in this process and then over HTTP against a local gunicorn.
+Each endpoint is measured "cold" (a unique query string per request, so the
+URL-keyed response cache never hits) and "warm" (the same URL, primed once).
+
+The report is written with sorted keys and rounded numbers so two runs can
+be diffed directly, or with --compare, which exits non-zero on a regression.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Label -> path; {slug} is filled in with a published post
+ENDPOINTS: dict[str, str] = {
+    "posts": "/api/post/",
+    "projects": "/api/projects/?all=true",
+    "cards": "/api/cards/",
+    "info": "/api/info/",
+    "seo_blog": "/api/seo/blog/{slug}/",
+    "resume": "/api/resume/view/",
+}
+
+PDF_BYTES = (
+    b"%PDF-1.4\n1 0 obj << /Type /Pages /Count 1 >> endobj\n"
+    + b"2 0 obj << /Type /Page >> endobj\n"
+    + b"0" * 200_000
+    + b"\n%%EOF\n"
+)
+
+
+def _max_rss_kb(pid: str = "self") -> int:
+    # VmHWM resets on exec; ru_maxrss (the fallback, KiB on Linux) carries
+    # over the parent's peak from before the spawn
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if pid == "self" else 0
+
+
+def _child_pids(parent: int) -> list[int]:
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                # Field 4, after the parenthesised command name
+                ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == parent:
+            pids.append(int(entry))
+    return pids
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(
+    latencies: list[float], wall: float, queries: Optional[list[int]], errors: int
+) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def _cold_url(path: str, index: int) -> str:
+    return f"{path}{'&' if '?' in path else '?'}_bench={index}"
+
+
+# ============================================================================
+# SEEDING
+# ============================================================================
+
+
+def _seed(sizes: dict[str, int]) -> None:
+    import django
+
+    django.setup()
+    from django.core.files.base import ContentFile
+    from django.core.management import call_command
+
+    from info.datasets import DatasetLoader, merge_datasets, synthetic_dataset
+    from info.models import Resume
+
+    call_command("migrate", verbosity=0)
+    info = {
+        "site_header": "Benchmark",
+        "professional_title": "Engineer",
+        "greeting": "Hello!",
+        "bio": "Seeded by benchmarks.api_load.",
+        "github": "https://github.com/example",
+        "linkedin": "https://linkedin.com/in/example",
+    }
+    dataset = merge_datasets({"info": info}, synthetic_dataset(**sizes))
+    DatasetLoader(chunk_size=1000).load(dataset)
+    resume = Resume(is_active=True)
+    resume.file.save("resume.pdf", ContentFile(PDF_BYTES), save=False)
+    resume.save()
+
+
+# ============================================================================
+# TARGETS
+# ============================================================================
+
+
+def run_client(paths: dict[str, str], requests: int) -> dict[str, Any]:
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+
+    client = Client()
+    cache.clear()
+    results: dict[str, Any] = {}
+
+    def measure(urls: list[str]) -> dict[str, Any]:
+        latencies, queries, errors = [], [], 0
+        start = time.perf_counter()
+        for url in urls:
+            with CaptureQueriesContext(connection) as captured:
+                began = time.perf_counter()
+                response = client.get(url)
+                # Streaming responses (the resume) only do their work when read
+                if response.streaming:
+                    for _ in response.streaming_content:  # type: ignore[attr-defined]
+                        pass
+                latencies.append(time.perf_counter() - began)
+            queries.append(len(captured))
+            errors += response.status_code >= 400
+        return summarize(latencies, time.perf_counter() - start, queries, errors)
+
+    for label, path in paths.items():
+        cold = measure([_cold_url(path, index) for index in range(requests)])
+        client.get(path)
+        warm = measure([path] * requests)
+        results[label] = {"cold": cold, "warm": warm}
+    return {"endpoints": results, "peak_rss_mb": round(_max_rss_kb() / 1024, 1)}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _fetch(url: str) -> tuple[float, bool]:
+    began = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            response.read()
+            ok = response.status < 400
+    except Exception:
+        ok = False
+    return time.perf_counter() - began, ok
+
+
+def run_gunicorn(
+    paths: dict[str, str], requests: int, workers: int, concurrency: int
+) -> dict[str, Any]:
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "config.wsgi:application",
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=BACKEND_DIR,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not _fetch(base + "/health/")[1]:
+            if server.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("gunicorn did not start")
+            time.sleep(0.2)
+
+        results: dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+
+            def measure(urls: list[str]) -> dict[str, Any]:
+                start = time.perf_counter()
+                outcomes = list(pool.map(_fetch, urls))
+                wall = time.perf_counter() - start
+                errors = sum(not ok for _, ok in outcomes)
+                return summarize([latency for latency, _ in outcomes], wall, None, errors)
+
+            for label, path in paths.items():
+                cold = measure([base + _cold_url(path, index) for index in range(requests)])
+                # Every worker keeps its own LocMemCache, so prime each of them
+                measure([base + path] * workers * 2)
+                warm = measure([base + path] * requests)
+                results[label] = {"cold": cold, "warm": warm}
+
+        worker_rss = [_max_rss_kb(str(pid)) for pid in _child_pids(server.pid)]
+        return {
+            "endpoints": results,
+            "workers": workers,
+            "concurrency": concurrency,
+            "peak_rss_mb": round(max(worker_rss, default=0) / 1024, 1),
+            "master_rss_mb": round(_max_rss_kb(str(server.pid)) / 1024, 1),
+        }
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+# ============================================================================
+# COMPARISON
+# ============================================================================
+
+
+def compare(before: dict[str, Any], after: dict[str, Any], threshold: float) -> bool:
+    """
+    Prints per-endpoint p95 and query deltas; True if any p95 grew by more
+    than ``threshold`` percent (and over 1 ms) or any endpoint ran more
+    queries.
+    """
+    regressed = False
+    for target, result in sorted(after["targets"].items()):
+        old_result = before.get("targets", {}).get(target)
+        if not old_result:
+            continue
+        for label, states in sorted(result["endpoints"].items()):
+            for state, new in sorted(states.items()):
+                old = old_result["endpoints"].get(label, {}).get(state)
+                if not old:
+                    continue
+                change = 0.0
+                if old["p95_ms"]:
+                    change = (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100
+                old_queries = old["queries_per_request"]
+                new_queries = new["queries_per_request"]
+                more_queries = (new_queries or 0) > (old_queries or 0)
+                flag = ""
+                # Sub-millisecond swings on cached responses are noise
+                slower = change > threshold and new["p95_ms"] - old["p95_ms"] > 1.0
+                if slower or more_queries:
+                    regressed = True
+                    flag = "  <-- regression"
+                print(
+                    f"{target:9} {label:9} {state:5} "
+                    f"p95 {old['p95_ms']:8.2f} -> {new['p95_ms']:8.2f} ms ({change:+6.1f}%)  "
+                    f"queries {old_queries} -> {new_queries}{flag}"
+                )
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--projects", type=int, default=100)
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=200,
+        help="Measured requests per endpoint and cache state",
+    )
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        choices=["client", "gunicorn"],
+        default=["client", "gunicorn"],
+    )
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent HTTP clients")
+    parser.add_argument("--output", help="Write the JSON report here as well as stdout")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Diff two reports instead of running; exits 1 on a regression",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="p95 increase (%%) that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            before = json.load(f)
+        with open(args.compare[1]) as f:
+            after = json.load(f)
+        sys.exit(1 if compare(before, after, args.threshold) else 0)
+
+    bench_dir = tempfile.mkdtemp(prefix="portfolio-bench-")
+    os.environ["BENCH_DIR"] = bench_dir
+    os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+    sizes = {"posts": args.posts, "projects": args.projects, "cards": args.cards}
+    try:
+        # Seed in a child so its peak memory is not charged to the client run
+        seeder = multiprocessing.get_context("spawn").Process(target=_seed, args=(sizes,))
+        seeder.start()
+        seeder.join()
+        if seeder.exitcode:
+            raise RuntimeError("seeding failed")
+
+        import django
+
+        django.setup()
+        from django.utils import timezone
+
+        from blog.models import Post
+
+        slug = (
+            Post.objects.filter(status="published", publish_date__lte=timezone.now())
+            .values_list("slug", flat=True)
+            .first()
+        )
+        paths = {label: path.format(slug=slug) for label, path in ENDPOINTS.items()}
+
+        runners: dict[str, Callable[[], dict[str, Any]]] = {
+            "client": lambda: run_client(paths, args.requests),
+            "gunicorn": lambda: run_gunicorn(paths, args.requests, args.workers, args.concurrency),
+        }
+        report = {
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": "sqlite",
+                "cache": "redis" if os.getenv("BENCH_REDIS_URL") else "locmem",
+            },
+            "dataset": sizes,
+            "requests_per_state": args.requests,
+            "targets": {target: runners[target]() for target in args.targets},
+        }
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Peak memory and time of WebPOptimizedStorage._save on a synthetic image set.
+
+    python -m benchmarks.image_ingest --output ingest.json
+
+Each conversion runs in a fresh process so its peak RSS is not hidden by an
+earlier, larger one. Every image is converted twice: "uncapped" with
+IMAGE_MAX_PIXELS disabled (full-resolution decode) and "capped" with the
+configured limit (draft/reduce decoding plus downscale on ingest).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from typing import Any, Optional
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+
+# (filename, size, mode) — phone photos plus a screenshot-style PNG with alpha
+IMAGE_SET: list[tuple[str, tuple[int, int], str]] = [
+    ("phone-48mp.jpg", (8000, 6000), "RGB"),
+    ("phone-12mp.jpg", (4032, 3024), "RGB"),
+    ("web-2mp.jpg", (1920, 1080), "RGB"),
+    ("screenshot-alpha.png", (3000, 2000), "RGBA"),
+]
+
+
+def _max_rss_kb() -> int:
+    # VmHWM resets on exec; ru_maxrss (the fallback, KiB on Linux) carries
+    # over the parent's peak from before the spawn
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def make_image_set(directory: str) -> list[str]:
+    from PIL import Image
+
+    paths = []
+    for filename, size, mode in IMAGE_SET:
+        # Noise keeps the encoded files close to real photo sizes
+        noise = Image.effect_noise(size, 48)
+        gradient = Image.linear_gradient("L").resize(size)
+        bands = [noise, gradient, noise.transpose(Image.Transpose.FLIP_LEFT_RIGHT)]
+        if mode == "RGBA":
+            bands.append(gradient.transpose(Image.Transpose.ROTATE_180))
+        img = Image.merge(mode, bands)
+        path = os.path.join(directory, filename)
+        if filename.endswith(".jpg"):
+            img.save(path, quality=90)
+        else:
+            img.save(path)
+        paths.append(path)
+    return paths
+
+
+def _convert(path: str, max_pixels: Optional[int], queue: Any) -> None:
+    import django
+
+    django.setup()
+    from django.conf import settings
+    from PIL import Image
+
+    from config.storage import WebPOptimizedStorage
+
+    settings.IMAGE_MAX_PIXELS = max_pixels
+    with tempfile.TemporaryDirectory() as output_dir:
+        storage = WebPOptimizedStorage(location=output_dir)
+        baseline = _max_rss_kb()
+        start = time.perf_counter()
+        with open(path, "rb") as source:
+            name = storage._save(os.path.basename(path), source)
+        elapsed = time.perf_counter() - start
+        with Image.open(storage.path(name)) as result:
+            stored_size = result.size
+
+        queue.put(
+            {
+                "seconds": round(elapsed, 3),
+                "baseline_rss_mb": round(baseline / 1024, 1),
+                "peak_rss_mb": round(_max_rss_kb() / 1024, 1),
+                "delta_rss_mb": round((_max_rss_kb() - baseline) / 1024, 1),
+                "stored_size": list(stored_size),
+                "stored_bytes": storage.size(name),
+            }
+        )
+
+
+def run(max_pixels: int) -> dict[str, Any]:
+    context = multiprocessing.get_context("spawn")
+    results: dict[str, Any] = {"max_pixels": max_pixels, "images": {}}
+
+    with tempfile.TemporaryDirectory() as source_dir:
+        for path in make_image_set(source_dir):
+            entry: dict[str, Any] = {"source_bytes": os.path.getsize(path)}
+            for label, limit in (("uncapped", None), ("capped", max_pixels)):
+                queue = context.Queue()
+                process = context.Process(target=_convert, args=(path, limit, queue))
+                process.start()
+                entry[label] = queue.get()
+                process.join()
+            results["images"][os.path.basename(path)] = entry
+    return results
+
+
+def main() -> None:
+    import django
+
+    django.setup()
+    from django.conf import settings
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--max-pixels",
+        type=int,
+        default=getattr(settings, "IMAGE_MAX_PIXELS", None) or 3840 * 2160,
+        help="Cap used for the 'capped' runs (default: IMAGE_MAX_PIXELS)",
+    )
+    parser.add_argument("--output", help="Write the JSON report here as well as stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args.max_pixels), indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
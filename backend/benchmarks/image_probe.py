@@ -0,0 +1,169 @@
+"""
+Bytes transferred and latency of reading stored image dimensions.
+
+    python -m benchmarks.image_probe --rtt-ms 25 --mbps 200 --output probe.json
+
+Compares Django's ImageFieldFile path (open the object, feed it to Pillow)
+with config.image_probe.probe_dimensions (ranged header read). Storage is a
+local directory behind SimulatedRemoteStorage, which charges each request
+like a GCS GET: one round trip plus transfer time, and open() downloads the
+whole object first as django-storages' GoogleCloudFile does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+
+# (filename, size, mode, save options) — what WebPOptimizedStorage keeps,
+# plus formats that reach storage unconverted (CKEditor, fixtures)
+IMAGE_SET: list[tuple[str, tuple[int, int], str, dict[str, Any]]] = [
+    ("photo-4k.webp", (3840, 2160), "RGB", {"quality": 85}),
+    ("photo-1280.webp", (1280, 720), "RGB", {"quality": 85}),
+    ("logo-alpha.webp", (1200, 800), "RGBA", {"lossless": True}),
+    ("diagram.png", (1600, 1000), "RGB", {}),
+    ("camera-exif.jpg", (4032, 3024), "RGB", {"quality": 90, "exif_padding": 30_000}),
+]
+
+
+def make_image_set(directory: str) -> list[str]:
+    from PIL import Image
+
+    names = []
+    for filename, size, mode, options in IMAGE_SET:
+        options = dict(options)
+        # Noise keeps the encoded files close to real photo sizes
+        noise = Image.effect_noise(size, 48)
+        gradient = Image.linear_gradient("L").resize(size)
+        bands = [noise, gradient, noise.transpose(Image.Transpose.FLIP_LEFT_RIGHT)]
+        if mode == "RGBA":
+            bands.append(gradient.transpose(Image.Transpose.ROTATE_180))
+        img = Image.merge(mode, bands)
+        padding = options.pop("exif_padding", 0)
+        if padding:
+            # Camera EXIF (maker notes, thumbnails) pushes the JPEG SOF marker
+            # past the first ranged read
+            exif = Image.Exif()
+            exif[0x010E] = "x" * padding
+            options["exif"] = exif.tobytes()
+        img.save(os.path.join(directory, filename), **options)
+        names.append(filename)
+    return names
+
+
+def _storage_class() -> Any:
+    from django.core.files.base import File
+
+    from config.storage import WebPOptimizedStorage
+
+    class SimulatedRemoteStorage(WebPOptimizedStorage):  # type: ignore[misc, valid-type]
+        def __init__(self, rtt: float, bytes_per_second: float, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            self.rtt = rtt
+            self.bytes_per_second = bytes_per_second
+            self.reset()
+
+        def reset(self) -> None:
+            self.requests = 0
+            self.bytes_transferred = 0
+
+        def _transfer(self, data: bytes) -> bytes:
+            self.requests += 1
+            self.bytes_transferred += len(data)
+            time.sleep(self.rtt + len(data) / self.bytes_per_second)
+            return data
+
+        def _open(self, name: str, mode: str = "rb") -> File:
+            with open(self.path(name), "rb") as f:
+                data = self._transfer(f.read())
+            return File(io.BytesIO(data), name=name)
+
+        def read_head(self, name: str, size: int) -> bytes:
+            with open(self.path(name), "rb") as f:
+                return self._transfer(f.read(size))
+
+    return SimulatedRemoteStorage
+
+
+def _measure(storage: Any, read: Any, repeat: int) -> dict[str, Any]:
+    timings = []
+    dimensions = None
+    for _ in range(repeat):
+        storage.reset()
+        start = time.perf_counter()
+        dimensions = read()
+        timings.append(time.perf_counter() - start)
+    return {
+        "dimensions": list(dimensions) if dimensions else None,
+        "requests": storage.requests,
+        "bytes": storage.bytes_transferred,
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+    }
+
+
+def run(rtt_ms: float, mbps: float, repeat: int) -> dict[str, Any]:
+    from django.core.files.images import get_image_dimensions
+
+    from config.image_probe import probe_dimensions
+
+    results: dict[str, Any] = {"rtt_ms": rtt_ms, "mbps": mbps, "repeat": repeat, "images": {}}
+    totals = {"django": {"bytes": 0, "ms": 0.0}, "probe": {"bytes": 0, "ms": 0.0}}
+
+    with tempfile.TemporaryDirectory() as directory:
+        storage = _storage_class()(
+            rtt=rtt_ms / 1000, bytes_per_second=mbps * 1_000_000 / 8, location=directory
+        )
+        for name in make_image_set(directory):
+
+            def django_path(name: str = name) -> Any:
+                with storage.open(name, "rb") as f:
+                    return get_image_dimensions(f, close=False)
+
+            entry: dict[str, Any] = {
+                "object_bytes": os.path.getsize(storage.path(name)),
+                "django": _measure(storage, django_path, repeat),
+                "probe": _measure(storage, lambda n=name: probe_dimensions(storage, n), repeat),
+            }
+            if entry["django"]["dimensions"] != entry["probe"]["dimensions"]:
+                raise AssertionError(f"{name}: probe disagrees with Pillow")
+            for label in totals:
+                totals[label]["bytes"] += entry[label]["bytes"]
+                totals[label]["ms"] += entry[label]["median_ms"]
+            results["images"][name] = entry
+
+    results["totals"] = {
+        label: {"bytes": values["bytes"], "ms": round(values["ms"], 2)}
+        for label, values in totals.items()
+    }
+    return results
+
+
+def main() -> None:
+    import django
+
+    django.setup()
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=20.0, help="Round trip per request")
+    parser.add_argument("--mbps", type=float, default=100.0, help="Download bandwidth")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per image; median is reported")
+    parser.add_argument("--output", help="Write the JSON report here as well as stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args.rtt_ms, args.mbps, args.repeat), indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
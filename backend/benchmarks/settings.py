@@ -0,0 +1,50 @@
+# ruff: noqa: F403, F405, E402
+"""
+Settings for benchmarks.api_load: production-like caching and DEBUG off, on a
+throwaway SQLite database and media directory shared by the in-process test
+client and the gunicorn workers.
+"""
+
+from config.settings.base import *
+import os
+import tempfile
+
+DEBUG = False
+SECRET_KEY = "benchmark-only-not-secret"
+ALLOWED_HOSTS = ["*"]
+
+_BENCH_DIR = os.getenv("BENCH_DIR", os.path.join(tempfile.gettempdir(), "portfolio-bench"))
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.path.join(_BENCH_DIR, "db.sqlite3"),
+    }
+}
+
+# Shared Redis when given, so cold runs behave as in production; otherwise a
+# per-process LocMemCache (each gunicorn worker warms its own)
+if os.getenv("BENCH_REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("BENCH_REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "benchmark",
+        }
+    }
+
+STATIC_URL = "/static/"
+STATIC_ROOT = os.path.join(_BENCH_DIR, "static")
+MEDIA_URL = "/media/"
+MEDIA_ROOT = os.path.join(_BENCH_DIR, "media")
+
+# Keep background work out of the measured requests
+SNAPSHOT_ASYNC_REBUILD = False
+IMAGE_VARIANTS_ASYNC = False
+CONTACT_NOTIFICATIONS_ASYNC = False
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class BlogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "blog"
+
+    def ready(self) -> None:
+        from config.cache import connect_cache_invalidation, register_generation_expiry
+        from config.images import connect_image_variants
+
+        from .models import Category, Post
+        from .search import connect_search_index
+
+        connect_cache_invalidation(Category, Post)
+        connect_search_index()
+        connect_image_variants(Post, "image")
+        # Scheduled posts go live without a save, so the cached listing has to
+        # expire on its own at the next publish_date.
+        register_generation_expiry(Post, Post.next_scheduled_publish_date)
@@ -0,0 +1,68 @@
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+from blog.utils import html_to_text
+
+GIN_INDEX_NAME = "blog_post_search_vector_gin"
+
+
+def populate_search_text(apps, schema_editor):
+    Post = apps.get_model("blog", "Post")
+    posts = list(Post.objects.only("pk", "body"))
+    for post in posts:
+        post.search_text = html_to_text(post.body)
+    Post.objects.bulk_update(posts, ["search_text"], batch_size=500)
+
+
+def create_search_index(apps, schema_editor):
+    # GIN indexes and tsvector maths only exist on Postgres; SQLite keeps the
+    # column but searches search_text instead.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {GIN_INDEX_NAME} "
+        "ON blog_post USING gin (search_vector)"
+    )
+    schema_editor.execute(
+        """
+        UPDATE blog_post AS p SET search_vector =
+            setweight(to_tsvector('english', coalesce(p.title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce((
+                SELECT string_agg(c.name, ' ')
+                FROM blog_category c
+                JOIN blog_post_categories pc ON pc.category_id = c.id
+                WHERE pc.post_id = p.id
+            ), '')), 'B')
+            || setweight(to_tsvector('english', coalesce(p.search_text, '')), 'C')
+        """
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {GIN_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0005_alter_post_options_post_image_height_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+from blog.utils import estimate_reading_time, make_excerpt
+
+
+def populate_excerpts(apps, schema_editor):
+    Post = apps.get_model("blog", "Post")
+    posts = list(Post.objects.only("pk", "search_text"))
+    for post in posts:
+        post.excerpt = make_excerpt(post.search_text)
+        post.reading_time = estimate_reading_time(post.search_text)
+    Post.objects.bulk_update(posts, ["excerpt", "reading_time"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0006_post_search_text_post_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="excerpt",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="reading_time",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                editable=False,
+                help_text="Estimated reading time in minutes",
+            ),
+        ),
+        migrations.RunPython(populate_excerpts, migrations.RunPython.noop),
+    ]
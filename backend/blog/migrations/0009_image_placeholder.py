@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0008_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="image_placeholder",
+            field=models.CharField(blank=True, default="", editable=False, max_length=512),
+        ),
+    ]
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Optional
+
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.utils.text import slugify
 from django_ckeditor_5.fields import CKEditor5Field
 
+from config.image_probe import ProbedImageField
+
+from .utils import estimate_reading_time, html_to_text, make_excerpt
+
 
 class Category(models.Model):
     name = models.CharField(max_length=30)
@@ -30,18 +38,39 @@ class Post(models.Model):
     last_modified = models.DateTimeField(auto_now=True)
     image_width = models.PositiveIntegerField(null=True, blank=True)
     image_height = models.PositiveIntegerField(null=True, blank=True)
-    image = models.ImageField(
+    # Tiny inline WebP (data URI) painted until the image loads; see config/images.py
+    image_placeholder = models.CharField(
+        max_length=512, blank=True, default="", editable=False
+    )
+    image = ProbedImageField(
         upload_to="post_images/",
         blank=True,
         null=True,
         width_field="image_width",
         height_field="image_height",
     )
+    # Manifest of responsive copies of image, written by config/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     categories: models.ManyToManyField = models.ManyToManyField("Category", related_name="posts")
     order = models.PositiveIntegerField(
         default=0,
         help_text="Manually set order for blog posts. Default is newest first.",
     )
+    # Plain-text copy of body (tags stripped) so search never matches markup
+    search_text = models.TextField(blank=True, default="", editable=False)
+    # Weighted tsvector over title, categories and search_text. Maintained by
+    # blog.search on Postgres (GIN-indexed there); unused on SQLite.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Precomputed at save time so listings never read or parse body
+    excerpt = models.TextField(blank=True, default="", editable=False)
+    reading_time = models.PositiveSmallIntegerField(
+        default=1, editable=False, help_text="Estimated reading time in minutes"
+    )
+
+    # Columns derived from body in save(), added to any update_fields that
+    # touch body. Listings defer body, search_text and search_vector, and read
+    # excerpt and reading_time instead.
+    BODY_DERIVED_FIELDS = ("search_text", "excerpt", "reading_time")
 
     class Meta:
         ordering = ["-order", "-publish_date"]
@@ -70,7 +99,23 @@ class Post(models.Model):
 
         return f"{settings.SITE_URL.rstrip('/')}{path}"
 
+    @classmethod
+    def next_scheduled_publish_date(cls) -> Optional[datetime]:
+        """Returns when the next published-but-scheduled post goes live, if any."""
+        return (
+            cls.objects.filter(status="published", publish_date__gt=timezone.now())
+            .order_by("publish_date")
+            .values_list("publish_date", flat=True)
+            .first()
+        )
+
     def save(self, *args: object, **kwargs: object) -> None:  # type: ignore[override]
         if not self.slug:
             self.slug = slugify(self.title)  # type: ignore[assignment]
+        self.search_text = html_to_text(self.body)  # type: ignore[assignment]
+        self.excerpt = make_excerpt(self.search_text)  # type: ignore[assignment]
+        self.reading_time = estimate_reading_time(self.search_text)  # type: ignore[assignment]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "body" in update_fields:  # type: ignore[operator]
+            kwargs["update_fields"] = {*update_fields, *self.BODY_DERIVED_FIELDS}  # type: ignore[misc]
         super().save(*args, **kwargs)  # type: ignore[arg-type]
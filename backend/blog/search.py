@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import html
+import re
+from typing import Any, Iterable
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import connection
+from django.db.models import Q, QuerySet, TextField, Value
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from .models import Category, Post
+
+# Postgres text search configuration used for both indexing and querying
+SEARCH_CONFIG = "english"
+
+# Sentinels wrapped around matches before the snippet is HTML-escaped, so the
+# only markup in a headline is the <mark> we add ourselves.
+_START_SEL = "\x02"
+_STOP_SEL = "\x03"
+
+HEADLINE_WORDS = 35
+
+
+def _uses_postgres() -> bool:
+    return connection.vendor == "postgresql"
+
+
+# ============================================================================
+# INDEXING
+# ============================================================================
+
+
+def update_search_vectors(post_ids: Iterable[int]) -> None:
+    """
+    Recomputes the stored tsvector for the given posts: title (weight A),
+    category names (B) and the stripped body text (C). No-op outside Postgres.
+    """
+    post_ids = list(post_ids)
+    if not post_ids or not _uses_postgres():
+        return
+
+    posts = Post.objects.filter(pk__in=post_ids).prefetch_related("categories")
+    for post in posts.only("pk"):
+        category_names = " ".join(category.name for category in post.categories.all())
+        Post.objects.filter(pk=post.pk).update(
+            search_vector=(
+                SearchVector("title", weight="A", config=SEARCH_CONFIG)
+                + SearchVector(
+                    Value(category_names, output_field=TextField()),
+                    weight="B",
+                    config=SEARCH_CONFIG,
+                )
+                + SearchVector("search_text", weight="C", config=SEARCH_CONFIG)
+            )
+        )
+
+
+def _post_saved(sender: Any, instance: Post, raw: bool = False, **kwargs: Any) -> None:
+    if not raw:
+        update_search_vectors([instance.pk])
+
+
+def _category_post_ids(category: Category) -> list[int]:
+    return list(category.posts.values_list("pk", flat=True))
+
+
+def _categories_changed(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Any, **kwargs: Any
+) -> None:
+    if reverse and action == "pre_clear":
+        # category.posts.clear() sends no pk_set, and by post_clear the rows
+        # saying which posts were linked are gone
+        instance._search_post_ids = _category_post_ids(instance)
+        return
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        post_ids = [instance.pk]
+    elif pk_set is not None:
+        # category.posts.add(...) — instance is the Category
+        post_ids = pk_set
+    else:
+        post_ids = instance.__dict__.pop("_search_post_ids", [])
+    update_search_vectors(post_ids)
+
+
+def _category_saved(
+    sender: Any, instance: Category, raw: bool = False, **kwargs: Any
+) -> None:
+    # A renamed category changes the weight-B terms of every post in it
+    if not raw:
+        update_search_vectors(_category_post_ids(instance))
+
+
+def _category_deleting(sender: Any, instance: Category, **kwargs: Any) -> None:
+    instance._search_post_ids = _category_post_ids(instance)  # type: ignore[attr-defined]
+
+
+def _category_deleted(sender: Any, instance: Category, **kwargs: Any) -> None:
+    # Runs after the cascade removed the links, so the name drops out
+    update_search_vectors(instance.__dict__.pop("_search_post_ids", []))
+
+
+def connect_search_index() -> None:
+    """Keeps Post.search_vector current. Called from BlogConfig.ready()."""
+    post_save.connect(_post_saved, sender=Post, dispatch_uid="blog-search:post")
+    post_save.connect(_category_saved, sender=Category, dispatch_uid="blog-search:category")
+    pre_delete.connect(
+        _category_deleting, sender=Category, dispatch_uid="blog-search:category-deleting"
+    )
+    post_delete.connect(
+        _category_deleted, sender=Category, dispatch_uid="blog-search:category-deleted"
+    )
+    m2m_changed.connect(
+        _categories_changed,
+        sender=Post.categories.through,
+        dispatch_uid="blog-search:categories",
+    )
+
+
+# ============================================================================
+# QUERYING
+# ============================================================================
+
+
+def _render_headline(snippet: str) -> str:
+    escaped = html.escape(snippet)
+    return escaped.replace(_START_SEL, "<mark>").replace(_STOP_SEL, "</mark>")
+
+
+def _fallback_headline(text: str, terms: list[str]) -> str:
+    """Builds a ~HEADLINE_WORDS window around the first match, for SQLite."""
+    words = text.split(" ")
+    lowered_terms = [term.lower() for term in terms]
+    first_hit = next(
+        (
+            index
+            for index, word in enumerate(words)
+            if any(term in word.lower() for term in lowered_terms)
+        ),
+        0,
+    )
+    start = max(first_hit - HEADLINE_WORDS // 3, 0)
+    window = " ".join(words[start : start + HEADLINE_WORDS])
+
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    return pattern.sub(lambda m: f"{_START_SEL}{m.group(0)}{_STOP_SEL}", window)
+
+
+def search_posts(queryset: QuerySet[Post], query: str, limit: int) -> list[Post]:
+    """
+    Returns up to ``limit`` posts from ``queryset`` matching ``query``, best
+    first. Each result carries ``rank`` and an HTML-safe ``headline`` snippet
+    with matches wrapped in <mark>.
+
+    Postgres uses the GIN-indexed search_vector with ts_rank and ts_headline.
+    Other databases (SQLite in local dev and tests) fall back to substring
+    matching on the stripped search_text with a simple title-weighted score.
+    """
+    terms = query.split()
+    if not terms:
+        return []
+
+    if _uses_postgres():
+        search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+        results = list(
+            queryset.filter(search_vector=search_query)
+            .annotate(
+                rank=SearchRank("search_vector", search_query),
+                headline_raw=SearchHeadline(
+                    "search_text",
+                    search_query,
+                    config=SEARCH_CONFIG,
+                    start_sel=_START_SEL,
+                    stop_sel=_STOP_SEL,
+                    max_words=HEADLINE_WORDS,
+                    min_words=HEADLINE_WORDS // 2,
+                ),
+            )
+            .order_by("-rank", "-publish_date")[:limit]
+        )
+        for post in results:
+            post.headline = _render_headline(post.headline_raw)  # type: ignore[attr-defined]
+        return results
+
+    matches = Q()
+    for term in terms:
+        matches &= (
+            Q(title__icontains=term)
+            | Q(search_text__icontains=term)
+            | Q(categories__name__icontains=term)
+        )
+    candidates = list(queryset.filter(matches).distinct())
+
+    for post in candidates:
+        title = post.title.lower()
+        body = post.search_text.lower()
+        post.rank = float(  # type: ignore[attr-defined]
+            sum(3 * title.count(term.lower()) + body.count(term.lower()) for term in terms)
+        )
+        post.headline = _render_headline(  # type: ignore[attr-defined]
+            _fallback_headline(post.search_text, terms)
+        )
+
+    candidates.sort(key=lambda post: (-post.rank, -post.publish_date.timestamp()))  # type: ignore[attr-defined]
+    return candidates[:limit]
@@ -5,6 +5,8 @@ from typing import Any, Optional
 from rest_framework import serializers
 from rest_framework.request import Request
 
+from config.images import ImageSrcsetField
+
 from .models import Category, Post
 
 
@@ -16,6 +18,7 @@ class CategorySerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
 
 class PostSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
     image_url = serializers.SerializerMethodField()
+    image_srcset = ImageSrcsetField("image")
     tags = serializers.SerializerMethodField()
 
     class Meta:
@@ -27,8 +30,10 @@ class PostSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
             "created_on",
             "last_modified",
             "image_url",
+            "image_srcset",
             "image_width",
             "image_height",
+            "image_placeholder",
             "categories",
             "tags",
             "order",
@@ -47,3 +52,57 @@ class PostSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
 
     def get_tags(self, obj: Post) -> list[str]:
         return [cat.name for cat in obj.categories.all()]
+
+
+class PostListSerializer(PostSerializer):
+    """
+    Compact representation for listings: the precomputed plain-text ``excerpt``
+    and ``reading_time`` instead of the full body HTML.
+    """
+
+    class Meta(PostSerializer.Meta):
+        fields = [
+            "id",
+            "title",
+            "excerpt",
+            "reading_time",
+            "created_on",
+            "last_modified",
+            "image_url",
+            "image_srcset",
+            "image_width",
+            "image_height",
+            "image_placeholder",
+            "categories",
+            "tags",
+            "order",
+            "status",
+            "publish_date",
+            "slug",
+        ]
+
+
+class PostSearchResultSerializer(PostSerializer):
+    """
+    A search hit: post metadata plus relevance ``rank`` and a ``headline``
+    snippet (HTML-escaped, matches wrapped in <mark>). The body is omitted.
+    """
+
+    rank = serializers.FloatField(read_only=True)
+    headline = serializers.CharField(read_only=True)
+
+    class Meta(PostSerializer.Meta):
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "publish_date",
+            "image_url",
+            "image_srcset",
+            "image_width",
+            "image_height",
+            "image_placeholder",
+            "tags",
+            "rank",
+            "headline",
+        ]
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+
+from config.testing import QueryBudgetMixin
+from info.models import Info
+
+from .models import Category, Post
+
+
+class PostAPITests(APITestCase):
+    def setUp(self) -> None:
+        self.category = Category.objects.create(name="Development")
+        self.post = Post.objects.create(
+            title="Published Post",
+            body="<p>Hello <strong>world</strong></p>",
+            status="published",
+            publish_date=timezone.now() - timedelta(days=1),
+        )
+        self.post.categories.add(self.category)
+        Post.objects.create(title="Draft Post", body="<p>Draft</p>", status="draft")
+        self.list_url = reverse("post-list")
+
+    def test_list_only_returns_published_posts(self) -> None:
+        response: Response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([post["title"] for post in results], ["Published Post"])
+        self.assertEqual(results[0]["tags"], ["Development"])
+
+    def test_list_is_compact(self) -> None:
+        """Listings carry the precomputed excerpt, never the body HTML."""
+        post = self.client.get(self.list_url).data["results"][0]
+        self.assertNotIn("body", post)
+        self.assertEqual(post["excerpt"], "Hello world")
+        self.assertEqual(post["reading_time"], 1)
+
+    def test_list_does_not_select_body(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.list_url)
+        post_selects = [q["sql"] for q in queries if 'FROM "blog_post"' in q["sql"]]
+        self.assertTrue(post_selects)
+        self.assertFalse(any('"blog_post"."body"' in sql for sql in post_selects))
+
+    def test_retrieve_by_slug(self) -> None:
+        detail_url = reverse("post-detail", kwargs={"pk": self.post.slug})
+        response: Response = self.client.get(detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Published Post")
+
+    def test_list_revalidates_by_etag_only(self) -> None:
+        """Deleting a post leaves the newest timestamp alone; only the ETag moves."""
+        Post.objects.create(
+            title="Older Post",
+            body="<p>Older</p>",
+            status="published",
+            publish_date=timezone.now() - timedelta(days=2),
+        )
+        response: Response = self.client.get(self.list_url)
+        self.assertFalse(response.has_header("Last-Modified"))
+        etag = response["ETag"]
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.post.delete()
+        since = http_date(timezone.now().timestamp() + 60)
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([post["title"] for post in response.data["results"]], ["Older Post"])
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(API_CACHE_TTL=60 * 60 * 24 * 7, SNAPSHOT_ASYNC_REBUILD=False)
+class PostScheduledPublishCacheTests(APITestCase):
+    def test_scheduled_post_goes_live_after_cache_flush(self) -> None:
+        """A reseeded generation still knows when the next scheduled post is due."""
+        now = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(
+                title="Live",
+                body="<p>Live</p>",
+                status="published",
+                publish_date=now - timedelta(days=1),
+            )
+            Post.objects.create(
+                title="Scheduled",
+                body="<p>Soon</p>",
+                status="published",
+                publish_date=now + timedelta(hours=1),
+            )
+        # Redis flushed or evicted: counters and expiry markers are gone
+        cache.clear()
+
+        url = reverse("post-list")
+        titles = [post["title"] for post in self.client.get(url).data["results"]]
+        self.assertEqual(titles, ["Live"])
+
+        with mock.patch("django.utils.timezone.now", return_value=now + timedelta(hours=2)):
+            titles = [post["title"] for post in self.client.get(url).data["results"]]
+        self.assertEqual(titles, ["Scheduled", "Live"])
+
+
+class PostSearchTests(APITestCase):
+    def setUp(self) -> None:
+        published = {"status": "published", "publish_date": timezone.now() - timedelta(days=1)}
+        self.django_post = Post.objects.create(
+            title="Deploying Django",
+            body='<p>Ship <a href="/docker">containers</a> with Docker &amp; Django.</p>',
+            **published,
+        )
+        self.react_post = Post.objects.create(
+            title="React Hooks",
+            body="<p>Hooks replace classes. Django is not involved.</p>",
+            **published,
+        )
+        Post.objects.create(title="Django Draft", body="<p>Django</p>", status="draft")
+        self.url = reverse("post-search")
+
+    def test_search_text_is_stripped_on_save(self) -> None:
+        self.assertEqual(
+            self.django_post.search_text, "Ship containers with Docker & Django."
+        )
+
+    def test_excerpt_and_reading_time_follow_body(self) -> None:
+        self.django_post.body = "<p>" + "word " * 450 + "</p>"
+        self.django_post.save(update_fields=["body"])
+        self.django_post.refresh_from_db()
+        self.assertTrue(self.django_post.excerpt.endswith("…"))
+        self.assertLessEqual(len(self.django_post.excerpt), 301)
+        self.assertEqual(self.django_post.reading_time, 3)
+
+    def test_results_are_ranked_and_highlighted(self) -> None:
+        response: Response = self.client.get(self.url, {"q": "django"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [hit["title"] for hit in response.data], ["Deploying Django", "React Hooks"]
+        )
+        self.assertIn("<mark>Django</mark>", response.data[0]["headline"])
+        self.assertIn("&amp;", response.data[0]["headline"])
+        self.assertNotIn("body", response.data[0])
+
+    def test_markup_is_not_searchable(self) -> None:
+        response: Response = self.client.get(self.url, {"q": "href"})
+        self.assertEqual(response.data, [])
+        response = self.client.get(reverse("post-list"), {"search": "href"})
+        self.assertEqual(response.data["results"], [])
+
+    def test_empty_query_returns_nothing(self) -> None:
+        response: Response = self.client.get(self.url, {"q": "  "})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+
+class SearchIndexSignalTests(TestCase):
+    """Which posts get their search vector recomputed on category changes."""
+
+    def setUp(self) -> None:
+        self.category = Category.objects.create(name="Django")
+        self.posts = [
+            Post.objects.create(title=f"Post {index}", body="<p>Body</p>") for index in range(2)
+        ]
+        self.category.posts.add(*self.posts)
+        patcher = mock.patch("blog.search.update_search_vectors")
+        self.update = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def refreshed(self) -> set[int]:
+        return {pk for call in self.update.call_args_list for pk in call.args[0]}
+
+    def test_clearing_a_category_refreshes_its_former_posts(self) -> None:
+        self.category.posts.clear()
+        self.assertEqual(self.refreshed(), {post.pk for post in self.posts})
+
+    def test_renaming_a_category_refreshes_its_posts(self) -> None:
+        self.category.name = "Python"
+        self.category.save()
+        self.assertEqual(self.refreshed(), {post.pk for post in self.posts})
+
+    def test_deleting_a_category_refreshes_its_former_posts(self) -> None:
+        self.category.delete()
+        self.assertEqual(self.refreshed(), {post.pk for post in self.posts})
+
+
+class PostPaginationTests(APITestCase):
+    def setUp(self) -> None:
+        base = timezone.now() - timedelta(days=30)
+        # Pinned posts first, then a long run of order=0 ties on publish_date too
+        self.posts = [
+            Post.objects.create(
+                title=f"Post {index}",
+                body="<p>Body</p>",
+                status="published",
+                order=2 if index < 2 else 0,
+                publish_date=base + timedelta(days=index // 3),
+            )
+            for index in range(11)
+        ]
+        self.url = reverse("post-list")
+
+    def _expected_order(self) -> list[int]:
+        return list(
+            Post.objects.order_by("-order", "-publish_date", "id").values_list("pk", flat=True)
+        )
+
+    def test_walks_every_post_once_forward_and_back(self) -> None:
+        seen: list[int] = []
+        pages: list[str] = []
+        url: str | None = f"{self.url}?page_size=4"
+        while url:
+            pages.append(url)
+            response: Response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(post["id"] for post in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(seen, self._expected_order())
+        self.assertEqual(len(pages), 3)
+
+        # Following "previous" from the last page returns the middle page
+        last = self.client.get(pages[-1])
+        previous = self.client.get(last.data["previous"])
+        self.assertEqual(
+            [post["id"] for post in previous.data["results"]], self._expected_order()[4:8]
+        )
+
+    def test_invalid_cursor_is_404(self) -> None:
+        response: Response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(API_CACHE_TTL=60 * 60 * 24, SNAPSHOT_ASYNC_REBUILD=False)
+class SeoBlogPostTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.info = Info.objects.create(site_header="Jane Doe", bio="A long enough bio.")
+            self.post = Post.objects.create(
+                title="Crawled Post",
+                body="<h2>Intro</h2><p>Fish &amp; chips are <em>great</em>.</p>",
+                status="published",
+                publish_date=timezone.now() - timedelta(days=1),
+            )
+        self.url = reverse("seo-blog-post", kwargs={"slug": self.post.slug})
+
+    def test_description_uses_stripped_excerpt(self) -> None:
+        content = self.client.get(self.url).content.decode()
+        self.assertIn('name="description" content="Intro Fish &amp; chips are great', content)
+        self.assertIn('content="Jane Doe"', content)
+
+    def test_crawler_burst_is_served_from_cache(self) -> None:
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_post_and_info_changes_rerender(self) -> None:
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = "Renamed Post"
+            self.post.save()
+        self.assertIn("Renamed Post", self.client.get(self.url).content.decode())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.info.site_header = "J. Doe"
+            self.info.save()
+        self.assertIn('content="J. Doe"', self.client.get(self.url).content.decode())
+
+
+class PostQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self) -> None:
+        self.categories = [
+            Category.objects.create(name="Development"),
+            Category.objects.create(name="Life"),
+        ]
+
+    def _populate(self, size: int) -> None:
+        existing = Post.objects.count()
+        posts = Post.objects.bulk_create(
+            Post(
+                title=f"Post {index}",
+                slug=f"post-{index}",
+                body=f"<p>Body {index}</p>",
+                status="published",
+                publish_date=timezone.now() - timedelta(days=1),
+            )
+            for index in range(existing, size)
+        )
+        Through = Post.categories.through
+        Through.objects.bulk_create(
+            Through(post_id=post.pk, category_id=category.pk)
+            for post in posts
+            for category in self.categories
+        )
+
+    def test_post_list_runs_constant_queries(self) -> None:
+        # Validator aggregate + one page of posts + prefetched categories
+        self.assertConstantQueries(
+            reverse("post-list") + "?page_size=100",
+            3,
+            self._populate,
+            count_rows=lambda response: len(response.data["results"]),
+            page_size=100,
+        )
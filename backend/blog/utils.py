@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import html
+import re
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def html_to_text(value: str) -> str:
+    """
+    Converts CKEditor HTML into plain text: tags stripped, entities decoded and
+    whitespace collapsed. Tags are replaced with a space so adjacent block
+    elements don't run their words together.
+    """
+    if not value:
+        return ""
+    text = _TAG_RE.sub(" ", value)
+    text = html.unescape(text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+# Long enough for a card preview; SEO meta descriptions use the first 160 chars.
+EXCERPT_LENGTH = 300
+WORDS_PER_MINUTE = 200
+
+
+def make_excerpt(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """Truncates plain text to ``length`` characters on a word boundary."""
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0]
+    return f"{cut}…"
+
+
+def estimate_reading_time(text: str) -> int:
+    """Whole minutes to read ``text``, never less than one."""
+    words = len(text.split())
+    return max(1, -(-words // WORDS_PER_MINUTE))
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import html
-import re
 from typing import Any
+from urllib.parse import urljoin
 
 from django.db.models import Q, QuerySet
 from django.http import HttpRequest, HttpResponse, Http404
 from django.utils import timezone
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.conf import settings
 from rest_framework import viewsets
 from rest_framework.generics import get_object_or_404
@@ -20,8 +19,18 @@ from rest_framework.filters import SearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from django.core.signing import TimestampSigner, BadSignature, SignatureExpired
 
+from config.cache import versioned_cache_page
+from config.mixins import ConditionalGetMixin
+from config.pagination import KeysetCursorPagination
+
 from .models import Category, Post
-from .serializers import CategorySerializer, PostSerializer
+from .search import search_posts
+from .serializers import (
+    CategorySerializer,
+    PostListSerializer,
+    PostSearchResultSerializer,
+    PostSerializer,
+)
 from info.models import Info
 
 
@@ -31,7 +40,7 @@ class PostPreviewViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-ar
     Not cached.
     """
 
-    queryset = Post.objects.all()
+    queryset = Post.objects.prefetch_related("categories")
     serializer_class = PostSerializer
     permission_classes = [AllowAny]
 
@@ -66,47 +75,96 @@ class PostPreviewViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-ar
         return obj
 
 
-@method_decorator(cache_page(settings.CACHE_TTL), name="dispatch")
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
+class PostCursorPagination(KeysetCursorPagination):
+    # Mirrors Post.Meta.ordering with id appended as the unique tie-breaker
+    ordering = ("-order", "-publish_date", "id")
+    page_size = 50
+
+
+@method_decorator(versioned_cache_page(Category), name="dispatch")
+class CategoryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
     """
     Serves blog category definitions.
 
-    Wrapped with cache_page to intercept the Django dispatch cycle and serve responses
-    directly from Redis, drastically reducing DB load for public read-only traffic.
+    Wrapped with versioned_cache_page to intercept the Django dispatch cycle and serve
+    responses directly from Redis, drastically reducing DB load for public read-only
+    traffic. Saving a Category bumps its generation, so stale entries drop out at once.
     """
 
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_models = (Category,)
 
 
-@method_decorator(cache_page(settings.CACHE_TTL), name="dispatch")
-class PostViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
+@method_decorator(versioned_cache_page(Post, Category), name="dispatch")
+class PostViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
     """
     Serves blog posts and their metadata.
 
-    Wrapped with cache_page to serve serialized post data directly from memory.
+    Wrapped with versioned_cache_page to serve serialized post data directly from
+    memory until a Post or Category is saved (or a scheduled post goes live).
+    ConditionalGetMixin answers revalidation with a 304 before serialization.
     """
 
     queryset = Post.objects.all()
     serializer_class = PostSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = PostCursorPagination
+    last_modified_field = "last_modified"
+    cache_models = (Post, Category)
     filter_backends = [DjangoFilterBackend, SearchFilter]
     # django-filter requires actual model field names. The Post model stores
     # categories via a ManyToManyField named 'categories'. 'tags' is only a
     # SerializerMethodField alias computed at serialization time — it doesn't
     # exist in the database and cannot be used for ORM filtering.
     filterset_fields = {'categories__name': ['exact']}
-    search_fields = ['title', 'body', 'categories__name']
+    # search_text is the tag-stripped body, so ?search= never matches HTML markup.
+    # Ranked full-text search lives at /api/post/search/.
+    search_fields = ['title', 'search_text', 'categories__name']
+    search_result_limit = 20
+
+    def get_serializer_class(self) -> type:
+        if self.action == "list":
+            return PostListSerializer
+        return PostSerializer
 
     def get_queryset(self) -> QuerySet[Post]:
-        return Post.objects.filter(status="published", publish_date__lte=timezone.now()).distinct()
+        # PostSerializer reads categories twice per row (the "categories" PKs and the
+        # "tags" names); prefetching keeps a listing at a constant query count.
+        queryset: QuerySet[Post] = (
+            Post.objects.filter(status="published", publish_date__lte=timezone.now())
+            .prefetch_related("categories")
+            .distinct()
+        )
+        if self.action == "list":
+            # Listings use the precomputed excerpt, so never read the article columns
+            queryset = queryset.defer("body", "search_text", "search_vector")
+        return queryset
 
     @action(detail=False)
     def tags(self, request: HttpRequest) -> Response:
         tags_list = self.get_queryset().exclude(categories__isnull=True).values_list('categories__name', flat=True).distinct()
         return Response(sorted([t for t in tags_list if t]))
 
+    @action(detail=False, methods=["get"])
+    def search(self, request: HttpRequest) -> Response:
+        """
+        Ranked full-text search: /api/post/search/?q=<terms>[&limit=<n>].
+        Results are ordered by relevance and include a highlighted snippet.
+        """
+        query: str = self.request.query_params.get("q", "").strip()
+        try:
+            limit = min(int(self.request.query_params.get("limit", self.search_result_limit)), 50)
+        except ValueError:
+            limit = self.search_result_limit
+
+        results = search_posts(self.get_queryset(), query, max(limit, 1))
+        serializer = PostSearchResultSerializer(
+            results, many=True, context=self.get_serializer_context()
+        )
+        return Response(serializer.data)
+
     def get_object(self) -> Post:
         queryset: QuerySet[Post] = self.get_queryset()
         lookup_url_kwarg: str = self.lookup_url_kwarg or self.lookup_field
@@ -122,36 +180,23 @@ class PostViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
         return obj
 
 
-def seo_blog_post(request: HttpRequest, slug: str) -> HttpResponse:
-    try:
-        try:
-            lookup_int = int(slug)
-            post = Post.objects.get(Q(pk=lookup_int) | Q(slug=slug), status="published")
-        except ValueError:
-            post = Post.objects.get(slug=slug, status="published")
-
-        if post.publish_date and post.publish_date > timezone.now():
-            raise Http404()
-    except Post.DoesNotExist:
-        raise Http404()
-
-    # Image URL: GCS returns an absolute URL; build_absolute_uri is a no-op for absolute URLs
+def render_post_meta(post: Post, author_name: str, base_url: str) -> str:
+    """
+    Builds the OG/Twitter meta HTML for ``post``. Shared by the live view and
+    the prerender job (snapshots/seo.py), which have no request to hand, so
+    relative media URLs are resolved against ``base_url``.
+    """
+    # Image URL: GCS returns an absolute URL; urljoin is a no-op for absolute URLs
     image_url = ""
     if post.image:
-        image_url = request.build_absolute_uri(post.image.url)
+        image_url = urljoin(base_url, post.image.url)
 
     # Canonical URL — always resolves to the public frontend domain, never the API subdomain
     post_slug: str = post.slug or str(post.pk)
     canonical_url = f"{settings.SITE_URL}/blog/{post_slug}/"
 
-    # Strip HTML tags from CKEditor body (stored as HTML) to produce a plain-text excerpt
-    plain_body = re.sub(r"<[^>]+>", "", post.body)
-    plain_body = re.sub(r"\s+", " ", plain_body).strip()
-    description: str = plain_body[:160] if plain_body else post.title
-
-    # article:author — Post model has no author field; pull name from Info.site_header
-    info = Info.objects.first()
-    author_name: str = info.site_header if info else "Rajiv Wallace"
+    # Post.excerpt is the tag-stripped body, computed once at save time
+    description: str = post.excerpt[:160] if post.excerpt else post.title
 
     # Escape all dynamic content before embedding in HTML attributes
     safe_title = html.escape(post.title)
@@ -177,7 +222,7 @@ def seo_blog_post(request: HttpRequest, slug: str) -> HttpResponse:
         )
     optional_tags_html = "\n".join(optional_tags)
 
-    response_html = f"""<!DOCTYPE html>
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -212,4 +257,35 @@ def seo_blog_post(request: HttpRequest, slug: str) -> HttpResponse:
     <p>{safe_description}</p>
 </body>
 </html>"""
-    return HttpResponse(response_html)
+
+
+@versioned_cache_page(Post, Category, Info)
+def seo_blog_post(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    Pre-rendered OG/Twitter meta HTML for crawlers (nginx routes $is_bot here).
+
+    The rendered page is cached per URL under the Post/Category/Info generations,
+    so a crawler burst is served from Redis and any admin save re-renders it.
+    nginx tries the prerendered copy on disk first, so this only runs on a miss.
+    """
+    # The description comes from the precomputed excerpt, so body is never loaded
+    posts = Post.objects.defer("body", "search_text", "search_vector")
+    try:
+        try:
+            lookup_int = int(slug)
+            post = posts.get(Q(pk=lookup_int) | Q(slug=slug), status="published")
+        except ValueError:
+            post = posts.get(slug=slug, status="published")
+
+        if post.publish_date and post.publish_date > timezone.now():
+            raise Http404()
+    except Post.DoesNotExist:
+        raise Http404()
+
+    # article:author — Post model has no author field; pull name from Info.site_header
+    info = Info.objects.first()
+    author_name: str = info.site_header if info else "Rajiv Wallace"
+
+    return HttpResponse(
+        render_post_meta(post, author_name, request.build_absolute_uri("/"))
+    )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# IN-PROCESS BACKGROUND JOBS
+# ============================================================================
+# Work that must not hold a gunicorn request thread (snapshot rebuilds, webhook
+# delivery) runs on small per-process executors. Each queue has a single worker,
+# which keeps its jobs ordered: an older snapshot build can never overwrite a
+# newer one written by the same process. Separate queues keep a slow webhook
+# from delaying a rebuild.
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+# One flag per job name; set while that job is queued but not yet started
+_pending: dict[str, threading.Event] = {}
+
+
+def _run_job(name: str, job: Callable[[], Any]) -> None:
+    _pending[name].clear()
+    try:
+        job()
+    except Exception as e:
+        logger.error(f"Background job {name!r} failed: {str(e)}", exc_info=True)
+    finally:
+        close_old_connections()
+
+
+def schedule_job(
+    name: str,
+    job: Callable[[], Any],
+    *,
+    queue: str = "default",
+    inline: bool = False,
+) -> None:
+    """
+    Queues ``job`` on the worker thread for ``queue``. Requests for a job that
+    is already queued collapse into the pending run, since it will read the
+    newest rows when it starts. ``inline`` runs it synchronously (tests, or
+    settings that disable background work).
+    """
+    if inline:
+        job()
+        return
+
+    with _lock:
+        pending = _pending.setdefault(name, threading.Event())
+        if pending.is_set():
+            return
+        pending.set()
+        executor = _executors.get(queue)
+        if executor is None:
+            executor = _executors[queue] = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"bg-{queue}"
+            )
+    executor.submit(_run_job, name, job)
+
+
+def schedule_job_after(
+    delay: float, name: str, job: Callable[[], Any], *, queue: str = "default"
+) -> threading.Timer:
+    """
+    Queues ``job`` once ``delay`` seconds have passed. The timer thread is a
+    daemon, so pending timers don't hold up a worker restart; callers must keep
+    enough state (e.g. in the database) to pick the work up again afterwards.
+    """
+    timer = threading.Timer(delay, schedule_job, args=(name, job), kwargs={"queue": queue})
+    timer.daemon = True
+    timer.start()
+    return timer
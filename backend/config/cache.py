@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_response_headers
+from django.views.decorators.cache import cache_page
+
+from .instrumentation import record_cache
+
+# ============================================================================
+# GENERATION COUNTERS
+# ============================================================================
+# Every model that feeds a cached API response owns a generation counter in the
+# cache. The counter is folded into the cache_page key prefix, so bumping it on
+# save/delete makes every response built from the old data unreachable at once,
+# without having to know (or scan for) the individual cache keys.
+
+GENERATION_KEY = "cache-gen:{label}"
+EXPIRY_KEY = "cache-gen:{label}:expires"
+# Stored when nothing is scheduled, so a missing key always means "unknown"
+NO_EXPIRY = float("inf")
+
+# Callables returning the next moment a model's public data changes on its own
+# (e.g. a scheduled blog post going live), keyed by model label.
+_expiry_resolvers: dict[str, Callable[[], Optional[datetime]]] = {}
+
+# Callables notified with the model label after every generation bump, for
+# derived data (like the homepage snapshot) that is rebuilt rather than keyed.
+_bump_listeners: list[Callable[[str], None]] = []
+
+
+def _label(model: type[models.Model] | str) -> str:
+    if isinstance(model, str):
+        return model
+    return model._meta.label_lower
+
+
+def _seed() -> int:
+    # Seeding from the clock instead of 0 means a counter evicted from Redis
+    # comes back with a value no previously cached response was built under.
+    return time.time_ns() // 1_000_000
+
+
+def get_generations(labels: Iterable[str]) -> dict[str, int]:
+    """
+    Returns the current generation of each label using a single cache round-trip
+    in the common case. Missing counters are seeded, and counters whose scheduled
+    expiry has passed are bumped before being returned.
+    """
+    labels = list(labels)
+    gen_keys = {GENERATION_KEY.format(label=label): label for label in labels}
+    expiry_keys = {
+        EXPIRY_KEY.format(label=label): label
+        for label in labels
+        if label in _expiry_resolvers
+    }
+    found: dict[str, Any] = cache.get_many([*gen_keys, *expiry_keys])
+
+    now = timezone.now().timestamp()
+    for key, label in expiry_keys.items():
+        expires_at = found.get(key)
+        if expires_at is None:
+            # Counter seeded after a deploy, eviction or flush: no bump has
+            # recorded the next scheduled change yet, so resolve it now
+            expires_at = _store_expiry(label)
+        if expires_at <= now:
+            bump_generation(label)
+            found.pop(GENERATION_KEY.format(label=label), None)
+
+    generations: dict[str, int] = {}
+    for key, label in gen_keys.items():
+        generation = found.get(key)
+        if generation is None:
+            cache.add(key, _seed(), timeout=None)
+            generation = cache.get(key, 0)
+        generations[label] = generation
+    return generations
+
+
+def generation_key_prefix(*models_: type[models.Model] | str) -> str:
+    generations = get_generations(_label(model) for model in models_)
+    return "api:" + ":".join(
+        f"{label}.{generation}" for label, generation in sorted(generations.items())
+    )
+
+
+def bump_generation(model: type[models.Model] | str) -> None:
+    """
+    Invalidates every cached response that depends on ``model``.
+    """
+    label = _label(model)
+    key = GENERATION_KEY.format(label=label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _seed(), timeout=None)
+
+    if label in _expiry_resolvers:
+        _store_expiry(label)
+
+    for listener in _bump_listeners:
+        listener(label)
+
+
+def bump_after_bulk(model: type[models.Model] | str) -> None:
+    """
+    Invalidates ``model`` after a write that sends no post_save/post_delete:
+    QuerySet.update(), bulk_create() and bulk_update() bypass the signals
+    connect_cache_invalidation() listens to. Deferred until the transaction
+    commits, like those signals.
+    """
+    label = _label(model)
+    transaction.on_commit(lambda: bump_generation(label))
+
+
+def _store_expiry(label: str) -> float:
+    """
+    Caches when ``label``'s generation next needs a bump (NO_EXPIRY if never)
+    and returns it as a timestamp.
+    """
+    next_change = _expiry_resolvers[label]()
+    expires_at = NO_EXPIRY if next_change is None else next_change.timestamp()
+    cache.set(EXPIRY_KEY.format(label=label), expires_at, timeout=None)
+    return expires_at
+
+
+def register_generation_expiry(
+    model: type[models.Model], resolver: Callable[[], Optional[datetime]]
+) -> None:
+    """
+    Registers a callable returning when ``model``'s generation should next be
+    bumped without a save, for data that becomes visible on a schedule.
+    """
+    _expiry_resolvers[_label(model)] = resolver
+
+
+def add_bump_listener(listener: Callable[[str], None]) -> None:
+    """
+    Registers ``listener`` to be called with the model label after each bump.
+    """
+    if listener not in _bump_listeners:
+        _bump_listeners.append(listener)
+
+
+# ============================================================================
+# SIGNAL WIRING
+# ============================================================================
+
+
+def connect_cache_invalidation(*models_: type[models.Model]) -> None:
+    """
+    Bumps the generation of each model on save, delete and m2m changes. Called
+    from the owning app's AppConfig.ready().
+
+    Bumps are deferred until the transaction commits so a concurrent request
+    cannot re-cache the old rows under the new generation.
+    """
+    for model in models_:
+        label = _label(model)
+
+        def _invalidate(sender: Any, label: str = label, **kwargs: Any) -> None:
+            transaction.on_commit(lambda: bump_generation(label))
+
+        dispatch_uid = f"cache-invalidation:{label}"
+        post_save.connect(_invalidate, sender=model, weak=False, dispatch_uid=dispatch_uid)
+        post_delete.connect(_invalidate, sender=model, weak=False, dispatch_uid=dispatch_uid)
+        for field in model._meta.many_to_many:
+            m2m_changed.connect(
+                _invalidate,
+                sender=field.remote_field.through,  # type: ignore[attr-defined]
+                weak=False,
+                dispatch_uid=f"{dispatch_uid}:{field.name}",
+            )
+
+
+# ============================================================================
+# VIEW DECORATOR
+# ============================================================================
+
+
+def versioned_cache_page(
+    *models_: type[models.Model],
+) -> Callable[[Callable[..., HttpResponse]], Callable[..., HttpResponse]]:
+    """
+    Drop-in replacement for cache_page whose key prefix carries the generations of
+    ``models_``. Entries live for API_CACHE_TTL on the server, but browsers are
+    only told API_BROWSER_TTL since they never see generation bumps.
+    """
+
+    def decorator(view_func: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        @wraps(view_func)
+        def _wrapped_view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            timeout: int = settings.API_CACHE_TTL
+            if not timeout:
+                return view_func(request, *args, **kwargs)
+
+            ran_view = False
+
+            def _view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+                nonlocal ran_view
+                ran_view = True
+                return view_func(request, *args, **kwargs)
+
+            key_prefix = generation_key_prefix(*models_)
+            response: HttpResponse = cache_page(timeout, key_prefix=key_prefix)(_view)(
+                request, *args, **kwargs
+            )
+            if request.method in ("GET", "HEAD"):
+                # Only these are looked up; anything else always runs the view
+                record_cache(hit=not ran_view)
+
+            if response.has_header("Cache-Control") and not response.streaming:
+                del response["Expires"]
+                patch_response_headers(response, settings.API_BROWSER_TTL)
+            return response
+
+        return _wrapped_view
+
+    return decorator
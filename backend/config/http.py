@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from prometheus_client import Counter, Gauge, Histogram
+from requests.adapters import HTTPAdapter
+
+# ============================================================================
+# OUTBOUND HTTP CLIENT
+# ============================================================================
+# Every outbound call (Discord webhooks today) goes through one keep-alive
+# session per process, so the TCP/TLS handshake is paid once per worker rather
+# than once per request. A per-host circuit breaker stops us waiting out the
+# full timeout on every call while a host is down, and latency/outcome metrics
+# are exported on the existing django_prometheus /metrics endpoint.
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+# Connections kept alive per host; gunicorn runs 2 threads per worker
+POOL_MAXSIZE = 4
+
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 60  # seconds the circuit stays open before a trial call
+
+OUTBOUND_LATENCY = Histogram(
+    "outbound_http_request_duration_seconds",
+    "Latency of outbound HTTP requests",
+    ["host", "method"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+OUTBOUND_REQUESTS = Counter(
+    "outbound_http_requests_total",
+    "Outbound HTTP requests by outcome (status class, error or circuit_open)",
+    ["host", "method", "outcome"],
+)
+CIRCUIT_STATE = Gauge(
+    "outbound_http_circuit_state",
+    "Circuit breaker state per host (0 closed, 1 half-open, 2 open)",
+    ["host"],
+)
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Raised instead of calling a host whose circuit is open. Subclasses
+    ConnectionError so callers that already handle RequestException treat it
+    as one more transient failure.
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(f"Circuit open for {host}; retry in {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Classic three-state breaker. After ``failure_threshold`` consecutive
+    failures the circuit opens and calls fail fast; once ``reset_timeout`` has
+    passed a single trial call is let through (half-open), which closes the
+    circuit on success or re-opens it on failure.
+    """
+
+    CLOSED, HALF_OPEN, OPEN = 0, 1, 2
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def _set_state(self, state: int) -> None:
+        self.state = state
+        CIRCUIT_STATE.labels(host=self.host).set(state)
+
+    def before_request(self) -> None:
+        """
+        Raises CircuitOpenError if the call should not be made.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            now = time.monotonic()
+            remaining = self.opened_at + self.reset_timeout - now
+            if remaining <= 0:
+                # Let exactly one trial call through. A trial that never
+                # reported back is given up on after another reset_timeout.
+                self.opened_at = now
+                self._set_state(self.HALF_OPEN)
+                return
+            raise CircuitOpenError(self.host, max(remaining, 0))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            if self.state != self.CLOSED:
+                self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._set_state(self.OPEN)
+
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_breakers: dict[str, CircuitBreaker] = {}
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns this process's pooled session. Rebuilt after a fork so gunicorn
+    workers never share sockets inherited from the master.
+    """
+    global _session, _session_pid
+
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            session = requests.Session()
+            # Retries are the caller's job (see contacts/outbox.py), not urllib3's
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session, _session_pid = session, os.getpid()
+        return _session
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    with _lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host)
+        return breaker
+
+
+def reset_breakers() -> None:
+    with _lock:
+        _breakers.clear()
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Sends a request through the pooled session, guarded by the host's circuit
+    breaker. 5xx and 429 responses count as failures for the breaker but are
+    still returned, so callers keep their own status handling.
+    """
+    host = urlsplit(url).hostname or ""
+    breaker = get_breaker(host)
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+
+    try:
+        breaker.before_request()
+    except CircuitOpenError:
+        OUTBOUND_REQUESTS.labels(host=host, method=method, outcome="circuit_open").inc()
+        raise
+
+    start = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except Exception:
+        # Anything else (urllib3/ssl errors that escape requests, bad kwargs)
+        # must still settle a half-open trial, or the breaker stays stuck
+        breaker.record_failure()
+        OUTBOUND_REQUESTS.labels(host=host, method=method, outcome="error").inc()
+        raise
+    finally:
+        OUTBOUND_LATENCY.labels(host=host, method=method).observe(
+            time.perf_counter() - start
+        )
+
+    if response.status_code >= 500 or response.status_code == 429:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    OUTBOUND_REQUESTS.labels(
+        host=host, method=method, outcome=f"{response.status_code // 100}xx"
+    ).inc()
+    return response
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return request("POST", url, **kwargs)
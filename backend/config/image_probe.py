@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+import struct
+from typing import Any, Optional
+
+from django.core.files.images import get_image_dimensions
+from django.db import models
+from django.db.models.fields.files import ImageFieldFile
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# HEADER-ONLY DIMENSION PROBING
+# ============================================================================
+# Django's ImageFieldFile.width/height open the stored object and feed it to
+# Pillow. On GoogleCloudStorage, opening a file downloads the whole object, so
+# learning a 3840px WebP's size costs megabytes. Every format we store keeps
+# its size in the first few bytes (JPEG: in the SOF segment, after any
+# EXIF/ICC segments), so probe_dimensions fetches a small ranged read, parses
+# the header itself and only falls back to the full read when it cannot.
+
+# First read; covers WebP, PNG, GIF and most JPEGs
+HEAD_BYTES = 4 * 1024
+# Second read for JPEGs whose EXIF/ICC segments push the SOF marker further
+JPEG_HEAD_BYTES = 64 * 1024
+
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT, JPG and DAC)
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _webp_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8X":
+        # 24-bit canvas width/height minus one
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    if chunk == b"VP8L" and data[20] == 0x2F:
+        # 14-bit width/height minus one, packed after the signature byte
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    return None
+
+
+def _jpeg_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before the marker
+            offset += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Standalone markers carry no length
+            offset += 2
+            continue
+        if marker in _JPEG_SOF:
+            if offset + 9 > len(data):
+                return None
+            height, width = struct.unpack(">HH", data[offset + 5 : offset + 9])
+            return width, height
+        (length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        offset += 2 + length
+    return None
+
+
+def parse_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """
+    (width, height) from the leading bytes of a WebP, PNG, GIF or JPEG file,
+    or None if the format is unknown or ``data`` stops before the size.
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return _webp_dimensions(data)
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        if len(data) < 24 or data[12:16] != b"IHDR":
+            return None
+        width, height = struct.unpack(">II", data[16:24])
+        return width, height
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        if len(data) < 10:
+            return None
+        width, height = struct.unpack("<HH", data[6:10])
+        return width, height
+    if data[:2] == b"\xff\xd8":
+        return _jpeg_dimensions(data)
+    return None
+
+
+def read_head(storage: Any, name: str, size: int) -> bytes:
+    """
+    The first ``size`` bytes of ``name``, as a ranged read where the storage
+    supports one (see WebPOptimizedStorage.read_head).
+    """
+    if hasattr(storage, "read_head"):
+        return storage.read_head(name, size)  # type: ignore[no-any-return]
+    with storage.open(name, "rb") as f:
+        return f.read(size)  # type: ignore[no-any-return]
+
+
+def probe_dimensions(storage: Any, name: str) -> tuple[Optional[int], Optional[int]]:
+    """
+    (width, height) of a stored image from a ranged read of its header,
+    falling back to Django's full read for anything the parser cannot place.
+    Same contract as get_image_dimensions: (None, None) if unreadable.
+    """
+    head = read_head(storage, name, HEAD_BYTES)
+    dimensions = parse_dimensions(head)
+    if dimensions is None and head[:2] == b"\xff\xd8" and len(head) == HEAD_BYTES:
+        head = read_head(storage, name, JPEG_HEAD_BYTES)
+        dimensions = parse_dimensions(head)
+    if dimensions is not None:
+        return dimensions
+
+    logger.debug(f"Header probe failed for {name}, reading the whole file")
+    with storage.open(name, "rb") as f:
+        return get_image_dimensions(f, close=False)  # type: ignore[no-any-return]
+
+
+class ProbedImageFieldFile(ImageFieldFile):
+    def _get_image_dimensions(self) -> Any:
+        # Only stored files are probed; an upload still in memory (or a file
+        # the caller already opened) is cheaper to read directly
+        if not hasattr(self, "_dimensions_cache") and self._committed and self.closed:
+            self._dimensions_cache = probe_dimensions(self.storage, self.name)
+        return super()._get_image_dimensions()
+
+    def _set_instance_attribute(self, name: str, content: Any) -> None:
+        # Django measures the upload here, but storage may have re-encoded or
+        # downscaled it (config/storage.py). Store the name and measure the
+        # object that was actually saved instead.
+        self.instance.__dict__[self.field.attname] = self.name
+        self.field.update_dimension_fields(self.instance, force=True)
+
+
+class ProbedImageField(models.ImageField):
+    """
+    ImageField whose width_field/height_field refreshes read only the
+    stored file's header.
+    """
+
+    attr_class = ProbedImageFieldFile
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import base64
+import io
+import logging
+import posixpath
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile, File
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.fields.files import FieldFile
+from django.db.models.signals import post_delete, post_save, pre_save
+from rest_framework import serializers
+
+from .background import schedule_job
+from .cache import bump_after_bulk
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# RESPONSIVE IMAGE VARIANTS
+# ============================================================================
+# Uploads are stored as a single WebP by WebPOptimizedStorage. After the save
+# commits, a background job ("images" queue) decodes that file once and writes
+# a downscaled copy per width in IMAGE_VARIANT_WIDTHS and per format in
+# IMAGE_VARIANT_FORMATS next to it:
+#
+#     project_thumbnails/variants/<stem>-640w.avif
+#
+# The resulting manifest lives in the model's image_variants JSON column and
+# is exposed by ImageSrcsetField as ready-made srcset strings, so the frontend
+# can let the browser pick the smallest file that fills the slot. The same
+# decode also yields image_placeholder, a tiny inline WebP painted until the
+# real image arrives.
+
+VARIANT_DIR = "variants"
+# Low-quality image placeholders: longest side in pixels, WebP quality, and
+# the image_placeholder column size
+PLACEHOLDER_SIZE = 24
+PLACEHOLDER_QUALITY = 40
+PLACEHOLDER_MAX_LENGTH = 512
+# Per-format encoder options; AVIF "speed" trades size for CPU on the Pi
+ENCODE_OPTIONS: dict[str, dict[str, Any]] = {
+    "avif": {"format": "AVIF", "quality": 60, "speed": 8},
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+}
+
+
+def variant_formats() -> list[str]:
+    """
+    Formats to generate, skipping any this Pillow build cannot encode.
+    """
+    from PIL import features
+
+    return [
+        fmt
+        for fmt in getattr(settings, "IMAGE_VARIANT_FORMATS", ("avif", "webp"))
+        if fmt in ENCODE_OPTIONS and features.check(fmt)
+    ]
+
+
+def variant_widths(source_width: int) -> list[int]:
+    """
+    Configured widths narrower than the source, plus one capped at the
+    largest configured width so big screens still get a full-size file.
+    Never upscales.
+    """
+    configured = sorted(getattr(settings, "IMAGE_VARIANT_WIDTHS", (320, 640, 1280, 1920)))
+    widths = {width for width in configured if width < source_width}
+    widths.add(min(source_width, configured[-1]))
+    return sorted(widths)
+
+
+def _variant_name(source_name: str, width: int, fmt: str) -> str:
+    directory, filename = posixpath.split(source_name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, VARIANT_DIR, f"{stem}-{width}w.{fmt}")
+
+
+def decode_source(field_file: File) -> Any:
+    """
+    Opens and fully decodes ``field_file`` (a FieldFile or any storage file)
+    as RGB or RGBA.
+    """
+    from PIL import Image
+
+    with field_file.open("rb"), Image.open(field_file) as img:
+        has_alpha = img.mode in ("RGBA", "LA") or (
+            img.mode == "P" and "transparency" in img.info
+        )
+        return img.convert("RGBA" if has_alpha else "RGB")
+
+
+def build_placeholder(source: Any) -> str:
+    """
+    A ~100-byte blurred WebP of ``source`` as a data URI, for the frontend to
+    paint while the real image loads. Empty if it would not fit the column.
+    """
+    thumbnail = source.copy()
+    thumbnail.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    output = io.BytesIO()
+    thumbnail.save(output, format="WEBP", quality=PLACEHOLDER_QUALITY)
+    uri = "data:image/webp;base64," + base64.b64encode(output.getvalue()).decode()
+    return uri if len(uri) <= PLACEHOLDER_MAX_LENGTH else ""
+
+
+def build_variants(field_file: FieldFile, source: Any = None) -> dict[str, Any]:
+    """
+    Writes every variant of ``field_file`` to its storage and returns the
+    manifest to store on the model. The source is decoded once (or passed in
+    already decoded); each width is resized from it and encoded in every
+    format.
+    """
+    from PIL import Image
+
+    storage = field_file.storage
+    formats = variant_formats()
+    variants: dict[str, list[list[Any]]] = {fmt: [] for fmt in formats}
+
+    if source is None:
+        source = decode_source(field_file)
+    source_width, source_height = source.size
+
+    for width in variant_widths(source_width):
+        height = max(1, round(source_height * width / source_width))
+        resized = (
+            source
+            if width == source_width
+            # reducing_gap lets Pillow shrink by an integer factor first, which
+            # is much cheaper than a full Lanczos pass over the source
+            else source.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        )
+        for fmt in formats:
+            output = io.BytesIO()
+            resized.save(output, **ENCODE_OPTIONS[fmt])
+            name = storage.save(
+                _variant_name(field_file.name, width, fmt), ContentFile(output.getvalue())
+            )
+            variants[fmt].append([width, name])
+
+    return {
+        "source": field_file.name,
+        "width": source_width,
+        "height": source_height,
+        "variants": variants,
+    }
+
+
+def _variant_names(manifest: Optional[dict[str, Any]]) -> set[str]:
+    if not manifest:
+        return set()
+    return {
+        name for entries in manifest.get("variants", {}).values() for _, name in entries
+    }
+
+
+def delete_variants(
+    storage: Any, names: set[str], source: Optional[str] = None, owner: Any = None
+) -> None:
+    """
+    Deletes the variant files ``names`` built from ``source``. A deduplicated
+    upload (media/references.py) backs several rows, and variant names come
+    from the source name, so their manifests list the same files; nothing is
+    deleted while a row other than ``owner`` (a (model, pk) pair) still uses
+    ``source``.
+    """
+    from media import references
+
+    if names and source:
+        users = [(model, pk) for model, pk, _ in references.references_to(source)]
+        if any(user != owner for user in users):
+            logger.info(f"Keeping image variants of {source}: source still referenced")
+            return
+    for name in names:
+        try:
+            storage.delete(name)
+        except Exception as e:
+            logger.warning(f"Could not delete image variant {name}: {str(e)}")
+
+
+def refresh_variants(
+    model: type[models.Model], pk: Any, field_name: str, force: bool = False
+) -> bool:
+    """
+    Brings ``image_variants`` and ``image_placeholder`` on one row up to
+    date with its image, replacing the files of the previous manifest.
+    Returns True if the row changed.
+    """
+    instance = model._default_manager.filter(pk=pk).first()
+    if instance is None:
+        return False
+
+    field_file: FieldFile = getattr(instance, field_name)
+    old_manifest: dict[str, Any] = instance.image_variants or {}  # type: ignore[attr-defined]
+    if not force and old_manifest.get("source") == (field_file.name or None):
+        return False
+
+    if field_file:
+        source = decode_source(field_file)
+        manifest = build_variants(field_file, source)
+        placeholder = build_placeholder(source)
+    else:
+        manifest, placeholder = {}, ""
+
+    # Only store the manifest if the image is still the one we just encoded;
+    # a newer upload will have queued its own job
+    if field_file:
+        still_current = Q(**{field_name: field_file.name})
+    else:
+        still_current = Q(**{f"{field_name}__isnull": True}) | Q(**{field_name: ""})
+    updated = (
+        model._default_manager.filter(still_current, pk=pk)
+        .update(image_variants=manifest, image_placeholder=placeholder)
+    )
+    if not updated:
+        delete_variants(
+            field_file.storage, _variant_names(manifest), field_file.name, (model, pk)
+        )
+        return False
+
+    delete_variants(
+        field_file.storage,
+        _variant_names(old_manifest) - _variant_names(manifest),
+        old_manifest.get("source"),
+        (model, pk),
+    )
+    bump_after_bulk(model)
+    logger.info(f"Image variants refreshed for {model._meta.label} {pk}: {field_file.name}")
+    return True
+
+
+def schedule_variants(model: type[models.Model], pk: Any, field_name: str) -> None:
+    schedule_job(
+        f"image-variants:{model._meta.label_lower}:{pk}",
+        lambda: refresh_variants(model, pk, field_name),
+        queue="images",
+        inline=not getattr(settings, "IMAGE_VARIANTS_ASYNC", True),
+    )
+
+
+# ============================================================================
+# SIGNAL WIRING
+# ============================================================================
+
+
+def connect_image_variants(model: type[models.Model], field_name: str) -> None:
+    """
+    Regenerates variants after a save that changed ``field_name`` and removes
+    them when the row is deleted. Called from the owning app's
+    AppConfig.ready(); the model needs ``image_variants`` and
+    ``image_placeholder`` fields.
+    """
+    dispatch_uid = f"image-variants:{model._meta.label_lower}"
+
+    def _saving(
+        sender: Any, instance: Any, raw: bool = False, update_fields: Any = None, **kwargs: Any
+    ) -> None:
+        # FileField stores an upload in its own pre_save(), after the
+        # earlier-declared width/height columns have been read for the
+        # INSERT/UPDATE, and storage may downscale it (config/storage.py).
+        # Store it first; ProbedImageFieldFile then measures the saved file.
+        if raw or (update_fields is not None and field_name not in update_fields):
+            return
+        file = getattr(instance, field_name)
+        if file and not file._committed:
+            file.save(file.name, file.file, save=False)
+
+    def _saved(
+        sender: Any, instance: Any, raw: bool = False, update_fields: Any = None, **kwargs: Any
+    ) -> None:
+        if raw or (update_fields is not None and field_name not in update_fields):
+            return
+        current = getattr(instance, field_name).name or None
+        if (instance.image_variants or {}).get("source") != current:
+            pk = instance.pk
+            transaction.on_commit(lambda: schedule_variants(model, pk, field_name))
+
+    def _deleted(sender: Any, instance: Any, **kwargs: Any) -> None:
+        names = _variant_names(instance.image_variants)
+        if names:
+            storage = getattr(instance, field_name).storage
+            source = instance.image_variants.get("source")
+            transaction.on_commit(lambda: delete_variants(storage, names, source))
+
+    pre_save.connect(_saving, sender=model, weak=False, dispatch_uid=dispatch_uid)
+    post_save.connect(_saved, sender=model, weak=False, dispatch_uid=dispatch_uid)
+    post_delete.connect(_deleted, sender=model, weak=False, dispatch_uid=dispatch_uid)
+
+
+# ============================================================================
+# SERIALIZER FIELD
+# ============================================================================
+
+
+class ImageSrcsetField(serializers.Field):  # type: ignore[type-arg]
+    """
+    Read-only ``{"avif": "<url> 320w, ...", "webp": "..."}`` for the image in
+    ``image_field``, or None until its variants have been generated.
+    """
+
+    def __init__(self, image_field: str, **kwargs: Any) -> None:
+        self.image_field = image_field
+        kwargs["read_only"] = True
+        kwargs["source"] = "*"
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance: Any) -> Optional[dict[str, str]]:
+        field_file: FieldFile = getattr(instance, self.image_field)
+        manifest: dict[str, Any] = instance.image_variants or {}
+        # A manifest for a replaced image is stale until its job has run
+        if not field_file or manifest.get("source") != field_file.name:
+            return None
+
+        request = self.context.get("request")
+        srcset: dict[str, str] = {}
+        for fmt, entries in manifest.get("variants", {}).items():
+            candidates = []
+            for width, name in entries:
+                url = field_file.storage.url(name)
+                if request:
+                    url = request.build_absolute_uri(url)
+                candidates.append(f"{url} {width}w")
+            if candidates:
+                srcset[fmt] = ", ".join(candidates)
+        return srcset or None
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import Counter, Histogram
+
+# ============================================================================
+# PER-VIEW REQUEST INSTRUMENTATION
+# ============================================================================
+# django_prometheus tells us how many requests a view serves and how long they
+# take, not why. RequestInstrumentationMiddleware records, per view name, the
+# SQL issued (through a DB execute wrapper), whether versioned_cache_page
+# answered from the cache, the time spent serializing and rendering, and the
+# response size. Everything is exported on the existing /metrics endpoint;
+# staff users also get it back as a Server-Timing header, which the browser
+# devtools show next to each request.
+
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Label for requests that never resolved to a view (404s, CommonMiddleware redirects)
+UNRESOLVED = "<unresolved>"
+
+VIEW_DB_QUERIES = Histogram(
+    "http_view_db_queries",
+    "SQL queries executed per request",
+    ["view"],
+    buckets=QUERY_BUCKETS,
+)
+VIEW_DB_DURATION = Histogram(
+    "http_view_db_duration_seconds",
+    "Time spent in SQL per request",
+    ["view"],
+    buckets=SECONDS_BUCKETS,
+)
+VIEW_SERIALIZE_DURATION = Histogram(
+    "http_view_serialize_duration_seconds",
+    "Time spent in the view and DRF renderer outside SQL, when the view ran",
+    ["view"],
+    buckets=SECONDS_BUCKETS,
+)
+VIEW_RESPONSE_BYTES = Histogram(
+    "http_view_response_bytes",
+    "Size of the response body",
+    ["view"],
+    buckets=BYTES_BUCKETS,
+)
+VIEW_CACHE = Counter(
+    "http_view_cache_total",
+    "versioned_cache_page lookups by result (hit or miss)",
+    ["view", "result"],
+)
+
+
+class RequestStats:
+    """
+    What one request has spent so far. Filled in by the execute wrapper,
+    versioned_cache_page and the middleware hooks below.
+    """
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache: Optional[str] = None
+        self.serialize_seconds: Optional[float] = None
+        # (perf_counter, db_seconds) when the view or renderer was entered
+        self._mark: Optional[tuple[float, float]] = None
+
+    def start_stage(self) -> None:
+        self._mark = (time.perf_counter(), self.db_seconds)
+
+    def discard_stage(self) -> None:
+        self._mark = None
+
+    def end_stage(self) -> None:
+        if self._mark is None:
+            return
+        started, db_seconds = self._mark
+        # SQL issued by the view (lazy querysets, N+1s) is already counted as db
+        elapsed = time.perf_counter() - started - (self.db_seconds - db_seconds)
+        self.serialize_seconds = (self.serialize_seconds or 0.0) + max(elapsed, 0.0)
+        self._mark = None
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def record_cache(hit: bool) -> None:
+    """
+    Called by versioned_cache_page after each cache lookup.
+    """
+    stats = _current.get()
+    if stats is not None:
+        stats.cache = "hit" if hit else "miss"
+
+
+def _execute_wrapper(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool, context: dict[str, Any]
+) -> Any:
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - start
+
+
+def _view_name(request: HttpRequest) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return UNRESOLVED
+    return match.view_name  # type: ignore[no-any-return]
+
+
+def _response_bytes(response: HttpResponse) -> Optional[int]:
+    if response.streaming:
+        length = response.get("Content-Length")
+        return int(length) if length and length.isdigit() else None
+    return len(response.content)
+
+
+def server_timing(stats: RequestStats, total_seconds: float) -> str:
+    """
+    Server-Timing header value, e.g.
+    ``db;dur=4.2;desc="3 queries", cache;desc=hit, total;dur=9.8``.
+    """
+    metrics = [f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"']
+    if stats.cache is not None:
+        metrics.append(f"cache;desc={stats.cache}")
+    if stats.serialize_seconds is not None:
+        metrics.append(f"serialize;dur={stats.serialize_seconds * 1000:.1f}")
+    metrics.append(f"total;dur={total_seconds * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Records per-view SQL, cache, serialization and size metrics, and adds a
+    Server-Timing header for staff users. Place it right after
+    PrometheusBeforeMiddleware so the timings cover the rest of the stack.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_execute_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_seconds = time.perf_counter() - start
+
+        view = _view_name(request)
+        VIEW_DB_QUERIES.labels(view=view).observe(stats.queries)
+        VIEW_DB_DURATION.labels(view=view).observe(stats.db_seconds)
+        if stats.cache is not None:
+            VIEW_CACHE.labels(view=view, result=stats.cache).inc()
+        if stats.serialize_seconds is not None:
+            VIEW_SERIALIZE_DURATION.labels(view=view).observe(stats.serialize_seconds)
+        size = _response_bytes(response)
+        if size is not None:
+            VIEW_RESPONSE_BYTES.labels(view=view).observe(size)
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_staff:
+            response["Server-Timing"] = server_timing(stats, total_seconds)
+        return response
+
+    def process_view(
+        self, request: HttpRequest, view_func: Any, view_args: Any, view_kwargs: Any
+    ) -> None:
+        stats = _current.get()
+        if stats is not None:
+            stats.start_stage()
+
+    def process_template_response(self, request: HttpRequest, response: Any) -> Any:
+        # The view's time ends here and rendering happens next. A cache hit
+        # replays an already rendered copy, which did no serializing at all.
+        stats = _current.get()
+        if stats is not None:
+            if response.is_rendered:
+                stats.discard_stage()
+                return response
+            stats.end_stage()
+            stats.start_stage()
+            response.add_post_render_callback(lambda rendered: stats.end_stage())
+        return response
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from django.db import models
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from config.cache import generation_key_prefix
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag / Last-Modified validators to list and retrieve, and answers
+    If-None-Match / If-Modified-Since with a 304 before anything is serialized.
+
+    List validators come from a single COUNT/MAX aggregate over the filtered
+    queryset. The cache generations of ``cache_models`` are folded into the ETag
+    so edits that don't touch a timestamp (tag renames, models without one) still
+    change it. Lists send no Last-Modified: the newest timestamp stays put when
+    a row is deleted, a related model is renamed or a scheduled post goes live,
+    so If-Modified-Since alone would get a stale 304.
+    """
+
+    # Name of an auto_now timestamp on the model, if it has one
+    last_modified_field: Optional[str] = None
+    # Models whose saves should change the ETag (see config/cache.py)
+    cache_models: tuple[type[models.Model], ...] = ()
+
+    def _build_etag(self, request: Request, *parts: Any) -> str:
+        accepted = getattr(request, "accepted_renderer", None)
+        fingerprint = "|".join(
+            str(part)
+            for part in (
+                request.get_full_path(),
+                accepted.format if accepted else "",
+                generation_key_prefix(*self.cache_models) if self.cache_models else "",
+                *parts,
+            )
+        )
+        return f'"{hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()}"'
+
+    def get_list_etag(self, request: Request, queryset: QuerySet[Any]) -> str:
+        aggregates: dict[str, Any] = {"count": Count("pk")}
+        if self.last_modified_field:
+            aggregates["last_modified"] = Max(self.last_modified_field)
+
+        if not queryset.query.is_sliced:
+            queryset = queryset.order_by()
+        result = queryset.aggregate(**aggregates)
+
+        last_modified = result.get("last_modified")
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return self._build_etag(request, result["count"], timestamp)
+
+    def get_object_validators(
+        self, request: Request, obj: models.Model
+    ) -> tuple[str, Optional[int]]:
+        last_modified = (
+            getattr(obj, self.last_modified_field) if self.last_modified_field else None
+        )
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return self._build_etag(request, obj.pk, timestamp), timestamp
+
+    @staticmethod
+    def _set_validators(
+        response: HttpResponseBase, etag: str, last_modified: Optional[int]
+    ) -> HttpResponseBase:
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore[attr-defined]
+        etag = self.get_list_etag(request, queryset)
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return self._set_validators(not_modified, etag, None)
+
+        response: Response = super().list(request, *args, **kwargs)  # type: ignore[misc]
+        return self._set_validators(response, etag, None)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        instance = self.get_object()  # type: ignore[attr-defined]
+        etag, last_modified = self.get_object_validators(request, instance)
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return self._set_validators(not_modified, etag, last_modified)
+
+        serializer = self.get_serializer(instance)  # type: ignore[attr-defined]
+        return self._set_validators(Response(serializer.data), etag, last_modified)
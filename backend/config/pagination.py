@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any, Optional
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Cursor pagination that seeks on the full ``ordering`` tuple.
+
+    DRF's CursorPagination positions on the first ordering field only and
+    falls back to OFFSET for ties, which degrades on columns like Post.order
+    where most rows share a value. Here the cursor stores the last row's
+    value for every ordering field, and the next page is fetched with a
+    lexicographic WHERE clause:
+    (a < x) OR (a = x AND b < y) OR (a = x AND b = y AND id > z).
+    Each page is an index range scan whatever its depth.
+
+    Cursors are opaque base64 tokens. ``ordering`` must end in a unique field
+    (normally "id") so positions are total.
+    """
+
+    ordering: tuple[str, ...] = ("id",)
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param: Optional[str] = "page_size"
+    cursor_query_param = "cursor"
+    # When False, requests that send neither a cursor nor a page size are
+    # returned unpaginated (for small tables whose clients expect a flat list).
+    paginate_by_default = True
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request: Request) -> int:
+        if self.page_size_query_param:
+            try:
+                requested = int(request.query_params[self.page_size_query_param])
+                if requested > 0:
+                    return min(requested, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def _wants_pagination(self, request: Request) -> bool:
+        if self.paginate_by_default:
+            return True
+        return self.cursor_query_param in request.query_params or bool(
+            self.page_size_query_param
+            and self.page_size_query_param in request.query_params
+        )
+
+    # ------------------------------------------------------------------
+    # Cursor encoding
+    # ------------------------------------------------------------------
+
+    def encode_cursor(self, position: list[Any], reverse: bool) -> str:
+        raw = json.dumps({"p": position, "r": int(reverse)}, default=str)
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(
+        self, request: Request, model: type[Model]
+    ) -> tuple[Optional[list[Any]], bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            position = data["p"]
+            if len(position) != len(self.ordering):
+                raise ValueError
+            values = [
+                model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+            return values, bool(data.get("r"))
+        except (TypeError, ValueError, KeyError, binascii.Error, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _position(self, instance: Model) -> list[Any]:
+        return [getattr(instance, field.lstrip("-")) for field in self.ordering]
+
+    # ------------------------------------------------------------------
+    # Keyset query
+    # ------------------------------------------------------------------
+
+    def _ordering(self, reverse: bool) -> list[str]:
+        if not reverse:
+            return list(self.ordering)
+        return [
+            field[1:] if field.startswith("-") else f"-{field}" for field in self.ordering
+        ]
+
+    def _seek(self, position: list[Any], reverse: bool) -> Q:
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            descending = field.startswith("-")
+            name = field.lstrip("-")
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Any], request: Request, view: Any = None
+    ) -> Optional[list[Any]]:
+        if not self._wants_pagination(request):
+            return None
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request, queryset.model)
+
+        queryset = queryset.order_by(*self._ordering(reverse))
+        if position is not None:
+            queryset = queryset.filter(self._seek(position, reverse))
+
+        # One extra row tells us whether another page exists without a COUNT
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_previous, self.has_next = has_more, position is not None
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page = results
+        return results
+
+    def _link(self, instance: Model, reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self._position(instance), reverse)
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
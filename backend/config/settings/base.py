@@ -10,7 +10,53 @@ BASE_DIR = Path(__file__).resolve().parents[2]
 
 # Global cache TTL (15 minutes by default)
 CACHE_TTL = 60 * 15
+
+# Server-side TTL for API responses cached under per-model generation keys
+# (see config/cache.py). Model signals drop stale entries the moment the admin
+# saves, so these can live for days.
+API_CACHE_TTL = 60 * 60 * 24 * 7
+
+# max-age advertised to browsers for those responses. Kept short because a
+# browser cannot see a generation bump.
+API_BROWSER_TTL = 60
+
+# Rebuild the pre-rendered homepage snapshot (snapshots app) on a background
+# thread after admin saves instead of inside the save request.
+SNAPSHOT_ASYNC_REBUILD = True
+
+# Deliver contact notifications (contacts/outbox.py) on a background thread
+# after the submission commits instead of inside the POST.
+CONTACT_NOTIFICATIONS_ASYNC = True
+
+# Once CONTACT_DIGEST_THRESHOLD submissions arrive within CONTACT_DIGEST_WINDOW
+# seconds, further notifications are held to the end of the window and sent as
+# multi-embed digest messages instead of one webhook call each.
+CONTACT_DIGEST_WINDOW = 60
+CONTACT_DIGEST_THRESHOLD = 3
+
+# How resume PDFs are served (info/serving.py): "redirect" to the storage URL,
+# "accel" via nginx X-Accel-Redirect, "stream" through Django, or "auto".
+RESUME_SERVE_MODE = "auto"
+# Internal nginx location mapped onto MEDIA_ROOT for "accel" mode
+RESUME_ACCEL_PREFIX = "/protected-media/"
+
+# Directory the crawler meta pages are prerendered into (snapshots/seo.py) for
+# nginx to serve without touching Django. None disables prerendering.
+SEO_PRERENDER_ROOT = None
 SITE_URL = "https://rajivwallace.com"
+# Public origin of the API, for absolute URLs in payloads built outside a
+# request (the homepage snapshot); the same origin the frontend calls
+API_BASE_URL = "http://localhost:8000"
+
+# Responsive variants generated for uploaded images (config/images.py) on a
+# background thread after the save commits. Formats the installed Pillow
+# cannot encode are skipped.
+IMAGE_VARIANT_WIDTHS = (320, 640, 1280, 1920)
+IMAGE_VARIANT_FORMATS = ("avif", "webp")
+IMAGE_VARIANTS_ASYNC = True
+# Uploads above this many pixels are downscaled before being stored as WebP
+# (config/storage.py). 4K UHD still covers the largest variant width.
+IMAGE_MAX_PIXELS = 3840 * 2160
 
 # ============================================================================
 # APPLICATION DEFINITION
@@ -33,14 +79,20 @@ INSTALLED_APPS = [
     "blog",
     "wallet",
     "contacts",
+    "snapshots",
+    "media",
     "django_cleanup.apps.CleanupConfig",
 ]
 
 MIDDLEWARE = [
     "django_prometheus.middleware.PrometheusBeforeMiddleware",
+    # Per-view SQL/cache/serialization metrics and Server-Timing for staff
+    "config.instrumentation.RequestInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    # Answers If-None-Match for responses replayed from the API cache
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
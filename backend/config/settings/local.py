@@ -12,11 +12,15 @@ SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "django-insecure-local-testing-key-s
 
 # Disable caching for local development
 CACHE_TTL = 0
+API_CACHE_TTL = 0
+API_BROWSER_TTL = 0
 
 ALLOWED_HOSTS = os.getenv(
     "ALLOWED_HOSTS", "localhost,127.0.0.1,portfolio-backend"
 ).split(",")
 
+API_BASE_URL = os.getenv("VITE_API_URL") or API_BASE_URL
+
 # ============================================================================
 # DEVELOPMENT-SPECIFIC APPS AND MIDDLEWARE
 # ============================================================================
@@ -56,6 +56,10 @@ SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 # Static paths mapped to the internal Docker container volumes for asset serving.
 STATIC_URL = "/static/"
 STATIC_ROOT = "/home/backend/django/staticfiles"
+# Shared with nginx through the portfolio_static volume (see nginx.conf @bot_backend)
+SEO_PRERENDER_ROOT = os.path.join(STATIC_ROOT, "seo")
+# The frontend's API origin (shared .env); empty means same-origin behind nginx
+API_BASE_URL = os.getenv("VITE_API_URL") or SITE_URL
 
 # Media handled via GCS when configured
 if os.getenv("GCS_CREDENTIALS"):
@@ -211,6 +215,11 @@ REST_FRAMEWORK.update(
             "contact": "20/hour",
         },
         "DEFAULT_PAGINATION_CLASS": None,  # type: ignore[dict-item]
+        # nginx is the one proxy in front of gunicorn and appends the peer
+        # address to X-Forwarded-For, so only the last entry can be trusted.
+        # Without this, throttles and the contact spam buckets key on the whole
+        # client-supplied header and a forged value buys a fresh bucket.
+        "NUM_PROXIES": 1,
     }
 )
 
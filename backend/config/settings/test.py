@@ -0,0 +1,9 @@
+# ruff: noqa: F403, F405, E402
+from .local import *
+
+# ============================================================================
+# TEST SETTINGS
+# ============================================================================
+# Background threads would hit the test database outside the test's
+# transaction (SQLite answers "database table is locked"); run rebuilds inline.
+SNAPSHOT_ASYNC_REBUILD = False
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import os
 import io
+import logging
 from datetime import date
-from typing import Any
+from typing import Any, Optional
 
-from django.core.files.base import ContentFile
+from django.conf import settings
+from django.core.files import File
+
+logger = logging.getLogger(__name__)
 
 # Dynamically inherit from GoogleCloudStorage in production, FileSystemStorage locally
 if os.getenv("GCS_CREDENTIALS"):
@@ -14,49 +18,94 @@ else:
     from django.core.files.storage import FileSystemStorage as _BaseStorage
 
 
+def _bounded(img: Any, max_pixels: Optional[int]) -> Any:
+    """
+    Downscales ``img`` to at most ``max_pixels`` before it is decoded. JPEGs
+    are first drafted at 1/2, 1/4 or 1/8 scale by the decoder itself, so a
+    48 MP phone photo never exists as a full-resolution bitmap in memory.
+    """
+    from PIL import Image
+
+    width, height = img.size
+    if not max_pixels or width * height <= max_pixels:
+        return img
+
+    scale = (max_pixels / (width * height)) ** 0.5
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    # No-op for formats without a draft mode (PNG)
+    img.draft("RGB", size)
+    if img.mode in ("1", "P"):
+        # Palette images can only be resized with nearest-neighbour
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    img.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+    return img
+
+
 class WebPOptimizedStorage(_BaseStorage):  # type: ignore[misc]
     """
     Automatically intercepts image uploads, converts them to WebP,
-    and forwards them to the underlying storage backend.
+    and forwards them to the underlying storage backend. Images larger than
+    IMAGE_MAX_PIXELS are downscaled on the way in, and a file already stored
+    once (by content hash, see media/references.py) is not stored again.
     """
 
     def _save(self, name: str, content: Any) -> str:
         from PIL import Image
 
+        from media import references
+
         # Only process known image extensions
         ext: str = os.path.splitext(name)[1].lower()
+        digest: Optional[str] = None
         if ext in [".jpg", ".jpeg", ".png"]:
             try:
-                # Load image into memory with Pillow
+                # Same source bytes as an earlier upload: reuse its WebP
+                digest = references.source_digest(content)
+                existing = references.lookup(digest, self)
+                if existing is not None:
+                    logger.info(f"Reusing stored image {existing} for upload {name}")
+                    return existing
+            except Exception as e:
+                logger.warning(f"Could not hash upload {name}: {str(e)}")
+
+            try:
                 try:
                     content.seek(0)
                 except AttributeError:
                     pass
-                img = Image.open(content)
+                # Image.open only reads the header; pixels are decoded lazily
+                source = img = Image.open(content)
+
+                # Check transparency before _bounded may convert the mode
+                has_alpha = ext == ".png" and (
+                    img.mode in ("RGBA", "LA")
+                    or (img.mode == "P" and "transparency" in img.info)
+                )
+                img = _bounded(img, getattr(settings, "IMAGE_MAX_PIXELS", None))
 
                 # Prepare output buffer
                 output = io.BytesIO()
 
                 # Handle PNG with transparency
-                if ext == ".png" and (
-                    img.mode in ("RGBA", "LA")
-                    or (img.mode == "P" and "transparency" in img.info)
-                ):
+                if has_alpha:
                     img.save(output, format="WEBP", quality=85, lossless=True)
                 else:
                     # Convert standard JPEGs/PNGs to RGB if needed
                     if img.mode != "RGB":
                         img = img.convert("RGB")  # type: ignore[assignment]
                     img.save(output, format="WEBP", quality=85)
-
-                # Seek buffer back to start
-                output.seek(0)
-
-                # Replace the original content with the WebP binary
-                content = ContentFile(output.read())
+                # Closing the opened image would also close the upload, which
+                # ImageField still reads for width_field/height_field
+                if img is not source:
+                    img.close()
 
                 # Replace the filename extension with .webp
                 name = os.path.splitext(name)[0] + ".webp"
+
+                # Hand the buffer itself to storage rather than copying its
+                # bytes into a ContentFile
+                output.seek(0)
+                content = File(output, name=os.path.basename(name))
             except Exception:
                 try:
                     content.seek(0)
@@ -65,7 +114,40 @@ class WebPOptimizedStorage(_BaseStorage):  # type: ignore[misc]
                 # If Pillow fails for any reason, safely fall back to the original image
                 pass
 
-        return super()._save(name, content)  # type: ignore[misc]
+        saved: str = super()._save(name, content)  # type: ignore[misc]
+        if digest is not None:
+            references.remember(digest, saved)
+        return saved
+
+    def read_head(self, name: str, size: int) -> bytes:
+        """
+        The first ``size`` bytes of ``name``. On GCS this is a ranged GET;
+        open() would download the whole object first.
+        """
+        bucket = getattr(self, "bucket", None)
+        if bucket is not None:
+            from storages.utils import clean_name
+
+            blob = bucket.blob(self._normalize_name(clean_name(name)))
+            data: bytes = blob.download_as_bytes(start=0, end=size - 1)
+            return data
+        with self.open(name, "rb") as f:
+            head: bytes = f.read(size)
+            return head
+
+    def delete(self, name: str) -> None:
+        """
+        Deletes ``name`` unless it is a deduplicated object that another row
+        still references (django_cleanup calls this when any one row lets go).
+        """
+        from media import references
+
+        if references.is_indexed(name):
+            if references.references_to(name):
+                logger.info(f"Keeping shared image {name}: still referenced")
+                return
+            references.forget(name)
+        super().delete(name)  # type: ignore[misc]
 
 
 class CKEditor5Storage(WebPOptimizedStorage):
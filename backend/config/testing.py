@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Optional
+
+from rest_framework.response import Response
+
+# Row counts every list endpoint is exercised at. A constant query budget across
+# all of them is what rules out N+1 access in serializers.
+QUERY_BUDGET_SIZES: tuple[int, ...] = (1, 10, 100, 1000)
+
+
+class QueryBudgetMixin:
+    """
+    Test mixin (for Django/DRF TestCase subclasses) asserting that a list
+    endpoint runs the same number of queries no matter how many rows it returns.
+    """
+
+    def assertConstantQueries(  # noqa: N802 - mirrors assertNumQueries
+        self,
+        url: str,
+        budget: int,
+        populate: Callable[[int], None],
+        sizes: Iterable[int] = QUERY_BUDGET_SIZES,
+        count_rows: Callable[[Response], int] = lambda response: len(response.data),
+        page_size: Optional[int] = None,
+    ) -> None:
+        """
+        For each size, ``populate`` tops the table up to that many rows, then the
+        GET to ``url`` must run exactly ``budget`` queries and return every row
+        (or a full page, for paginated endpoints).
+        """
+        for size in sizes:
+            populate(size)
+            with self.subTest(rows=size):  # type: ignore[attr-defined]
+                with self.assertNumQueries(budget):  # type: ignore[attr-defined]
+                    response: Any = self.client.get(url)  # type: ignore[attr-defined]
+                self.assertEqual(response.status_code, 200)  # type: ignore[attr-defined]
+                expected = size if page_size is None else min(size, page_size)
+                self.assertEqual(count_rows(response), expected)  # type: ignore[attr-defined]
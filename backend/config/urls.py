@@ -17,6 +17,7 @@ from projects.views import ProjectViewSet
 from blog.views import CategoryViewSet, PostViewSet, PostPreviewViewSet, seo_blog_post
 from wallet.views import CardViewSet
 from contacts.views import ContactViewSet
+from snapshots.views import home_snapshot
 
 # Import health check views
 from health_check.views import health_detailed, health_simple
@@ -66,6 +67,8 @@ urlpatterns = [
     # SEO Routes for social media bots
     path("api/seo/blog/<slug:slug>/", seo_blog_post, name="seo-blog-post"),
     path("api/seo/home/", seo_home_page, name="seo-home-page"),
+    # Pre-rendered homepage payload
+    path("api/snapshot/home/", home_snapshot, name="snapshot-home"),
     # API Routes
     path("api/", include(router.urls)),
     # Admin Interface
@@ -1,7 +1,48 @@
+from __future__ import annotations
+
+from typing import Any
+
 from django.contrib import admin
-from contacts.models import Contact
+from django.contrib import messages
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils import timezone
+
+from .models import Contact, ContactNotification
+from .outbox import schedule_dispatch
+
+
+class ContactNotificationInline(admin.TabularInline):  # type: ignore[type-arg]
+    model = ContactNotification
+    extra = 0
+    can_delete = False
+    readonly_fields = ["channel", "status", "attempts", "next_attempt_at", "sent_at", "last_error"]
+
+    def has_add_permission(self, request: HttpRequest, obj: Any = None) -> bool:
+        return False
 
 
 @admin.register(Contact)
-class ContactAdmin(admin.ModelAdmin):
-    pass
+class ContactAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    inlines = [ContactNotificationInline]
+
+
+@admin.register(ContactNotification)
+class ContactNotificationAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    list_display = ["contact", "channel", "status", "attempts", "next_attempt_at", "sent_at"]
+    list_filter = ["status", "channel"]
+    list_select_related = ["contact"]
+    readonly_fields = ["contact", "channel", "attempts", "sent_at", "last_error", "created_at"]
+    actions = ["retry_now"]
+
+    def retry_now(self, request: HttpRequest, queryset: QuerySet[ContactNotification]) -> None:
+        # Dead-lettered rows get a fresh set of attempts
+        updated: int = queryset.exclude(status="sent").update(
+            status="pending", attempts=0, next_attempt_at=timezone.now()
+        )
+        schedule_dispatch()
+        self.message_user(
+            request, f"{updated} notification(s) queued for retry.", messages.SUCCESS
+        )
+
+    retry_now.short_description = "Retry selected notifications now"  # type: ignore[attr-defined]
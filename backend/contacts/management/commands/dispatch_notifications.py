@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from contacts.outbox import dispatch_due
+
+
+class Command(BaseCommand):
+    help = "Delivers due contact notifications from the outbox (once, or continuously with --loop)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the outbox instead of exiting after one pass",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=15.0,
+            help="Seconds between polls with --loop (default: 15)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            counts = dispatch_due()
+            if any(counts.values()):
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Sent {counts['sent']} in {counts['messages']} message(s) "
+                        f"({counts['coalesced']} coalesced), retrying {counts['pending']}, "
+                        f"dead-lettered {counts['dead']}."
+                    )
+                )
+            if not options["loop"]:
+                break
+            close_old_connections()
+            time.sleep(options["interval"])
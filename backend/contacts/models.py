@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-import requests
+from typing import Any
+
 from django.db import models
 from django.utils import timezone
 from django.conf import settings
@@ -22,69 +23,89 @@ class Contact(models.Model):
     class Meta:
         ordering = ["-created_at"]  # Newest messages first
 
-    def send_notifications(self) -> dict[str, bool]:
+    def send_notifications(self) -> dict[str, str]:
         """
-        Send all relevant notifications (Discord) for this contact.
+        Queues all relevant notifications (Discord) for this contact in the
+        outbox. Delivery happens on a background thread once the surrounding
+        transaction commits (see contacts/outbox.py).
         Returns a dictionary of notification statuses.
         """
-        discord_sent = self._send_discord_notification()
+        from .outbox import enqueue_notifications
+
+        notifications = enqueue_notifications(self)
+        return {n.channel: n.status for n in notifications}
 
-        return {"discord": discord_sent}
+    @property
+    def notification_status(self) -> dict[str, str]:
+        return {n.channel: n.status for n in self.notifications.all()}
 
     def _get_site_url(self) -> str:
         return getattr(settings, "SITE_URL", "https://rajivwallace.com")
 
-    def _send_discord_notification(self) -> bool:
-        webhook_url: str | None = getattr(settings, "DISCORD_WEBHOOK_URL", None)
-        
-        # Print to console in local development
-        if getattr(settings, "DEBUG", False) and not webhook_url:
-            print("\n" + "=" * 50)
-            print("📨 NEW CONTACT FORM SUBMISSION (LOCAL DEV)")
-            print(f"Name: {self.name}")
-            print(f"Email: {self.email}")
-            print(f"Message:\n{self.message}")
-            print("=" * 50 + "\n")
-            return True
-
-        if not webhook_url:
-            logger.warning("Discord webhook URL not configured")
-            return False
-
-        try:
-            embed: dict = {
-                "title": "🔔 New Contact Form Submission",
-                "color": 0x00FF00,
-                "fields": [
-                    {"name": "👤 Name", "value": self.name, "inline": True},
-                    {"name": "📧 Email", "value": self.email, "inline": True},
-                    {
-                        "name": "💬 Message",
-                        "value": self.message[:1000]
-                        + ("..." if len(self.message) > 1000 else ""),
-                        "inline": False,
-                    },
-                ],
-                "footer": {"text": "Portfolio Website Contact Form"},
-                "timestamp": self.created_at.isoformat(),
-            }
-
-            payload: dict = {
-                "username": "Portfolio Bot",
-                "avatar_url": f"{self._get_site_url()}/static/images/bot-avatar.png",
-                "embeds": [embed],
-            }
-
-            response = requests.post(webhook_url, json=payload, timeout=10)
-            if response.status_code == 204:
-                logger.info("Discord notification sent successfully")
-                return True
-            else:
-                logger.error(
-                    f"Discord webhook failed with status {response.status_code}: {response.text}"
-                )
-                return False
-
-        except Exception as e:
-            logger.error(f"Error sending Discord notification: {str(e)}")
-            return False
+    def discord_embed(self) -> dict[str, Any]:
+        return {
+            "title": "🔔 New Contact Form Submission",
+            "color": 0x00FF00,
+            "fields": [
+                {"name": "👤 Name", "value": self.name, "inline": True},
+                {"name": "📧 Email", "value": self.email, "inline": True},
+                {
+                    "name": "💬 Message",
+                    "value": self.message[:1000]
+                    + ("..." if len(self.message) > 1000 else ""),
+                    "inline": False,
+                },
+            ],
+            "footer": {"text": "Portfolio Website Contact Form"},
+            "timestamp": self.created_at.isoformat(),
+        }
+
+    def discord_payload(self) -> dict[str, Any]:
+        return {
+            "username": "Portfolio Bot",
+            "avatar_url": f"{self._get_site_url()}/static/images/bot-avatar.png",
+            "embeds": [self.discord_embed()],
+        }
+
+
+class ContactNotification(models.Model):
+    """
+    Outbox row for one notification of a Contact on one channel. Written in the
+    same transaction as the contact and delivered by contacts/outbox.py, so a
+    slow webhook never holds a request thread and a failed one is retried with
+    backoff instead of lost.
+    """
+
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("dead", "Dead-lettered"),
+    )
+    CHANNEL_CHOICES = (("discord", "Discord"),)
+
+    contact = models.ForeignKey(
+        Contact, on_delete=models.CASCADE, related_name="notifications"
+    )
+    channel = models.CharField(max_length=20, choices=CHANNEL_CHOICES, default="discord")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Also used as a claim lease: a dispatcher pushes it forward while sending
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f"{self.get_channel_display()} notification for contact {self.contact_id} ({self.status})"  # type: ignore[attr-defined]
+
+    class Meta:
+        ordering = ["next_attempt_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["contact", "channel"], name="contacts_notification_unique_channel"
+            )
+        ]
+        indexes = [
+            # The dispatcher's only query: due rows still pending
+            models.Index(fields=["status", "next_attempt_at"], name="contacts_notification_due"),
+        ]
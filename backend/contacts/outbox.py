@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import requests
+from prometheus_client import Counter
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from config import http
+from config.background import schedule_job, schedule_job_after
+
+from .models import Contact, ContactNotification
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# RETRY POLICY
+# ============================================================================
+MAX_ATTEMPTS = 6
+RETRY_BASE_DELAY = 30  # seconds; doubles per attempt: 30s, 1m, 2m, 4m, 8m
+RETRY_MAX_DELAY = 60 * 60
+# How long a claimed row stays invisible to other dispatchers while it is being
+# sent. Must exceed the webhook timeout; a worker that dies mid-send loses its
+# claim after this and the row is retried.
+CLAIM_LEASE = 60
+CLAIM_BATCH_SIZE = 20
+
+# Discord webhook limits per message
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_EMBED_CHARS = 6000
+
+DISPATCH_JOB = "contact-notifications"
+DISPATCH_QUEUE = "notifications"
+
+
+NOTIFICATIONS_COALESCED = Counter(
+    "contact_notifications_coalesced_total",
+    "Contact notifications delivered inside another notification's digest message",
+    ["channel"],
+)
+
+
+class DeliveryError(Exception):
+    """
+    A notification could not be delivered. ``permanent`` errors are
+    dead-lettered straight away; others are retried after ``retry_after``
+    seconds or the backoff delay, whichever is longer.
+    """
+
+    def __init__(
+        self, message: str, *, permanent: bool = False, retry_after: float = 0
+    ) -> None:
+        super().__init__(message)
+        self.permanent = permanent
+        self.retry_after = retry_after
+
+
+# ============================================================================
+# ENQUEUE
+# ============================================================================
+
+
+def _first_attempt_at(channel: str) -> datetime:
+    """
+    Picks when a new notification is first sent. Under low traffic that is
+    now. Once DIGEST_THRESHOLD notifications have arrived within DIGEST_WINDOW
+    the channel is in a burst, and new rows join the open digest (or open one
+    a window from now), so a spam wave is coalesced into a few messages.
+    """
+    now = timezone.now()
+    window = timedelta(seconds=getattr(settings, "CONTACT_DIGEST_WINDOW", 60))
+    threshold: int = getattr(settings, "CONTACT_DIGEST_THRESHOLD", 3)
+    if not window or not threshold:
+        return now
+
+    recent = ContactNotification.objects.filter(channel=channel, created_at__gte=now - window)
+    if recent.count() < threshold:
+        return now
+
+    open_digest = (
+        recent.filter(status="pending", attempts=0, next_attempt_at__gt=now)
+        .order_by("-next_attempt_at")
+        .values_list("next_attempt_at", flat=True)
+        .first()
+    )
+    return open_digest or now + window
+
+
+def enqueue_notifications(contact: Contact) -> list[ContactNotification]:
+    """
+    Writes an outbox row per channel and kicks the dispatcher once the
+    surrounding transaction commits, so the row is visible to it.
+    """
+    notifications = [
+        ContactNotification.objects.get_or_create(
+            contact=contact,
+            channel=channel,
+            defaults={"next_attempt_at": _first_attempt_at(channel)},
+        )[0]
+        for channel, _ in ContactNotification.CHANNEL_CHOICES
+    ]
+    transaction.on_commit(schedule_dispatch)
+    return notifications
+
+
+def schedule_dispatch() -> None:
+    schedule_job(
+        DISPATCH_JOB,
+        run_dispatcher,
+        queue=DISPATCH_QUEUE,
+        inline=not getattr(settings, "CONTACT_NOTIFICATIONS_ASYNC", True),
+    )
+
+
+# ============================================================================
+# DELIVERY
+# ============================================================================
+
+
+def _embed_size(embed: dict[str, Any]) -> int:
+    # Discord counts title, description, field names/values and footer text
+    size = len(embed.get("title", "")) + len(embed.get("description", ""))
+    size += sum(len(f["name"]) + len(f["value"]) for f in embed.get("fields", []))
+    return size + len(embed.get("footer", {}).get("text", ""))
+
+
+def chunk_embeds(embeds: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """
+    Packs embeds into as few webhook messages as Discord allows: at most
+    DISCORD_MAX_EMBEDS per message and DISCORD_MAX_EMBED_CHARS across them.
+    """
+    chunks: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    current_size = 0
+    for embed in embeds:
+        size = _embed_size(embed)
+        if current and (
+            len(current) >= DISCORD_MAX_EMBEDS
+            or current_size + size > DISCORD_MAX_EMBED_CHARS
+        ):
+            chunks.append(current)
+            current, current_size = [], 0
+        current.append(embed)
+        current_size += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _deliver_discord(contacts: list[Contact]) -> None:
+    """
+    Sends one webhook message carrying an embed per contact. Callers pass at
+    most one chunk's worth (see chunk_embeds).
+    """
+    webhook_url: str | None = getattr(settings, "DISCORD_WEBHOOK_URL", None)
+
+    # Print to console in local development
+    if getattr(settings, "DEBUG", False) and not webhook_url:
+        for contact in contacts:
+            print("\n" + "=" * 50)
+            print("📨 NEW CONTACT FORM SUBMISSION (LOCAL DEV)")
+            print(f"Name: {contact.name}")
+            print(f"Email: {contact.email}")
+            print(f"Message:\n{contact.message}")
+            print("=" * 50 + "\n")
+        return
+
+    if not webhook_url:
+        raise DeliveryError("Discord webhook URL not configured", permanent=True)
+
+    payload = contacts[0].discord_payload()
+    payload["embeds"] = [contact.discord_embed() for contact in contacts]
+    if len(contacts) > 1:
+        payload["content"] = f"📬 {len(contacts)} new contact form submissions"
+
+    try:
+        response = http.post(webhook_url, json=payload)
+    except http.CircuitOpenError as e:
+        # Discord is known to be down; wait for the breaker instead of burning attempts
+        raise DeliveryError(str(e), retry_after=e.retry_after)
+    except requests.RequestException as e:
+        raise DeliveryError(f"Discord request failed: {str(e)}")
+
+    if response.status_code in (200, 204):
+        return
+    if response.status_code == 429:
+        try:
+            retry_after = float(response.json().get("retry_after", 0))
+        except ValueError:
+            retry_after = 0
+        raise DeliveryError("Discord rate limited the webhook", retry_after=retry_after)
+    raise DeliveryError(
+        f"Discord webhook failed with status {response.status_code}: {response.text[:500]}",
+        # Other 4xx mean the payload or webhook is wrong; resending won't help
+        permanent=400 <= response.status_code < 500,
+    )
+
+
+_DELIVERERS = {
+    "discord": _deliver_discord,
+}
+
+
+def backoff_delay(attempts: int) -> float:
+    """
+    Exponential backoff with jitter, so retries from a burst of submissions
+    don't all land on the webhook in the same second.
+    """
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0))
+    return delay * random.uniform(0.8, 1.2)
+
+
+# ============================================================================
+# DISPATCH
+# ============================================================================
+
+
+def claim_due(limit: int = CLAIM_BATCH_SIZE) -> list[ContactNotification]:
+    """
+    Claims up to ``limit`` due rows by pushing their next_attempt_at past the
+    lease. SKIP LOCKED lets several dispatchers (gunicorn workers, the
+    management command) run at once without sending anything twice.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = list(
+            ContactNotification.objects.select_for_update(skip_locked=True)
+            .filter(status="pending", next_attempt_at__lte=now)
+            .select_related("contact")
+            .order_by("next_attempt_at")[:limit]
+        )
+        if claimed:
+            ContactNotification.objects.filter(pk__in=[n.pk for n in claimed]).update(
+                attempts=F("attempts") + 1,
+                next_attempt_at=now + timedelta(seconds=CLAIM_LEASE),
+            )
+    for notification in claimed:
+        notification.attempts += 1
+    return claimed
+
+
+def _record_failure(notifications: list[ContactNotification], error: DeliveryError) -> str:
+    # Rows sent together share their attempt count unless they joined a digest
+    # mid-retry, so decide on the furthest-along one
+    attempts = max(notification.attempts for notification in notifications)
+    pks = [notification.pk for notification in notifications]
+    if error.permanent or attempts >= MAX_ATTEMPTS:
+        ContactNotification.objects.filter(pk__in=pks).update(
+            status="dead", last_error=str(error)
+        )
+        logger.error(
+            f"Notification(s) {pks} dead-lettered after {attempts} attempt(s): {error}"
+        )
+        return "dead"
+
+    delay = max(backoff_delay(attempts), error.retry_after)
+    ContactNotification.objects.filter(pk__in=pks).update(
+        last_error=str(error),
+        next_attempt_at=timezone.now() + timedelta(seconds=delay),
+    )
+    logger.warning(
+        f"Notification(s) {pks} attempt {attempts} failed, "
+        f"retrying in {delay:.0f}s: {error}"
+    )
+    return "pending"
+
+
+def _chunk(
+    channel: str, notifications: list[ContactNotification]
+) -> list[list[ContactNotification]]:
+    if channel != "discord":
+        return [[notification] for notification in notifications]
+    chunks: list[list[ContactNotification]] = []
+    start = 0
+    for embeds in chunk_embeds([n.contact.discord_embed() for n in notifications]):
+        chunks.append(notifications[start : start + len(embeds)])
+        start += len(embeds)
+    return chunks
+
+
+def deliver(notifications: list[ContactNotification]) -> str:
+    """
+    Sends one message for ``notifications`` (all on the same channel) and
+    records the outcome on every row. Returns the resulting status ("sent",
+    "pending" for a scheduled retry, or "dead").
+    """
+    channel = notifications[0].channel
+    try:
+        deliverer = _DELIVERERS.get(channel)
+        if deliverer is None:
+            raise DeliveryError(f"Unknown channel {channel!r}", permanent=True)
+        deliverer([notification.contact for notification in notifications])
+    except DeliveryError as e:
+        return _record_failure(notifications, e)
+    except Exception as e:
+        return _record_failure(notifications, DeliveryError(f"Unexpected error: {str(e)}"))
+
+    ContactNotification.objects.filter(pk__in=[n.pk for n in notifications]).update(
+        status="sent", sent_at=timezone.now(), last_error=""
+    )
+    logger.info(
+        f"{notifications[0].get_channel_display()} message sent for "  # type: ignore[attr-defined]
+        f"{len(notifications)} notification(s)"
+    )
+    return "sent"
+
+
+def dispatch_due(limit: int = CLAIM_BATCH_SIZE) -> dict[str, int]:
+    """
+    Delivers every notification that is currently due, one claimed batch at a
+    time, packing each batch into as few messages per channel as possible.
+    Returns counts by resulting status, plus the number of messages sent and
+    of notifications that were coalesced into another one's message.
+    """
+    counts = {"sent": 0, "pending": 0, "dead": 0, "messages": 0, "coalesced": 0}
+    while True:
+        batch = claim_due(limit)
+        if not batch:
+            if counts["coalesced"]:
+                logger.info(
+                    f"Coalesced {counts['coalesced']} notification(s) into "
+                    f"{counts['messages']} message(s)"
+                )
+            return counts
+
+        by_channel: dict[str, list[ContactNotification]] = {}
+        for notification in batch:
+            by_channel.setdefault(notification.channel, []).append(notification)
+
+        for channel, notifications in by_channel.items():
+            for chunk in _chunk(channel, notifications):
+                outcome = deliver(chunk)
+                counts[outcome] += len(chunk)
+                if outcome == "sent":
+                    counts["messages"] += 1
+                    counts["coalesced"] += len(chunk) - 1
+                    NOTIFICATIONS_COALESCED.labels(channel=channel).inc(len(chunk) - 1)
+
+
+def next_due_at() -> Optional[datetime]:
+    return (
+        ContactNotification.objects.filter(status="pending")
+        .order_by("next_attempt_at")
+        .values_list("next_attempt_at", flat=True)
+        .first()
+    )
+
+
+_retry_timer: Optional[threading.Timer] = None
+_retry_timer_lock = threading.Lock()
+
+
+def run_dispatcher() -> dict[str, int]:
+    """
+    Background job: drains due notifications, then arms a timer for the next
+    scheduled retry. Timers don't survive a worker restart; the
+    dispatch_notifications --loop worker (the portfolio-notifications service
+    in docker-compose.prod.yml) picks up from the database state.
+    """
+    global _retry_timer
+
+    counts = dispatch_due()
+    if not getattr(settings, "CONTACT_NOTIFICATIONS_ASYNC", True):
+        return counts
+
+    due = next_due_at()
+    with _retry_timer_lock:
+        if _retry_timer is not None:
+            _retry_timer.cancel()
+            _retry_timer = None
+        if due is not None:
+            delay = max((due - timezone.now()).total_seconds(), 1)
+            _retry_timer = schedule_job_after(
+                delay, DISPATCH_JOB, run_dispatcher, queue=DISPATCH_QUEUE
+            )
+    return counts
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest import mock
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config import http
+
+from .models import Contact, ContactNotification
+from .outbox import DISCORD_MAX_EMBEDS, MAX_ATTEMPTS, chunk_embeds, dispatch_due
+
+WEBHOOK_URL = "https://discord.test/api/webhooks/1/token"
+
+
+def _webhook_response(status_code: int, json: dict | None = None) -> mock.Mock:
+    response = mock.Mock(status_code=status_code, text="")
+    response.json.return_value = json or {}
+    return response
+
+
+@override_settings(CONTACT_NOTIFICATIONS_ASYNC=False, DISCORD_WEBHOOK_URL=WEBHOOK_URL)
+class ContactNotificationOutboxTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        http.reset_breakers()
+        self.addCleanup(http.reset_breakers)
+        self.url = reverse("contact-list")
+        self.data = {"name": "Ada", "email": "ada@example.com", "message": "Hello there"}
+
+    def _make_due(self) -> None:
+        ContactNotification.objects.update(next_attempt_at=timezone.now())
+
+    @mock.patch.object(requests.Session, "request")
+    def test_post_queues_then_delivers_after_commit(self, post: mock.Mock) -> None:
+        post.return_value = _webhook_response(204)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(self.url, self.data, format="json")
+
+        # The webhook is not called inside the request
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["notifications"], {"discord": "pending"})
+        post.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+        notification = ContactNotification.objects.get()
+        self.assertEqual(notification.status, "sent")
+        self.assertEqual(notification.attempts, 1)
+        self.assertIsNotNone(notification.sent_at)
+        self.assertEqual(Contact.objects.get().notification_status, {"discord": "sent"})
+
+    @mock.patch.object(requests.Session, "request")
+    def test_failures_back_off_then_dead_letter(self, post: mock.Mock) -> None:
+        post.side_effect = requests.ConnectionError("discord is down")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, self.data, format="json")
+
+        notification = ContactNotification.objects.get()
+        self.assertEqual(notification.status, "pending")
+        self.assertEqual(notification.attempts, 1)
+        self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=20))
+        self.assertIn("discord is down", notification.last_error)
+
+        # Not due yet, so nothing is sent
+        self.assertEqual(sum(dispatch_due().values()), 0)
+
+        for _ in range(MAX_ATTEMPTS - 1):
+            self._make_due()
+            dispatch_due()
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, "dead")
+        self.assertEqual(notification.attempts, MAX_ATTEMPTS)
+        # The breaker opened after BREAKER_FAILURE_THRESHOLD failures, so the
+        # last attempt failed fast without touching the network
+        self.assertEqual(post.call_count, http.BREAKER_FAILURE_THRESHOLD)
+
+    @mock.patch.object(requests.Session, "request")
+    def test_open_circuit_defers_new_notifications(self, post: mock.Mock) -> None:
+        post.return_value = _webhook_response(503)
+        breaker = http.get_breaker("discord.test")
+        for _ in range(http.BREAKER_FAILURE_THRESHOLD):
+            breaker.record_failure()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, self.data, format="json")
+
+        post.assert_not_called()
+        notification = ContactNotification.objects.get()
+        self.assertEqual(notification.status, "pending")
+        self.assertIn("Circuit open", notification.last_error)
+        self.assertGreater(
+            notification.next_attempt_at,
+            timezone.now() + timedelta(seconds=http.BREAKER_RESET_TIMEOUT - 10),
+        )
+
+        # After the reset timeout a single trial call closes the circuit again
+        breaker.opened_at -= http.BREAKER_RESET_TIMEOUT
+        post.return_value = _webhook_response(204)
+        self._make_due()
+        self.assertEqual(dispatch_due()["sent"], 1)
+        self.assertEqual(breaker.state, http.CircuitBreaker.CLOSED)
+
+    @mock.patch.object(requests.Session, "request")
+    def test_unexpected_error_reopens_half_open_circuit(self, post: mock.Mock) -> None:
+        post.side_effect = ValueError("not a requests error")
+        breaker = http.get_breaker("discord.test")
+        for _ in range(http.BREAKER_FAILURE_THRESHOLD):
+            breaker.record_failure()
+        breaker.opened_at -= http.BREAKER_RESET_TIMEOUT
+
+        with self.assertRaises(ValueError):
+            http.post(WEBHOOK_URL, json={})
+        self.assertEqual(breaker.state, http.CircuitBreaker.OPEN)
+
+        # A trial that never reports back is abandoned after another timeout
+        breaker.opened_at -= http.BREAKER_RESET_TIMEOUT
+        breaker.before_request()
+        self.assertEqual(breaker.state, http.CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(http.CircuitOpenError):
+            breaker.before_request()
+        breaker.opened_at -= http.BREAKER_RESET_TIMEOUT
+        breaker.before_request()
+
+    @mock.patch.object(requests.Session, "request")
+    def test_rate_limit_honours_retry_after(self, post: mock.Mock) -> None:
+        post.return_value = _webhook_response(429, {"retry_after": 600})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, self.data, format="json")
+
+        notification = ContactNotification.objects.get()
+        self.assertEqual(notification.status, "pending")
+        self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=590))
+
+    @mock.patch.object(requests.Session, "request")
+    def test_client_error_is_dead_lettered_immediately(self, post: mock.Mock) -> None:
+        post.return_value = _webhook_response(404)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, self.data, format="json")
+
+        notification = ContactNotification.objects.get()
+        self.assertEqual(notification.status, "dead")
+        self.assertEqual(post.call_count, 1)
+
+
+@override_settings(
+    CONTACT_NOTIFICATIONS_ASYNC=False,
+    DISCORD_WEBHOOK_URL=WEBHOOK_URL,
+    CONTACT_DIGEST_WINDOW=60,
+    CONTACT_DIGEST_THRESHOLD=3,
+)
+class ContactNotificationDigestTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        http.reset_breakers()
+        self.addCleanup(http.reset_breakers)
+        self.url = reverse("contact-list")
+
+    def _submit(self, count: int) -> None:
+        for i in range(count):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(
+                    self.url,
+                    {"name": f"Sender {i}", "email": f"s{i}@example.com", "message": "Hi"},
+                    format="json",
+                )
+
+    @mock.patch("contacts.spam.IP_BUCKET_CAPACITY", 100)
+    @mock.patch.object(requests.Session, "request")
+    def test_burst_is_coalesced_into_one_digest(self, post: mock.Mock) -> None:
+        post.return_value = _webhook_response(204)
+        self._submit(7)
+
+        # Below the threshold notifications go out immediately, one call each
+        self.assertEqual(post.call_count, 3)
+        held = ContactNotification.objects.filter(status="pending")
+        self.assertEqual(held.count(), 4)
+        self.assertEqual(len(set(held.values_list("next_attempt_at", flat=True))), 1)
+
+        ContactNotification.objects.filter(status="pending").update(
+            next_attempt_at=timezone.now()
+        )
+        counts = dispatch_due()
+        self.assertEqual(counts["sent"], 4)
+        self.assertEqual(counts["messages"], 1)
+        self.assertEqual(counts["coalesced"], 3)
+
+        payload = post.call_args.kwargs["json"]
+        self.assertEqual(len(payload["embeds"]), 4)
+        self.assertIn("4 new contact form submissions", payload["content"])
+
+    def test_embeds_respect_discord_message_limits(self) -> None:
+        small = {"title": "t", "fields": [{"name": "n", "value": "v"}]}
+        self.assertEqual(
+            [len(chunk) for chunk in chunk_embeds([small] * 23)],
+            [DISCORD_MAX_EMBEDS, DISCORD_MAX_EMBEDS, 3],
+        )
+        large = {"title": "t", "fields": [{"name": "n", "value": "v" * 2500}]}
+        self.assertEqual([len(chunk) for chunk in chunk_embeds([large] * 3)], [2, 1])
+
+
+@override_settings(CONTACT_NOTIFICATIONS_ASYNC=False, DISCORD_WEBHOOK_URL=WEBHOOK_URL)
+@mock.patch.object(requests.Session, "request", return_value=_webhook_response(204))
+class ContactSpamPipelineTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        http.reset_breakers()
+        self.addCleanup(http.reset_breakers)
+        self.url = reverse("contact-list")
+        self.data = {"name": "Ada", "email": "ada@example.com", "message": "Hello there"}
+
+    def _post(self, **overrides: str) -> Any:
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(self.url, {**self.data, **overrides}, format="json")
+
+    def test_honeypot_is_silently_dropped_without_queries(self, post: mock.Mock) -> None:
+        with self.assertNumQueries(0):
+            response = self._post(website="https://spam.example")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], "success")
+        self.assertFalse(Contact.objects.exists())
+        post.assert_not_called()
+
+    def test_link_heavy_message_is_rejected(self, post: mock.Mock) -> None:
+        message = "Buy now http://a.example http://b.example www.c.example"
+        with self.assertNumQueries(0):
+            response = self._post(message=message)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.json())
+        self.assertFalse(Contact.objects.exists())
+
+    def test_duplicate_message_is_silently_dropped(self, post: mock.Mock) -> None:
+        self._post()
+        response = self._post(message="  hello   THERE ")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Contact.objects.count(), 1)
+        self.assertEqual(post.call_count, 1)
+
+    def test_per_ip_bucket_returns_429(self, post: mock.Mock) -> None:
+        for i in range(5):
+            response = self._post(email=f"user{i}@example.com", message=f"Message {i}")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(0):
+            response = self._post(email="user5@example.com", message="Message 5")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreater(int(response["Retry-After"]), 0)
+        self.assertEqual(Contact.objects.count(), 5)
+
+    def test_forged_forwarded_for_does_not_reset_ip_bucket(self, post: mock.Mock) -> None:
+        """Behind one proxy only the address it appended counts."""
+        rest_framework = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+        with self.settings(REST_FRAMEWORK=rest_framework):
+            for i in range(6):
+                with self.captureOnCommitCallbacks(execute=True):
+                    response = self.client.post(
+                        self.url,
+                        {**self.data, "email": f"user{i}@example.com", "message": f"Message {i}"},
+                        format="json",
+                        HTTP_X_FORWARDED_FOR=f"10.0.0.{i}, 203.0.113.7",
+                    )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(Contact.objects.count(), 5)
+
+    def test_failed_save_does_not_spend_quota(self, post: mock.Mock) -> None:
+        self.client.raise_request_exception = False
+        with mock.patch.object(Contact, "send_notifications", side_effect=RuntimeError):
+            response = self._post()
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(Contact.objects.exists())
+
+        # The retry is neither a duplicate nor charged for the failed attempt
+        response = self._post()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_per_email_bucket_returns_429(self, post: mock.Mock) -> None:
+        for i in range(3):
+            self._post(message=f"Message {i}")
+        response = self._post(message="Message 3")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
@@ -3,21 +3,38 @@ from __future__ import annotations
 from typing import Any, Union
 
 import logging
-from rest_framework import viewsets
+from django.db import transaction
+from prometheus_client import Counter
+from rest_framework import status, viewsets
 from rest_framework.permissions import BasePermission, IsAuthenticated, AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from config.pagination import KeysetCursorPagination
+
 from .models import Contact
 from .serializers import ContactSerializer
+from .spam import ContactSpamFilter, SpamVerdict
 
 logger = logging.getLogger(__name__)
 
+SPAM_REJECTIONS = Counter(
+    "contact_spam_rejections_total",
+    "Contact submissions rejected before saving, by pipeline stage",
+    ["reason"],
+)
+
+
+class ContactCursorPagination(KeysetCursorPagination):
+    ordering = ("-created_at", "id")
+    page_size = 50
+
 
 class ContactViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
     http_method_names = ["get", "post", "head", "options"]
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
+    pagination_class = ContactCursorPagination
 
     def get_permissions(self) -> list[BasePermission]:
         """
@@ -35,11 +52,19 @@ class ContactViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # Save the contact submission to database
-        contact: Contact = serializer.save()
+        # Screen for spam before anything touches the database or Discord
+        spam_filter = ContactSpamFilter(request, serializer.validated_data)
+        verdict = spam_filter.check()
+        if verdict is not None:
+            return self._reject(verdict, spam_filter.ip)
 
-        # Send notifications (Discord)
-        notification_status: dict[str, bool] = contact.send_notifications()
+        # Save the contact and its outbox rows together; the webhook is sent on a
+        # background thread after commit, so a slow Discord never holds this request
+        with transaction.atomic():
+            contact: Contact = serializer.save()
+            notification_status: dict[str, str] = contact.send_notifications()
+        # Only a stored submission spends the sender's quota
+        spam_filter.record()
 
         # Return success response with notification status
         return Response(
@@ -49,3 +74,27 @@ class ContactViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
                 "notifications": notification_status,
             }
         )
+
+    def _reject(self, verdict: SpamVerdict, ip: str) -> Response:
+        SPAM_REJECTIONS.labels(reason=verdict.reason).inc()
+        logger.info(f"Contact submission rejected ({verdict.reason}) from {ip}")
+
+        if verdict.silent:
+            # Indistinguishable from a real success so bots learn nothing
+            return Response(
+                {
+                    "status": "success",
+                    "message": "Your message has been sent successfully!",
+                    "notifications": {"discord": "pending"},
+                }
+            )
+        if verdict.retry_after is not None:
+            return Response(
+                {"error": "Too many messages. Please try again later."},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(verdict.retry_after)},
+            )
+        return Response(
+            {"error": f"Message rejected: {verdict.reason}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
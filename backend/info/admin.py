@@ -8,6 +8,8 @@ from django.contrib import messages
 from django.http import HttpRequest
 from django.utils.html import format_html
 
+from config.cache import bump_after_bulk
+
 from .models import Info, Resume
 
 logger = logging.getLogger(__name__)
@@ -105,12 +107,18 @@ class ResumeAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
                     '<div style="font-family: monospace; font-size: 11px;">'
                     "<strong>Original Filename:</strong> {}<br>"
                     '<strong>URL:</strong> <a href="{}" target="_blank">{}</a><br>'
-                    "<strong>Size:</strong> {:,} bytes"
+                    "<strong>Size:</strong> {}<br>"
+                    "<strong>Type:</strong> {}<br>"
+                    "<strong>Pages:</strong> {}<br>"
+                    "<strong>SHA-256:</strong> {}"
                     "</div>",
                     obj.file.name,
                     obj.file.url,
                     obj.file.url,
-                    obj.file.size,
+                    f"{obj.file_size:,} bytes" if obj.file_size is not None else "Unknown",
+                    obj.content_type or "Unknown",
+                    obj.page_count or "Unknown",
+                    obj.checksum or "Unknown",
                 )
             except Exception as e:
                 return format_html('<span style="color: red;">Error: {}</span>', str(e))
@@ -131,9 +139,7 @@ class ResumeAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
         self, request: HttpRequest, obj: Resume, form: Any, change: bool
     ) -> None:
         try:
-            if obj.is_active:
-                Resume.objects.exclude(pk=obj.pk).update(is_active=False)
-                logger.info(f"Deactivated other resumes, activating resume {obj.pk}")
+            # Resume.save() switches off the previously active row
             super().save_model(request, obj, form, change)
             self.message_user(request, "Resume saved successfully.", messages.SUCCESS)
         except Exception as e:
@@ -148,10 +154,7 @@ class ResumeAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
             )
             return
 
-        resume: Resume = queryset.first()
-        Resume.objects.exclude(pk=resume.pk).update(is_active=False)
-        resume.is_active = True  # type: ignore[assignment]
-        resume.save()
+        resume: Resume = Resume.activate_resume(queryset.first().pk)
         self.message_user(
             request, f"Resume '{resume.file.name}' is now active.", messages.SUCCESS
         )
@@ -161,6 +164,7 @@ class ResumeAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
 
     def make_inactive(self, request: HttpRequest, queryset: Any) -> None:
         updated: int = queryset.update(is_active=False)
+        bump_after_bulk(Resume)
         self.message_user(
             request, f"{updated} resume(s) deactivated.", messages.SUCCESS
         )
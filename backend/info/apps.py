@@ -12,3 +12,11 @@ class InfoConfig(AppConfig):
             setup_cleanup_signals()
         except ImportError:
             pass
+
+        from config.cache import connect_cache_invalidation
+        from config.images import connect_image_variants
+
+        from .models import Info, Resume
+
+        connect_cache_invalidation(Info, Resume)
+        connect_image_variants(Info, "profile_photo")
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from blog.models import Category, Post
+from blog.search import update_search_vectors
+from blog.utils import estimate_reading_time, html_to_text, make_excerpt
+from config.cache import bump_after_bulk
+from contacts.models import Contact
+from projects.models import Project, Tag
+from wallet.models import Card
+
+from .models import Info
+
+# ============================================================================
+# BULK DATASET LOADING
+# ============================================================================
+# A dataset is a plain dict, either written as JSON or built by
+# synthetic_dataset():
+#
+#     {
+#         "info": {...Info fields...},
+#         "tags": ["Backend", ...],
+#         "categories": ["Tech", ...],
+#         "projects": [{...Project fields..., "tags": ["Backend"]}],
+#         "posts": [{...Post fields..., "categories": ["Tech"]}],
+#         "cards": [{...Card fields...}],
+#         "contacts": [{...Contact fields...}],
+#     }
+#
+# load_dataset() inserts it with bulk_create in transactional chunks and
+# fills the Post.categories / Project.tags through tables the same way. Rows
+# are matched on a natural key (slug, name, or email + message for contacts,
+# since one sender can write many) and only missing ones are created, so
+# loading the same dataset twice is a no-op. bulk_create skips
+# save() and post_save, so the derived Post/Project columns are computed here
+# and each touched model's cache generation is bumped once at the end.
+
+DEFAULT_CHUNK_SIZE = 1000
+
+TAG_NAMES = ["Frontend", "Backend", "Full Stack", "Machine Learning", "DevOps", "Mobile"]
+CATEGORY_NAMES = ["Development", "Life", "Tech", "Career", "Travel", "Finance"]
+WORDS = (
+    "django react api cache query index latency python typescript docker deploy "
+    "server client render image storage bucket search token build test release "
+    "design schema model view route worker queue thread memory profile benchmark "
+    "the a of to and in for with on that this is we it our from by as at"
+).split()
+
+
+def chunked(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _names(base: list[str], count: int, prefix: str) -> list[str]:
+    return base[:count] + [f"{prefix} {index}" for index in range(len(base), count)]
+
+
+def synthetic_dataset(
+    posts: int = 0,
+    projects: int = 0,
+    cards: int = 0,
+    contacts: int = 0,
+    tags: int = len(TAG_NAMES),
+    categories: int = len(CATEGORY_NAMES),
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Deterministic fake data: the same sizes and seed always produce the same
+    rows, so a second run finds them all already loaded.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    tag_names = _names(TAG_NAMES, tags, "Tag")
+    category_names = _names(CATEGORY_NAMES, categories, "Category")
+
+    dataset: dict[str, Any] = {
+        "tags": tag_names,
+        "categories": category_names,
+        "projects": [],
+        "posts": [],
+        "cards": [],
+        "contacts": [],
+    }
+    for index in range(projects):
+        title = f"{_words(rng, 3).title()} {index}"
+        dataset["projects"].append(
+            {
+                "title": title,
+                "description": _words(rng, rng.randint(20, 60)).capitalize() + ".",
+                "repo": f"https://github.com/example/{slugify(title)}",
+                "order": index,
+                "tags": rng.sample(tag_names, k=min(len(tag_names), rng.randint(1, 3))),
+            }
+        )
+    for index in range(posts):
+        paragraphs = [
+            f"<p>{_words(rng, rng.randint(40, 120)).capitalize()}.</p>"
+            for _ in range(rng.randint(3, 12))
+        ]
+        dataset["posts"].append(
+            {
+                "title": f"{_words(rng, rng.randint(3, 8)).title()} {index}",
+                "body": "".join(paragraphs),
+                # Mostly published, some drafts and scheduled posts
+                "status": "draft" if rng.random() < 0.1 else "published",
+                "publish_date": now - timedelta(days=rng.randint(-30, 5 * 365)),
+                "categories": rng.sample(
+                    category_names, k=min(len(category_names), rng.randint(1, 3))
+                ),
+            }
+        )
+    for index in range(cards):
+        dataset["cards"].append(
+            {
+                "card_name": f"Card {index}",
+                "description": f"<p>{_words(rng, rng.randint(10, 30)).capitalize()}.</p>",
+                "annual_fee": f"${rng.choice([0, 95, 250, 395, 695])}",
+                "referral_link": f"https://example.com/refer/{index}",
+                "order": index,
+            }
+        )
+    for index in range(contacts):
+        dataset["contacts"].append(
+            {
+                "name": f"Visitor {index}",
+                "email": f"visitor{index}@example.com",
+                "message": _words(rng, rng.randint(10, 80)).capitalize() + ".",
+                "created_at": now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)),
+            }
+        )
+    return dataset
+
+
+def merge_datasets(*datasets: dict[str, Any]) -> dict[str, Any]:
+    merged: dict[str, Any] = {}
+    for dataset in datasets:
+        for key, value in dataset.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged[key] = value
+    return merged
+
+
+def _prepare_post(data: dict[str, Any]) -> dict[str, Any]:
+    # What Post.save() would have filled in
+    data.setdefault("slug", slugify(data["title"]))
+    data["search_text"] = html_to_text(data.get("body", ""))
+    data["excerpt"] = make_excerpt(data["search_text"])
+    data["reading_time"] = estimate_reading_time(data["search_text"])
+    return data
+
+
+def _prepare_project(data: dict[str, Any]) -> dict[str, Any]:
+    data.setdefault("slug", slugify(data["title"]))
+    return data
+
+
+class DatasetLoader:
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        log: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.log = log or (lambda message: None)
+        self.created: dict[str, int] = {}
+
+    def load(self, dataset: dict[str, Any]) -> dict[str, int]:
+        """
+        Loads ``dataset`` and returns how many rows of each kind were created.
+        """
+        if dataset.get("info"):
+            self.load_info(dataset["info"])
+        # Tags and categories named only on a project or post are created too
+        tags = self.load_named(
+            Tag,
+            [
+                *dataset.get("tags", []),
+                *(t for row in dataset.get("projects", []) for t in row.get("tags", [])),
+            ],
+        )
+        categories = self.load_named(
+            Category,
+            [
+                *dataset.get("categories", []),
+                *(c for row in dataset.get("posts", []) for c in row.get("categories", [])),
+            ],
+        )
+        self.load_rows(
+            Project,
+            "slug",
+            [_prepare_project(dict(row)) for row in dataset.get("projects", [])],
+            m2m=("tags", tags),
+        )
+        post_ids = self.load_rows(
+            Post,
+            "slug",
+            [_prepare_post(dict(row)) for row in dataset.get("posts", [])],
+            m2m=("categories", categories),
+        )
+        # The tsvector needs the categories, so it is built after the M2M rows
+        for chunk in chunked(post_ids, self.chunk_size):
+            update_search_vectors(chunk)
+        self.load_rows(Card, "card_name", [dict(row) for row in dataset.get("cards", [])])
+        self.load_rows(
+            Contact,
+            ("email", "message"),
+            [dict(row) for row in dataset.get("contacts", [])],
+        )
+
+        for model in (Tag, Project, Category, Post, Card, Info):
+            if self.created.get(model.__name__):
+                bump_after_bulk(model)
+        return self.created
+
+    def load_info(self, data: dict[str, Any]) -> None:
+        # A single row; created through save() so its validation runs
+        if Info.objects.exists():
+            self.log("Info already exists")
+            return
+        Info.objects.create(**data)
+        self.created["Info"] = 1
+
+    def load_named(self, model: Any, names: Iterable[str]) -> dict[str, Any]:
+        """
+        Ensures a Tag/Category exists for each name; returns name -> pk.
+        """
+        names = list(dict.fromkeys(names))
+        self.load_rows(model, "name", [{"name": name} for name in names])
+        return dict(model.objects.filter(name__in=names).values_list("name", "pk"))
+
+    def load_rows(
+        self,
+        model: Any,
+        key: Union[str, tuple[str, ...]],
+        rows: list[dict[str, Any]],
+        m2m: Optional[tuple[str, dict[str, Any]]] = None,
+    ) -> list[Any]:
+        """
+        Bulk-creates the rows whose ``key`` (a field, or a tuple of fields
+        matched together) is not in the table yet, one transaction per chunk,
+        plus their ``m2m`` through rows. Returns the pks of the created rows.
+        """
+        fields = (key,) if isinstance(key, str) else key
+        created_ids: list[Any] = []
+        total = 0
+        for chunk in chunked(rows, self.chunk_size):
+            # Narrow by the first field; the rest are compared here
+            candidates = model._default_manager.filter(
+                **{f"{fields[0]}__in": {row[fields[0]] for row in chunk}}
+            )
+            existing = {
+                self._natural_key(fields, values)
+                for values in candidates.values_list(*fields)
+            }
+            # First occurrence wins if the dataset itself repeats a key
+            fresh: dict[Any, dict[str, Any]] = {}
+            for row in chunk:
+                natural_key = self._natural_key(fields, [row[f] for f in fields])
+                if natural_key not in existing:
+                    fresh.setdefault(natural_key, row)
+            if not fresh:
+                continue
+
+            related: dict[Any, list[str]] = {}
+            objs = []
+            for natural_key, row in fresh.items():
+                if m2m is not None:
+                    related[natural_key] = row.pop(m2m[0], [])
+                objs.append(model(**row))
+
+            with transaction.atomic():
+                model._default_manager.bulk_create(objs, batch_size=self.chunk_size)
+                # Not every backend returns pks from bulk_create; look them up
+                pks: dict[Any, Any] = {}
+                for *values, pk in candidates.values_list(*fields, "pk"):
+                    natural_key = self._natural_key(fields, values)
+                    if natural_key in fresh:
+                        pks[natural_key] = pk
+                if m2m is not None:
+                    self._link(model, m2m, related, pks)
+            created_ids.extend(pks.values())
+            total += len(objs)
+
+        if total:
+            self.created[model.__name__] = self.created.get(model.__name__, 0) + total
+            self.log(f"Created {total} {model._meta.verbose_name_plural}")
+        return created_ids
+
+    @staticmethod
+    def _natural_key(fields: tuple[str, ...], values: Iterable[Any]) -> Any:
+        values = tuple(values)
+        return values[0] if len(fields) == 1 else values
+
+    def _link(
+        self,
+        model: Any,
+        m2m: tuple[str, dict[str, Any]],
+        related: dict[Any, list[str]],
+        pks: dict[Any, Any],
+    ) -> None:
+        field_name, targets = m2m
+        field: models.ManyToManyField = model._meta.get_field(field_name)  # type: ignore[type-arg]
+        through = field.remote_field.through  # type: ignore[attr-defined]
+        source_column = field.m2m_field_name() + "_id"
+        target_column = field.m2m_reverse_field_name() + "_id"
+
+        links = []
+        for natural_key, names in related.items():
+            for name in names:
+                links.append(
+                    through(**{source_column: pks[natural_key], target_column: targets[name]})
+                )
+        through.objects.bulk_create(links, batch_size=self.chunk_size, ignore_conflicts=True)
+
+
+def load_dataset(dataset: dict[str, Any], **kwargs: Any) -> dict[str, int]:
+    return DatasetLoader(**kwargs).load(dataset)
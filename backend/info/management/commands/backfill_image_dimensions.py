@@ -1,97 +1,302 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
-from typing import Any, Union
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional, Union
 
-from django.core.management.base import BaseCommand
+from django.core.files.storage import Storage
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import models, transaction
 
 from projects.models import Project
 from blog.models import Post
 from wallet.models import Card
 from info.models import Info
+from config.cache import bump_after_bulk
+from config.image_probe import probe_dimensions
+from config.images import build_placeholder, decode_source
 
 logger = logging.getLogger(__name__)
 
 # Concrete model types that this command works with
 _ModelType = Union[type[Project], type[Post], type[Card], type[Info]]
 
+MODELS: dict[str, tuple[_ModelType, str]] = {
+    "project": (Project, "thumbnail"),
+    "post": (Post, "image"),
+    "card": (Card, "image"),
+    "info": (Info, "profile_photo"),
+}
+HTML_FIELDS = ("body", "description")
+MISSING_ALT = re.compile(r"<img(?![^>]*\balt=)[^>]*>", re.IGNORECASE)
+DEFAULT_CHECKPOINT = os.path.join(tempfile.gettempdir(), "backfill_image_dimensions.json")
+
+
+def fix_missing_alt(html: str) -> tuple[str, int]:
+    return MISSING_ALT.subn(
+        lambda m: m.group(0).replace("<img", '<img alt="Embedded image"'), html
+    )
+
+
+def read_image(storage: Storage, name: str, needs_placeholder: bool) -> tuple[int, int, str]:
+    """
+    Runs on a pool thread. Dimensions always come from a ranged read of the
+    header; only a requested placeholder pays for downloading and decoding
+    the whole image.
+    """
+    width, height = probe_dimensions(storage, name)
+    if not width or not height:
+        raise ValueError("could not read image header")
+    placeholder = ""
+    if needs_placeholder:
+        placeholder = build_placeholder(decode_source(storage.open(name, "rb")))
+    return width, height, placeholder
+
+
+class Checkpoint:
+    """
+    Last primary key finished per model, kept in a small JSON file so a
+    killed run resumes after the last committed batch.
+    """
+
+    def __init__(self, path: str, dry_run: bool) -> None:
+        self.path = path
+        self.dry_run = dry_run
+        self.positions: dict[str, Any] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.positions = json.load(f)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.positions.get(key)
+
+    def set(self, key: str, pk: Any) -> None:
+        self.positions[key] = pk
+        self._write()
+
+    def clear(self, keys: list[str]) -> None:
+        """
+        Forgets ``keys`` only, so a run limited by --models keeps the resume
+        point of any other model.
+        """
+        for key in keys:
+            self.positions.pop(key, None)
+        self._write()
+
+    def _write(self) -> None:
+        if self.dry_run:
+            return
+        if not self.positions:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        # Write-then-rename so a kill mid-write never leaves a torn file
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.positions, f)
+        os.replace(tmp_path, self.path)
+
 
 class Command(BaseCommand):
-    help = "Backfills image_width and image_height for all existing images, and fixes missing alt attributes in HTML"
+    help = "Backfills image_width and image_height (and with --placeholders, image_placeholder) for all existing images, and fixes missing alt attributes in HTML"
 
-    def handle(self, *args: Any, **kwargs: Any) -> None:
-        models_to_check: list[tuple[_ModelType, str]] = [
-            (Project, "thumbnail"),
-            (Post, "image"),
-            (Card, "image"),
-            (Info, "profile_photo"),
-        ]
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--models",
+            nargs="+",
+            choices=sorted(MODELS),
+            default=list(MODELS),
+            help="Only process these models (default: all)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="Concurrent storage reads (default: 8)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Rows fetched, read and written per batch (default: 200)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=DEFAULT_CHECKPOINT,
+            help="Progress file used to resume an interrupted run",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore any saved progress and start from the first row",
+        )
+        parser.add_argument(
+            "--placeholders",
+            action="store_true",
+            help=(
+                "Also build missing image_placeholder values. This downloads and "
+                "decodes each image; generate_image_variants fills them as well"
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Read images and report what would change without writing anything",
+        )
 
-        total_updated = 0
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["workers"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--workers and --batch-size must be at least 1")
 
-        for model, field_name in models_to_check:
-            items = model.objects.all()
-            for item in items:
-                updated = False
-                update_fields: list[str] = []
-
-                # Fix missing alt attributes in HTML fields (body, description)
-                html_fields = ["body", "description"]
-                for html_field in html_fields:
-                    if hasattr(item, html_field):
-                        html_content = getattr(item, html_field)
-                        if html_content:
-                            # Add alt="" to <img> if not present
-                            new_html, count = re.subn(
-                                r"<img(?![^>]*\balt=)[^>]*>",
-                                lambda m: m.group(0).replace(
-                                    "<img", '<img alt="Embedded image"'
-                                ),
-                                html_content,
-                                flags=re.IGNORECASE,
-                            )
-                            if count > 0:
-                                setattr(item, html_field, new_html)
-                                update_fields.append(html_field)
-                                updated = True
-
-                image_field = getattr(item, field_name)
-
-                # Check if image exists and dimensions are missing
-                if image_field and (not item.image_width or not item.image_height):  # type: ignore[attr-defined]
-                    try:
-                        width: int = image_field.width
-                        height: int = image_field.height
-
-                        item.image_width = width  # type: ignore[attr-defined]
-                        item.image_height = height  # type: ignore[attr-defined]
-
-                        update_fields.extend(["image_width", "image_height"])
-                        updated = True
-                    except Exception as e:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f"Failed to read dimensions for {model.__name__} {item.pk}: {e}"
-                            )
-                        )
+        self.dry_run: bool = options["dry_run"]
+        self.placeholders: bool = options["placeholders"]
+        self.stats: dict[str, int] = defaultdict(int)
+        checkpoint = Checkpoint(options["checkpoint"], self.dry_run)
+        if options["restart"]:
+            checkpoint.clear(options["models"])
 
-                if updated:
-                    try:
-                        item.save(update_fields=update_fields)
-                        self.stdout.write(
-                            self.style.SUCCESS(
-                                f"Updated {model.__name__} {item.pk}: Fields {update_fields}"
-                            )
-                        )
-                        total_updated += 1
-                    except Exception as e:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f"Failed to update {model.__name__} {item.pk}: {e}"
-                            )
-                        )
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=options["workers"], thread_name_prefix="backfill"
+        ) as pool:
+            for key in options["models"]:
+                model, field_name = MODELS[key]
+                self.backfill_model(
+                    model, field_name, key, pool, checkpoint, options["batch_size"]
+                )
+        elapsed = time.perf_counter() - start
+
+        # Finished cleanly: the next run of these models should start over
+        checkpoint.clear(options["models"])
 
+        verb = "Would update" if self.dry_run else "Successfully updated"
+        rate = self.stats["images"] / elapsed if elapsed else 0.0
         self.stdout.write(
-            self.style.SUCCESS(f"Successfully updated {total_updated} items.")
+            self.style.SUCCESS(
+                f"{verb} {self.stats['updated']} items. Scanned {self.stats['scanned']} rows, "
+                f"read {self.stats['images']} images ({self.stats['failed']} failed) "
+                f"in {elapsed:.1f}s ({rate:.1f} images/s)."
+            )
+        )
+
+    def backfill_model(
+        self,
+        model: _ModelType,
+        field_name: str,
+        key: str,
+        pool: ThreadPoolExecutor,
+        checkpoint: Checkpoint,
+        batch_size: int,
+    ) -> None:
+        field_names = {f.name for f in model._meta.concrete_fields}
+        html_fields = [name for name in HTML_FIELDS if name in field_names]
+
+        # Plain rows rather than instances: ImageField's post_init handler
+        # would otherwise read every image missing its dimensions, serially,
+        # while the row is being loaded
+        queryset = model.objects.order_by("pk").values(
+            "pk", field_name, "image_width", "image_height", "image_placeholder", *html_fields
         )
+        resume_after = checkpoint.get(key)
+        if resume_after is not None:
+            queryset = queryset.filter(pk__gt=resume_after)
+            self.stdout.write(f"Resuming {model.__name__} after pk {resume_after}")
+
+        batch: list[dict[str, Any]] = []
+        changed = False
+        for row in queryset.iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                changed |= self.process_batch(model, field_name, html_fields, batch, pool)
+                checkpoint.set(key, batch[-1]["pk"])
+                batch = []
+        if batch:
+            changed |= self.process_batch(model, field_name, html_fields, batch, pool)
+            checkpoint.set(key, batch[-1]["pk"])
+
+        if changed and not self.dry_run:
+            bump_after_bulk(model)
+
+    def process_batch(
+        self,
+        model: _ModelType,
+        field_name: str,
+        html_fields: list[str],
+        batch: list[dict[str, Any]],
+        pool: ThreadPoolExecutor,
+    ) -> bool:
+        storage = model._meta.get_field(field_name).storage  # type: ignore[attr-defined]
+        changes: dict[Any, dict[str, Any]] = defaultdict(dict)
+        pending: list[tuple[Any, Future[tuple[int, int, str]], bool, bool]] = []
+
+        for row in batch:
+            self.stats["scanned"] += 1
+
+            # Fix missing alt attributes in HTML fields. Tags only, so the
+            # plain-text columns Post derives from body stay valid.
+            for html_field in html_fields:
+                html_content = row[html_field]
+                if html_content:
+                    new_html, count = fix_missing_alt(html_content)
+                    if count > 0:
+                        changes[row["pk"]][html_field] = new_html
+
+            image_name = row[field_name]
+            needs_dimensions = not row["image_width"] or not row["image_height"]
+            needs_placeholder = self.placeholders and not row["image_placeholder"]
+
+            if image_name and (needs_dimensions or needs_placeholder):
+                future = pool.submit(read_image, storage, image_name, needs_placeholder)
+                pending.append((row["pk"], future, needs_dimensions, needs_placeholder))
+
+        for pk, future, needs_dimensions, needs_placeholder in pending:
+            self.stats["images"] += 1
+            try:
+                width, height, placeholder = future.result()
+            except Exception as e:
+                self.stats["failed"] += 1
+                self.stdout.write(
+                    self.style.ERROR(f"Failed to read image for {model.__name__} {pk}: {e}")
+                )
+                continue
+
+            if needs_placeholder and placeholder:
+                changes[pk]["image_placeholder"] = placeholder
+            if needs_dimensions:
+                changes[pk].update(image_width=width, image_height=height)
+
+        # One bulk_update per distinct field set, so rows are never rewritten
+        # with columns they did not change
+        groups: dict[tuple[str, ...], list[models.Model]] = defaultdict(list)
+        for pk, values in changes.items():
+            if values:
+                groups[tuple(sorted(values))].append(model(pk=pk, **values))
+
+        verb = "Would update" if self.dry_run else "Updated"
+        for item_fields, items in groups.items():
+            if not self.dry_run:
+                try:
+                    with transaction.atomic():
+                        model.objects.bulk_update(items, list(item_fields))  # type: ignore[attr-defined]
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f"Failed to update {len(items)} {model.__name__} rows: {e}"
+                        )
+                    )
+                    continue
+            self.stats["updated"] += len(items)
+            for item in items:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{verb} {model.__name__} {item.pk}: Fields {list(item_fields)}"
+                    )
+                )
+
+        return bool(groups)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Q
+
+from config.cache import bump_after_bulk
+from info.models import Resume, read_file_metadata
+
+
+class Command(BaseCommand):
+    help = "Reads each resume file from storage once and stores its size, checksum, content type and page count"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every resume, not only rows with missing metadata",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        resumes = Resume.objects.exclude(file="").exclude(file__isnull=True)
+        if not options["all"]:
+            resumes = resumes.filter(Q(file_size__isnull=True) | Q(checksum=""))
+
+        total_updated = 0
+        for resume in resumes:
+            try:
+                with resume.file.open("rb") as file_handle:
+                    metadata = read_file_metadata(file_handle)
+            except Exception as e:
+                self.stdout.write(
+                    self.style.ERROR(f"Failed to read resume {resume.pk} ({resume.file.name}): {e}")
+                )
+                continue
+
+            # update() rather than save(): save() would re-run the activation logic
+            Resume.objects.filter(pk=resume.pk).update(**metadata)
+            total_updated += 1
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Updated resume {resume.pk}: {metadata['file_size']:,} bytes, "
+                    f"{metadata['page_count'] or 'unknown'} page(s)"
+                )
+            )
+
+        if total_updated:
+            bump_after_bulk(Resume)
+        self.stdout.write(self.style.SUCCESS(f"Successfully updated {total_updated} resumes."))
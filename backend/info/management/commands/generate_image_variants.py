@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from blog.models import Post
+from config.images import refresh_variants
+from info.models import Info
+from projects.models import Project
+from wallet.models import Card
+
+
+class Command(BaseCommand):
+    help = "Generates responsive image variants for images uploaded before the variant pipeline, or regenerates all with --force"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate variants even where the manifest is up to date",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        models_to_check: list[tuple[Any, str]] = [
+            (Project, "thumbnail"),
+            (Post, "image"),
+            (Card, "image"),
+            (Info, "profile_photo"),
+        ]
+
+        total_updated = 0
+        for model, field_name in models_to_check:
+            pks = list(
+                model.objects.exclude(**{f"{field_name}__isnull": True})
+                .exclude(**{field_name: ""})
+                .values_list("pk", flat=True)
+            )
+            for pk in pks:
+                try:
+                    if refresh_variants(model, pk, field_name, force=options["force"]):
+                        total_updated += 1
+                        self.stdout.write(
+                            self.style.SUCCESS(f"Generated variants for {model.__name__} {pk}")
+                        )
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f"Failed to generate variants for {model.__name__} {pk}: {e}"
+                        )
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully updated {total_updated} items.")
+        )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from info.datasets import DEFAULT_CHUNK_SIZE, DatasetLoader, merge_datasets, synthetic_dataset
+
+
+class Command(BaseCommand):
+    help = "Bulk-loads a JSON-described and/or synthetic dataset for every app; rows that already exist are skipped"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--from-json", help="Dataset file (see info/datasets.py for the shape)")
+        parser.add_argument("--posts", type=int, default=0, help="Synthetic blog posts to add")
+        parser.add_argument("--projects", type=int, default=0, help="Synthetic projects to add")
+        parser.add_argument("--cards", type=int, default=0, help="Synthetic wallet cards to add")
+        parser.add_argument("--contacts", type=int, default=0, help="Synthetic contact messages to add")
+        parser.add_argument("--tags", type=int, default=6, help="Project tags to spread over projects")
+        parser.add_argument(
+            "--categories", type=int, default=6, help="Blog categories to spread over posts"
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed; the same seed and sizes always generate the same rows",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Rows per INSERT and per transaction (default: {DEFAULT_CHUNK_SIZE})",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        datasets = []
+        if options["from_json"]:
+            try:
+                with open(options["from_json"]) as f:
+                    datasets.append(json.load(f))
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read {options['from_json']}: {e}")
+
+        sizes = {key: options[key] for key in ("posts", "projects", "cards", "contacts")}
+        if any(sizes.values()):
+            datasets.append(
+                synthetic_dataset(
+                    **sizes,
+                    tags=options["tags"],
+                    categories=options["categories"],
+                    seed=options["seed"],
+                )
+            )
+        if not datasets:
+            raise CommandError("Nothing to load: pass --from-json and/or sizes such as --posts 10000")
+
+        start = time.perf_counter()
+        loader = DatasetLoader(chunk_size=options["chunk_size"], log=self.stdout.write)
+        created = loader.load(merge_datasets(*datasets))
+        elapsed = time.perf_counter() - start
+
+        total = sum(created.values())
+        summary = ", ".join(f"{count} {name}" for name, count in created.items()) or "nothing new"
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {total} rows ({summary}) in {elapsed:.1f}s.")
+        )
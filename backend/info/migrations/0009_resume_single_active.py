@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:35
+
+from django.db import migrations, models
+
+
+def keep_newest_active(apps, schema_editor):
+    # Older code could leave several rows active; keep the one get_active_resume() served
+    Resume = apps.get_model('info', 'Resume')
+    newest = Resume.objects.filter(is_active=True).order_by('-uploaded_at').first()
+    if newest is not None:
+        Resume.objects.filter(is_active=True).exclude(pk=newest.pk).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('info', '0008_resume_file_metadata'),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_newest_active, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='resume',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('is_active',), name='info_resume_single_active'),
+        ),
+    ]
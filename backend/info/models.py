@@ -1,12 +1,104 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import mimetypes
+import re
 from typing import Any, Optional
-from django.db import models
+from django.db import models, transaction
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.utils import timezone
+
+from config.cache import bump_after_bulk, get_generations
+from config.image_probe import ProbedImageField
 
 logger = logging.getLogger(__name__)
 
+# The active resume is read on every view/download/status request, so its row
+# is cached under the Resume generation: any save, delete or activation bumps
+# the generation and the next read repopulates. Each process also keeps the
+# last row it read, so the common case is a single generation lookup.
+ACTIVE_RESUME_KEY = "resume:active:{generation}"
+ACTIVE_RESUME_TTL = 60 * 60 * 24
+# (generation, field values) of the active resume; empty values mean none
+_active_resume: Optional[tuple[int, dict[str, Any]]] = None
+
+# Uncompressed PDF objects whose value is a dictionary ("12 0 obj << ... >>"),
+# allowing two levels of nested dictionaries inside it
+_PDF_OBJECT_RE = re.compile(
+    rb"(?<!\d)(\d+)\s+\d+\s+obj\s*<<((?:[^<>]|<<(?:[^<>]|<<[^<>]*>>)*>>)*)>>"
+)
+_PDF_PAGES_RE = re.compile(rb"/Type\s*/Pages(?![a-zA-Z])")
+_PDF_CATALOG_RE = re.compile(rb"/Type\s*/Catalog(?![a-zA-Z])")
+_PDF_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+_PDF_ROOT_REF_RE = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+# Page tree nodes longer than this straddling a chunk boundary are missed
+_PDF_OVERLAP = 4096
+
+
+def _pdf_page_count(pages: dict[bytes, tuple[int, bool]], root: Optional[bytes]) -> Optional[int]:
+    """
+    /Count of the root page tree node: the one the catalog points at, or else
+    the only /Pages node without a /Parent.
+    """
+    if root is not None and root in pages:
+        return pages[root][0]
+    roots = {count for count, has_parent in pages.values() if not has_parent}
+    return roots.pop() if len(roots) == 1 else None
+
+
+def read_file_metadata(file: File) -> dict[str, Any]:  # type: ignore[type-arg]
+    """
+    Reads a file once and returns its size, SHA-256, content type and (for
+    PDFs) page count, ready to store on the model. The page count is the
+    /Count of the root /Pages node, so incremental saves that append new
+    copies of page objects don't inflate it: later copies of an object
+    replace earlier ones, as they do for a PDF reader. PDFs that keep the
+    page tree in compressed object streams report None rather than a guess.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    # object number -> (/Count, has /Parent) of each /Pages node, last copy wins
+    pages: dict[bytes, tuple[int, bool]] = {}
+    root: Optional[bytes] = None
+    tail = b""
+    file.seek(0)
+    for chunk in file.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+        # Carry the end of the previous chunk so an object split across two
+        # chunks is still seen; one seen twice in the overlap is just stored again
+        window = tail + chunk
+        for match in _PDF_OBJECT_RE.finditer(window):
+            if tail and match.start() == 0:
+                continue  # may be the cut-off end of a longer object number
+            number, body = match.groups()
+            if _PDF_PAGES_RE.search(body):
+                count = _PDF_COUNT_RE.search(body)
+                if count is not None:
+                    pages[number] = (int(count.group(1)), b"/Parent" in body)
+            elif _PDF_CATALOG_RE.search(body):
+                ref = _PDF_ROOT_REF_RE.search(body)
+                if ref is not None:
+                    root = ref.group(1)
+        tail = window[-_PDF_OVERLAP:]
+    file.seek(0)
+
+    # Trust the extension over the browser-supplied type of an upload
+    content_type = (
+        mimetypes.guess_type(file.name or "")[0]
+        or getattr(getattr(file, "file", file), "content_type", None)
+        or "application/octet-stream"
+    )
+    return {
+        "file_size": size,
+        "checksum": digest.hexdigest(),
+        "content_type": content_type,
+        "page_count": _pdf_page_count(pages, root) or None,
+    }
+
 
 class Info(models.Model):
     site_header = models.CharField(
@@ -21,13 +113,19 @@ class Info(models.Model):
     )
     image_width = models.PositiveIntegerField(null=True, blank=True)
     image_height = models.PositiveIntegerField(null=True, blank=True)
-    profile_photo = models.ImageField(
+    # Tiny inline WebP (data URI) painted until the image loads; see config/images.py
+    image_placeholder = models.CharField(
+        max_length=512, blank=True, default="", editable=False
+    )
+    profile_photo = ProbedImageField(
         upload_to="profile_photos/",
         blank=True,
         null=True,
         width_field="image_width",
         height_field="image_height",
     )
+    # Manifest of responsive copies of profile_photo, written by config/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     greeting = models.CharField(
         max_length=100, default="Hello!", help_text="Homepage Greeting"
     )
@@ -102,11 +200,26 @@ class Resume(models.Model):
     is_active = models.BooleanField(
         default=True, help_text="Only one resume can be active at a time"
     )
+    # Captured from the upload in save() so read paths never hit storage for
+    # them (GCS metadata calls are a network round-trip each)
+    file_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    checksum = models.CharField(max_length=64, blank=True, editable=False)
+    content_type = models.CharField(max_length=100, blank=True, editable=False)
+    page_count = models.PositiveIntegerField(null=True, blank=True, editable=False)
+
+    FILE_METADATA_FIELDS = ("file_size", "checksum", "content_type", "page_count")
 
     class Meta:
         verbose_name = "Resume"
         verbose_name_plural = "Resume Uploads"
         ordering = ["-uploaded_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["is_active"],
+                condition=models.Q(is_active=True),
+                name="info_resume_single_active",
+            )
+        ]
 
     def __str__(self) -> str:
         status = "ACTIVE" if self.is_active else "Inactive"
@@ -119,16 +232,35 @@ class Resume(models.Model):
         if not self.file:
             raise ValidationError({"file": "Resume file is required."})
 
+    def validate_constraints(self, exclude: Optional[set[str]] = None) -> None:
+        # Saving an active resume switches the previous one off, so the
+        # single-active constraint is resolved in save() rather than rejected
+        super().validate_constraints(exclude={*(exclude or ()), "is_active"})
+
     def save(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
         is_new = self.pk is None
         try:
-            if self.is_active:
-                Resume.objects.exclude(pk=self.pk).update(is_active=False)
-                logger.info(
-                    f"Deactivated other resumes for new active resume: {self.file.name if self.file else 'N/A'}"
-                )
             self.full_clean()
-            super().save(*args, **kwargs)  # type: ignore[arg-type]
+            # A FieldFile that isn't committed yet holds a fresh upload
+            if self.file and not self.file._committed:
+                self.capture_file_metadata(self.file)
+                update_fields = kwargs.get("update_fields")
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, *self.FILE_METADATA_FIELDS}
+            with transaction.atomic():
+                if self.is_active:
+                    # Touches at most the one active row; the partial unique
+                    # index rejects the save if two would end up active
+                    deactivated = (
+                        Resume.objects.filter(is_active=True)
+                        .exclude(pk=self.pk)
+                        .update(is_active=False)
+                    )
+                    if deactivated:
+                        logger.info(
+                            f"Deactivated previous resume for new active resume: {self.file.name if self.file else 'N/A'}"
+                        )
+                super().save(*args, **kwargs)  # type: ignore[arg-type]
             action = "uploaded" if is_new else "updated"
             logger.info(
                 f"Resume {action}: {self.file.name if self.file else 'N/A'} (Active: {self.is_active})"
@@ -152,10 +284,21 @@ class Resume(models.Model):
         """Returns the filename to be used when downloading the resume."""
         return "Rajiv_Wallace_Resume.pdf"
 
+    def capture_file_metadata(self, file: File) -> None:  # type: ignore[type-arg]
+        for field, value in read_file_metadata(file).items():
+            setattr(self, field, value)
+
+    @property
+    def etag(self) -> str:
+        """Strong validator for the served file, from its content hash when known."""
+        if self.checksum:
+            return f'"{self.checksum[:32]}"'
+        return f'"resume-{self.pk}-{int(self.updated_at.timestamp())}"'
+
     @property
     def file_size_display(self) -> str:
-        if self.file and self.file.size:
-            size: int = self.file.size
+        if self.file and self.file_size:
+            size: int = self.file_size
             if size < 1024:
                 return f"{size} bytes"
             elif size < 1024 * 1024:
@@ -179,18 +322,55 @@ class Resume(models.Model):
 
     @classmethod
     def get_active_resume(cls) -> Optional["Resume"]:
-        try:
-            return cls.objects.filter(is_active=True).latest("uploaded_at")
-        except cls.DoesNotExist:
+        """
+        Returns the active resume, normally without a database query. Each
+        call gets its own instance, so callers may open its file freely.
+        """
+        global _active_resume
+
+        generation = get_generations([cls._meta.label_lower])[cls._meta.label_lower]
+        local = _active_resume
+        if local is not None and local[0] == generation:
+            values = local[1]
+        else:
+            key = ACTIVE_RESUME_KEY.format(generation=generation)
+            values = cache.get(key)
+            if values is None:
+                resume = cls.objects.filter(is_active=True).first()
+                values = (
+                    {
+                        field.attname: field.get_prep_value(getattr(resume, field.attname))
+                        for field in cls._meta.concrete_fields
+                    }
+                    if resume is not None
+                    else {}
+                )
+                cache.set(key, values, timeout=ACTIVE_RESUME_TTL)
+            _active_resume = (generation, values)
+
+        if not values:
             return None
+        return cls.from_db("default", list(values), list(values.values()))
 
     @classmethod
     def activate_resume(cls, resume_id: int) -> "Resume":
+        """
+        Makes ``resume_id`` the active resume in one transaction: the current
+        active row is switched off before the new one is switched on, since
+        the partial unique index is checked row by row.
+        """
         try:
-            cls.objects.update(is_active=False)
-            resume = cls.objects.get(pk=resume_id)
-            resume.is_active = True  # type: ignore[assignment]
-            resume.save()
+            with transaction.atomic():
+                resume = cls.objects.select_for_update().get(pk=resume_id)
+                if not resume.is_active:
+                    now = timezone.now()
+                    cls.objects.filter(is_active=True).update(
+                        is_active=False, updated_at=now
+                    )
+                    cls.objects.filter(pk=resume_id).update(is_active=True, updated_at=now)
+                    resume.is_active = True  # type: ignore[assignment]
+                    resume.updated_at = now  # type: ignore[assignment]
+                bump_after_bulk(cls)
             logger.info(
                 f"Resume activated: {resume.file.name if resume.file else 'N/A'}"
             )
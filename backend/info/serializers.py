@@ -7,6 +7,8 @@ from rest_framework import serializers
 from rest_framework.request import Request
 from django.urls import reverse
 
+from config.images import ImageSrcsetField
+
 from .models import Info, Resume
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,7 @@ logger = logging.getLogger(__name__)
 
 class InfoSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
     profile_photo_url = serializers.SerializerMethodField()
+    profile_photo_srcset = ImageSrcsetField("profile_photo")
 
     class Meta:
         model = Info
@@ -22,8 +25,10 @@ class InfoSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
             "site_header",
             "professional_title",
             "profile_photo_url",
+            "profile_photo_srcset",
             "image_width",
             "image_height",
+            "image_placeholder",
             "greeting",
             "bio",
             "github",
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from .models import Resume
+
+# ============================================================================
+# RESUME FILE SERVING
+# ============================================================================
+# RESUME_SERVE_MODE picks who moves the PDF bytes:
+#   "redirect" - 302 to the storage URL (public GCS objects); GCS answers
+#                Range/HEAD itself
+#   "accel"    - empty response with X-Accel-Redirect; nginx streams the file
+#                from its internal RESUME_ACCEL_PREFIX location, Range included
+#   "stream"   - Django streams it (local development), with single-range
+#                support so the behaviour matches the other modes
+#   "auto"     - "redirect" when storage returns absolute URLs, else "stream"
+# In every mode If-None-Match / If-Modified-Since are answered with a 304
+# before storage is touched.
+
+#
+# "accel" needs the files on a disk nginx can read: RESUME_ACCEL_PREFIX is
+# aliased onto /usr/share/nginx/html/media/, which must be the MEDIA_ROOT
+# volume. Storage that hands out absolute URLs (GCS, which production
+# requires) has no such disk, so "accel" falls back to "redirect" there.
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Bytes read from storage per chunk when streaming a range
+RANGE_CHUNK_SIZE = 64 * 1024
+
+
+def get_serve_mode(resume: Resume) -> str:
+    mode: str = getattr(settings, "RESUME_SERVE_MODE", "auto")
+    url = resume.file_url or ""
+    is_remote = url.startswith(("http://", "https://"))
+    if mode == "auto" or (mode == "accel" and is_remote):
+        return "redirect" if is_remote else "stream"
+    return mode
+
+
+def parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Parses a single "bytes=start-end" range into inclusive offsets. Returns
+    None for headers we ignore (multi-range or malformed), which per RFC 9110
+    means serving the full file. Raises ValueError if unsatisfiable.
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    start_text, end_text = match.groups()
+    if not start_text and not end_text:
+        return None
+    if not start_text:
+        # Suffix range: the last N bytes
+        length = int(end_text)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(start_text)
+    end = min(int(end_text), size - 1) if end_text else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+def _disposition(resume: Resume, as_attachment: bool) -> str:
+    kind = "attachment" if as_attachment else "inline"
+    return f'{kind}; filename="{resume.download_filename}"'
+
+
+def _stream(
+    request: HttpRequest, resume: Resume, as_attachment: bool
+) -> HttpResponseBase:
+    # Rows uploaded before the metadata columns existed fall back to storage
+    # until `manage.py backfill_resume_metadata` has run
+    size: int = resume.file_size if resume.file_size is not None else resume.file.size
+    headers = {
+        "Content-Type": resume.content_type or "application/pdf",
+        "Content-Disposition": _disposition(resume, as_attachment),
+        "Accept-Ranges": "bytes",
+    }
+
+    try:
+        byte_range = parse_range(request.headers.get("Range", ""), size)
+    except ValueError:
+        return HttpResponse(
+            status=416, headers={**headers, "Content-Range": f"bytes */{size}"}
+        )
+
+    if request.method == "HEAD":
+        return HttpResponse(headers={**headers, "Content-Length": str(size)})
+
+    file_handle = resume.file.open("rb")
+    if byte_range is None:
+        headers.pop("Content-Disposition")
+        return FileResponse(
+            file_handle,
+            as_attachment=as_attachment,
+            filename=resume.download_filename,
+            headers=headers,
+        )
+
+    start, end = byte_range
+    file_handle.seek(start)
+    return StreamingHttpResponse(
+        _read_range(file_handle, end - start + 1),
+        status=206,
+        headers={
+            **headers,
+            "Content-Range": f"bytes {start}-{end}/{size}",
+            "Content-Length": str(end - start + 1),
+        },
+    )
+
+
+def _read_range(file_handle: Any, length: int) -> Iterator[bytes]:
+    # A "bytes=0-" range is the whole file; never hold more than a chunk
+    try:
+        while length > 0:
+            chunk = file_handle.read(min(RANGE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file_handle.close()
+
+
+def serve_resume(
+    request: HttpRequest, resume: Resume, as_attachment: bool
+) -> HttpResponseBase:
+    """
+    Builds the response for the resume view/download endpoints. Raises
+    FileNotFoundError if streaming and the file is missing from storage.
+    """
+    etag = resume.etag
+    last_modified = int(resume.updated_at.timestamp())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        mode = get_serve_mode(resume)
+        if mode == "redirect":
+            response = HttpResponseRedirect(resume.file.url)
+        elif mode == "accel":
+            response = HttpResponse(
+                headers={
+                    "Content-Type": resume.content_type or "application/pdf",
+                    "Content-Disposition": _disposition(resume, as_attachment),
+                    "X-Accel-Redirect": f"{settings.RESUME_ACCEL_PREFIX}{resume.file.name}",
+                }
+            )
+        else:
+            response = _stream(request, resume, as_attachment)
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, public=True, max_age=settings.API_BROWSER_TTL)
+    return response
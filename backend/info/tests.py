@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Resume, read_file_metadata
+
+PDF_BYTES = (
+    b"%PDF-1.4\n"
+    + b"1 0 obj << /Type /Pages /Count 2 >> endobj\n"
+    + b"2 0 obj << /Type /Page >> endobj\n"
+    + b"3 0 obj << /Type/Page >> endobj\n"
+    + b"0123456789" * 50
+    + b"\n%%EOF\n"
+)
+# PDF_BYTES saved incrementally: page 3 dropped, pages re-written, new catalog
+INCREMENTAL_PDF_BYTES = (
+    PDF_BYTES
+    + b"4 0 obj << /Type /Catalog /Pages 5 0 R >> endobj\n"
+    + b"5 0 obj << /Type /Pages /Kids [2 0 R] /Count 1 >> endobj\n"
+    + b"2 0 obj << /Type /Page /Parent 5 0 R /Resources << /Font << /F1 6 0 R >> >> >> endobj\n"
+    + b"3 0 obj << /Type /Page /Parent 5 0 R >> endobj\n"
+    + b"%%EOF\n"
+)
+
+
+class ResumeServingTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings_override = self.settings(MEDIA_ROOT=media.name, RESUME_SERVE_MODE="stream")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.resume = Resume.objects.create(
+            file=SimpleUploadedFile("resume.pdf", PDF_BYTES, content_type="application/pdf")
+        )
+        self.view_url = reverse("resume-view")
+        self.download_url = reverse("resume-download")
+
+    def test_streams_full_file_with_validators(self) -> None:
+        response = self.client.get(self.download_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), PDF_BYTES)
+        self.assertEqual(response["Content-Length"], str(len(PDF_BYTES)))
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(response["ETag"], self.resume.etag)
+        self.assertIn("attachment;", response["Content-Disposition"])
+
+    def test_range_requests(self) -> None:
+        response = self.client.get(self.view_url, HTTP_RANGE="bytes=0-8")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), PDF_BYTES[:9])
+        self.assertEqual(response["Content-Range"], f"bytes 0-8/{len(PDF_BYTES)}")
+        self.assertEqual(response["Content-Length"], "9")
+
+        response = self.client.get(self.view_url, HTTP_RANGE="bytes=-7")
+        self.assertEqual(b"".join(response.streaming_content), PDF_BYTES[-7:])
+
+        response = self.client.get(self.view_url, HTTP_RANGE=f"bytes={len(PDF_BYTES)}-")
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+
+    @mock.patch("info.serving.RANGE_CHUNK_SIZE", 64)
+    def test_open_ended_range_is_streamed_in_chunks(self) -> None:
+        response = self.client.get(self.view_url, HTTP_RANGE="bytes=0-")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        chunks = list(response.streaming_content)
+        self.assertTrue(all(len(chunk) <= 64 for chunk in chunks))
+        self.assertEqual(b"".join(chunks), PDF_BYTES)
+
+    def test_head_and_if_none_match(self) -> None:
+        response = self.client.head(self.view_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Length"], str(len(PDF_BYTES)))
+        self.assertEqual(response.content, b"")
+
+        response = self.client.get(self.view_url, HTTP_IF_NONE_MATCH=self.resume.etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_accel_mode_hands_off_to_nginx(self) -> None:
+        with self.settings(RESUME_SERVE_MODE="accel"):
+            response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected-media/{self.resume.file.name}")
+        self.assertEqual(response.content, b"")
+
+    def test_accel_mode_falls_back_to_redirect_for_remote_storage(self) -> None:
+        remote_url = "https://storage.googleapis.com/bucket/resumes/resume.pdf"
+        with self.settings(RESUME_SERVE_MODE="accel"), mock.patch.object(
+            Resume, "file_url", remote_url
+        ):
+            response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertNotIn("X-Accel-Redirect", response)
+
+    def test_redirect_mode_points_at_storage(self) -> None:
+        with self.settings(RESUME_SERVE_MODE="redirect"):
+            response = self.client.get(self.view_url)
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(response["Location"], self.resume.file.url)
+        self.assertEqual(response["ETag"], self.resume.etag)
+
+    def test_upload_captures_file_metadata(self) -> None:
+        self.assertEqual(self.resume.file_size, len(PDF_BYTES))
+        self.assertEqual(self.resume.checksum, hashlib.sha256(PDF_BYTES).hexdigest())
+        self.assertEqual(self.resume.content_type, "application/pdf")
+        self.assertEqual(self.resume.page_count, 2)
+
+    def test_status_and_headers_never_touch_storage_metadata(self) -> None:
+        with mock.patch.object(FileSystemStorage, "size", side_effect=AssertionError("storage hit")):
+            response = self.client.get(reverse("resume-status"))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["active_resume_pages"], 2)
+
+            response = self.client.head(self.view_url)
+            self.assertEqual(response["Content-Length"], str(len(PDF_BYTES)))
+
+    def test_backfill_command_fills_missing_metadata(self) -> None:
+        Resume.objects.update(file_size=None, checksum="", content_type="", page_count=None)
+
+        call_command("backfill_resume_metadata", stdout=StringIO())
+
+        self.resume.refresh_from_db()
+        self.assertEqual(self.resume.file_size, len(PDF_BYTES))
+        self.assertEqual(self.resume.checksum, hashlib.sha256(PDF_BYTES).hexdigest())
+        self.assertEqual(self.resume.content_type, "application/pdf")
+        self.assertEqual(self.resume.page_count, 2)
+
+
+class ReadFileMetadataTests(TestCase):
+    def metadata(self, content: bytes, name: str = "resume.pdf") -> dict[str, object]:
+        return read_file_metadata(SimpleUploadedFile(name, content))
+
+    def test_page_count_comes_from_the_root_page_tree(self) -> None:
+        self.assertEqual(self.metadata(PDF_BYTES)["page_count"], 2)
+
+    def test_incremental_save_is_not_double_counted(self) -> None:
+        self.assertEqual(self.metadata(INCREMENTAL_PDF_BYTES)["page_count"], 1)
+
+    def test_objects_split_across_chunks_are_read(self) -> None:
+        file = File(BytesIO(INCREMENTAL_PDF_BYTES), name="resume.pdf")
+        with mock.patch.object(File, "DEFAULT_CHUNK_SIZE", 7):
+            self.assertEqual(read_file_metadata(file)["page_count"], 1)
+
+    def test_compressed_page_tree_reports_no_page_count(self) -> None:
+        content = (
+            b"%PDF-1.5\n"
+            + b"1 0 obj << /Type /ObjStm /N 3 /First 12 /Filter /FlateDecode /Length 9 >>\n"
+            + b"stream\nx\x9c\x03\x00\x00\x00\x00\x01\nendstream endobj\n"
+            + b"%%EOF\n"
+        )
+        self.assertIsNone(self.metadata(content)["page_count"])
+
+    def test_non_pdf_has_no_page_count(self) -> None:
+        self.assertIsNone(self.metadata(b"plain text", name="resume.txt")["page_count"])
+
+
+class ActiveResumePointerTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings_override = self.settings(MEDIA_ROOT=media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first = Resume.objects.create(file=SimpleUploadedFile("first.pdf", PDF_BYTES))
+            self.second = Resume.objects.create(file=SimpleUploadedFile("second.pdf", PDF_BYTES))
+
+    def test_saving_an_active_resume_deactivates_the_previous_one(self) -> None:
+        self.assertEqual(list(Resume.objects.filter(is_active=True)), [self.second])
+
+    def test_only_one_row_can_be_active(self) -> None:
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Resume.objects.filter(pk=self.first.pk).update(is_active=True)
+
+    def test_lookup_is_served_from_cache(self) -> None:
+        self.assertEqual(Resume.get_active_resume(), self.second)
+        with self.assertNumQueries(0):
+            resume = Resume.get_active_resume()
+        self.assertEqual(resume, self.second)
+        self.assertEqual(resume.file.name, self.second.file.name)
+        self.assertIsNot(resume, Resume.get_active_resume())
+
+    def test_activation_swaps_and_invalidates(self) -> None:
+        self.assertEqual(Resume.get_active_resume(), self.second)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Resume.activate_resume(self.first.pk)
+
+        self.assertEqual(list(Resume.objects.filter(is_active=True)), [self.first])
+        self.assertEqual(Resume.get_active_resume(), self.first)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Resume.objects.filter(pk=self.first.pk).get().delete()
+        self.assertIsNone(Resume.get_active_resume())
+
+
+@override_settings(SNAPSHOT_ASYNC_REBUILD=False)
+class DatasetLoaderTests(TestCase):
+    def test_synthetic_load_is_bulk_and_idempotent(self) -> None:
+        from blog.models import Post
+        from projects.models import Project
+
+        call_command(
+            "load_dataset", posts=40, projects=10, cards=5, contacts=3, stdout=StringIO()
+        )
+
+        self.assertEqual(Post.objects.count(), 40)
+        self.assertEqual(Project.objects.count(), 10)
+        post = Post.objects.prefetch_related("categories").first()
+        assert post is not None
+        self.assertTrue(post.slug)
+        self.assertTrue(post.excerpt)
+        self.assertGreaterEqual(post.categories.count(), 1)
+        self.assertFalse(Project.objects.filter(tags__isnull=True).exists())
+
+        out = StringIO()
+        call_command("load_dataset", posts=40, projects=10, cards=5, contacts=3, stdout=out)
+        self.assertIn("Created 0 rows", out.getvalue())
+        self.assertEqual(Post.objects.count(), 40)
+
+    def test_contacts_from_one_sender_are_all_loaded(self) -> None:
+        from contacts.models import Contact
+
+        from .datasets import load_dataset
+
+        dataset = {
+            "contacts": [
+                {"name": "Ada", "email": "ada@example.com", "message": message}
+                for message in ("Hello", "Following up", "Thanks!")
+            ]
+        }
+        self.assertEqual(load_dataset(dataset), {"Contact": 3})
+        self.assertEqual(load_dataset(dataset), {})
+        self.assertEqual(Contact.objects.filter(email="ada@example.com").count(), 3)
+
+    def test_query_count_does_not_grow_with_dataset_size(self) -> None:
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from .datasets import load_dataset, synthetic_dataset
+
+        # Tags and categories first, so both measured runs only add rows
+        load_dataset(synthetic_dataset())
+        counts = []
+        # Small enough that SQLite's 999-parameter limit doesn't split INSERTs
+        for seed, size in ((1, 10), (2, 40)):
+            dataset = synthetic_dataset(posts=size, projects=size, seed=seed)
+            # Distinct rows per run, shared tags/categories
+            for row in dataset["posts"] + dataset["projects"]:
+                row["title"] += f" run {seed}"
+            with CaptureQueriesContext(connection) as queries:
+                load_dataset(dataset)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_seed_data_links_demo_rows(self) -> None:
+        from blog.models import Post
+        from projects.models import Project
+
+        call_command("seed_data", stdout=StringIO())
+
+        portfolio = Project.objects.get(slug="portfolio-v2")
+        self.assertEqual(
+            sorted(portfolio.tags.values_list("name", flat=True)),
+            ["Backend", "Frontend", "Full Stack"],
+        )
+        journey = Post.objects.get(slug="my-journey-into-tech")
+        self.assertEqual(journey.reading_time, 1)
+        self.assertEqual(journey.categories.count(), 2)
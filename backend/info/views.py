@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import html
 import logging
-from typing import Any, Union
+from typing import Any, Optional, Union
+from urllib.parse import urljoin
 
-from django.http import FileResponse, HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
@@ -14,23 +14,31 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.request import Request
 
+from config.cache import versioned_cache_page
+from config.mixins import ConditionalGetMixin
+
 from .models import Info, Resume
 from .serializers import InfoSerializer, ResumeSerializer, ResumeListSerializer
+from .serving import serve_resume
 
 logger = logging.getLogger(__name__)
 
 
-@method_decorator(cache_page(settings.CACHE_TTL), name="dispatch")
-class InfoViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
+@method_decorator(versioned_cache_page(Info), name="dispatch")
+class InfoViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
     queryset = Info.objects.all()
     serializer_class = InfoSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    last_modified_field = "updated_at"
+    cache_models = (Info,)
 
 
-@method_decorator(cache_page(settings.CACHE_TTL), name="dispatch")
-class ResumeViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
+@method_decorator(versioned_cache_page(Resume), name="dispatch")
+class ResumeViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
     queryset = Resume.objects.all().order_by("-uploaded_at")
     permission_classes = [IsAuthenticatedOrReadOnly]
+    last_modified_field = "updated_at"
+    cache_models = (Resume,)
 
     def get_serializer_class(self) -> type:
         if self.action == "list":
@@ -39,7 +47,7 @@ class ResumeViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
 
     def _serve_file(
         self, request: Request, as_attachment: bool
-    ) -> Union[FileResponse, Response]:
+    ) -> Union[HttpResponseBase, Response]:
         try:
             resume = Resume.get_active_resume()
             if not resume or not resume.is_file_accessible:
@@ -52,25 +60,11 @@ class ResumeViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
                 )
 
             try:
-                file_handle = resume.file.open("rb")
-
-                response: FileResponse = FileResponse(
-                    file_handle,
-                    content_type="application/pdf",
-                    as_attachment=as_attachment,
-                )
-
-                filename: str = resume.download_filename
-                if as_attachment:
-                    response["Content-Disposition"] = (
-                        f'attachment; filename="{filename}"'
-                    )
-                    response["Content-Length"] = resume.file.size
-                else:
-                    response["Content-Disposition"] = f'inline; filename="{filename}"'
-
+                # Redirects to storage or hands off to nginx where possible, so
+                # the PDF bytes don't pass through a gunicorn thread
+                response = serve_resume(request, resume, as_attachment)
                 logger.info(
-                    f"Resume served. Attachment: {as_attachment}, File: {resume.file.name}"
+                    f"Resume served ({response.status_code}). Attachment: {as_attachment}, File: {resume.file.name}"
                 )
                 return response
 
@@ -105,11 +99,11 @@ class ResumeViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
             )
 
     @action(detail=False, methods=["get"])
-    def view(self, request: Request) -> Union[FileResponse, Response]:
+    def view(self, request: Request) -> Union[HttpResponseBase, Response]:
         return self._serve_file(request, as_attachment=False)
 
     @action(detail=False, methods=["get"])
-    def download(self, request: Request) -> Union[FileResponse, Response]:
+    def download(self, request: Request) -> Union[HttpResponseBase, Response]:
         return self._serve_file(request, as_attachment=True)
 
     @action(detail=False, methods=["get"])
@@ -132,7 +126,10 @@ class ResumeViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
                         if active_resume.file
                         else None,
                         "active_resume_uploaded_at": active_resume.uploaded_at,
+                        # Cached at upload time; no storage round-trip
                         "active_resume_size": active_resume.file_size_display,
+                        "active_resume_pages": active_resume.page_count,
+                        "active_resume_checksum": active_resume.checksum or None,
                         "file_accessible": active_resume.is_file_accessible,
                     }
                 )
@@ -146,9 +143,11 @@ class ResumeViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
             )
 
 
-def seo_home_page(request: HttpRequest) -> HttpResponse:
-    info = Info.objects.first()
-
+def render_home_meta(info: Optional[Info], base_url: str) -> str:
+    """
+    Builds the OG/Twitter meta HTML for the homepage. Shared by the live view
+    and the prerender job (snapshots/seo.py).
+    """
     # og:title — mapped from info.site_header and info.professional_title
     site_header: str = info.site_header if info else "Rajiv Wallace"
     professional_title: str = info.professional_title if info else "Software Developer"
@@ -161,7 +160,7 @@ def seo_home_page(request: HttpRequest) -> HttpResponse:
     # og:image — mapped from info.profile_photo (GCS returns an absolute URL)
     image_url = ""
     if info and info.profile_photo:
-        image_url = request.build_absolute_uri(info.profile_photo.url)
+        image_url = urljoin(base_url, info.profile_photo.url)
 
     # Canonical URL — always the public frontend domain
     canonical_url = f"{settings.SITE_URL}/"
@@ -173,7 +172,7 @@ def seo_home_page(request: HttpRequest) -> HttpResponse:
     safe_image_url = html.escape(image_url)
     safe_canonical_url = html.escape(canonical_url)
 
-    response_html = f"""<!DOCTYPE html>
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -204,4 +203,13 @@ def seo_home_page(request: HttpRequest) -> HttpResponse:
     <p>{safe_description}</p>
 </body>
 </html>"""
-    return HttpResponse(response_html)
+
+
+@versioned_cache_page(Info)
+def seo_home_page(request: HttpRequest) -> HttpResponse:
+    """
+    Pre-rendered OG/Twitter meta HTML for the homepage, cached until Info changes.
+    """
+    return HttpResponse(
+        render_home_meta(Info.objects.first(), request.build_absolute_uri("/"))
+    )
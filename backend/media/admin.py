@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from django.contrib import admin
+
+from .models import MediaBlob
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    list_display = ("name", "digest", "created_at")
+    search_fields = ("name", "digest")
+    readonly_fields = ("name", "digest", "created_at")
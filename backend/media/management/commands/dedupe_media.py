@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import posixpath
+from collections import defaultdict
+from typing import Any, Iterator
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from config.images import VARIANT_DIR
+from media import references
+from media.models import MediaBlob
+
+IMAGE_EXTENSIONS = (".webp", ".jpg", ".jpeg", ".png", ".gif")
+
+
+def walk(storage: Any, path: str) -> Iterator[str]:
+    """
+    Yields every file name under ``path``, skipping generated variants.
+    """
+    directories, files = storage.listdir(path)
+    for filename in files:
+        if filename.lower().endswith(IMAGE_EXTENSIONS):
+            yield posixpath.join(path, filename) if path else filename
+    for directory in directories:
+        if directory != VARIANT_DIR:
+            yield from walk(storage, posixpath.join(path, directory) if path else directory)
+
+
+def file_digest(storage: Any, name: str) -> str:
+    digest = hashlib.sha256()
+    with storage.open(name, "rb") as f:
+        for chunk in f.chunks():
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Command(BaseCommand):
+    help = "Finds byte-identical images in media storage, points every reference at one copy and deletes the rest"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--prefix", default="", help="Only scan under this path (e.g. blog_images)")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report duplicates and references without changing anything",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        storage = default_storage
+        dry_run: bool = options["dry_run"]
+
+        groups: dict[str, list[str]] = defaultdict(list)
+        scanned = 0
+        for name in walk(storage, options["prefix"].strip("/")):
+            groups[file_digest(storage, name)].append(name)
+            scanned += 1
+
+        indexed = set(MediaBlob.objects.values_list("name", flat=True))
+        removed = rewritten = reclaimed = 0
+
+        for digest, names in groups.items():
+            if len(names) < 2:
+                continue
+            # Keep the copy new uploads already resolve to, else the oldest path
+            canonical = min(names, key=lambda n: (n not in indexed, n))
+            if canonical not in indexed and not dry_run:
+                # storage.delete() only guards indexed names, and the
+                # canonical copy is about to back several rows. ``digest`` is
+                # of the stored bytes, not of an upload, so it is not recorded.
+                references.protect(canonical)
+                indexed.add(canonical)
+            for duplicate in names:
+                if duplicate == canonical:
+                    continue
+                refs = references.references_to(duplicate)
+                size = storage.size(duplicate)
+                self.stdout.write(
+                    f"{duplicate} -> {canonical} ({len(refs)} reference(s), {size} bytes)"
+                )
+                if dry_run:
+                    removed += 1
+                    reclaimed += size
+                    continue
+
+                # One transaction per duplicate, so django_cleanup's on-commit
+                # deletes only run once every reference has moved
+                with transaction.atomic():
+                    for model, pk, field_name in refs:
+                        instance = model._default_manager.get(pk=pk)
+                        value = getattr(instance, field_name)
+                        if isinstance(value, str):
+                            setattr(
+                                instance,
+                                field_name,
+                                references.replace_name(value, duplicate, canonical),
+                            )
+                        else:
+                            setattr(instance, field_name, canonical)
+                        instance.save(update_fields=[field_name])
+                        rewritten += 1
+                    MediaBlob.objects.filter(name=duplicate).update(name=canonical)
+
+                if storage.exists(duplicate):
+                    storage.delete(duplicate)
+                removed += 1
+                reclaimed += size
+
+        verb = "Would remove" if dry_run else "Removed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Scanned {scanned} files. {verb} {removed} duplicates ({reclaimed} bytes), "
+                f"rewrote {rewritten} references."
+            )
+        )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mediablob',
+            name='digest',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from django.db import models
+
+
+class MediaBlob(models.Model):
+    """
+    Maps the SHA-256 of an uploaded image's original bytes to the WebP object
+    WebPOptimizedStorage stored for it, so uploading the same file again
+    reuses that object instead of encoding and uploading a copy.
+
+    A row without a digest only marks ``name`` as shared: dedupe_media points
+    files stored before the index existed at one copy, whose upload bytes are
+    unknown. Such a row never matches an upload, but storage.delete() still
+    guards the object like any other indexed name.
+    """
+
+    digest = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    name = models.CharField(max_length=255, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Media blob"
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.digest[:12] if self.digest else 'shared'})"
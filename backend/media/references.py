@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Any, Iterator, Optional
+from urllib.parse import quote
+
+from django.apps import apps
+from django.db import DatabaseError, IntegrityError, models
+from django_ckeditor_5.fields import CKEditor5Field
+
+from .models import MediaBlob
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONTENT INDEX
+# ============================================================================
+# WebPOptimizedStorage hashes every image it is about to convert. A hit in the
+# MediaBlob index returns the existing object's name, skipping both the encode
+# and the upload. Since one object can then back several rows, deleting goes
+# through references_to() first: a file is only removed once no FileField and
+# no rich-text field still points at it.
+
+
+def source_digest(content: Any) -> str:
+    digest = hashlib.sha256()
+    content.seek(0)
+    if hasattr(content, "chunks"):
+        chunks = content.chunks()
+    else:
+        chunks = iter(lambda: content.read(64 * 1024), b"")
+    for chunk in chunks:
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+def lookup(digest: str, storage: Any) -> Optional[str]:
+    """
+    Returns the stored name for ``digest``, dropping the entry if the object
+    has since disappeared from storage.
+    """
+    try:
+        name = MediaBlob.objects.filter(digest=digest).values_list("name", flat=True).first()
+        if name is None:
+            return None
+        if storage.exists(name):
+            return name
+        MediaBlob.objects.filter(digest=digest).delete()
+    except DatabaseError as e:
+        # Uploads must keep working even if the index is unavailable
+        logger.warning(f"Media index lookup failed: {str(e)}")
+    return None
+
+
+def remember(digest: str, name: str) -> None:
+    try:
+        MediaBlob.objects.get_or_create(digest=digest, defaults={"name": name})
+    except (DatabaseError, IntegrityError) as e:
+        logger.warning(f"Could not index media {name}: {str(e)}")
+
+
+def protect(name: str) -> None:
+    """
+    Indexes ``name`` without a source digest, so storage.delete() keeps it
+    while any row still references it (see MediaBlob).
+    """
+    try:
+        if not is_indexed(name):
+            MediaBlob.objects.create(digest=None, name=name)
+    except DatabaseError as e:
+        logger.warning(f"Could not index media {name}: {str(e)}")
+
+
+def forget(name: str) -> None:
+    MediaBlob.objects.filter(name=name).delete()
+
+
+def is_indexed(name: str) -> bool:
+    return MediaBlob.objects.filter(name=name).exists()
+
+
+# ============================================================================
+# REFERENCES
+# ============================================================================
+
+
+def file_fields() -> Iterator[tuple[type[models.Model], models.FileField]]:
+    """
+    Every FileField stored through WebPOptimizedStorage (or a subclass).
+    """
+    from config.storage import WebPOptimizedStorage
+
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, models.FileField) and isinstance(
+                field.storage, WebPOptimizedStorage
+            ):
+                yield model, field
+
+
+def html_fields() -> Iterator[tuple[type[models.Model], models.Field]]:  # type: ignore[type-arg]
+    """
+    Rich-text fields whose HTML can embed CKEditor uploads.
+    """
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, CKEditor5Field):
+                yield model, field
+
+
+def name_variants(name: str) -> set[str]:
+    # CKEditor writes the storage URL, which percent-encodes the name
+    return {name, quote(name)}
+
+
+def replace_name(html: str, old: str, new: str) -> str:
+    html = html.replace(quote(old), quote(new))
+    if quote(old) != old:
+        html = html.replace(old, new)
+    return html
+
+
+def references_to(name: str) -> list[tuple[type[models.Model], Any, str]]:
+    """
+    (model, pk, field name) of every row still pointing at ``name``.
+    """
+    found: list[tuple[type[models.Model], Any, str]] = []
+    for model, field in file_fields():
+        for pk in model._default_manager.filter(**{field.name: name}).values_list("pk", flat=True):
+            found.append((model, pk, field.name))
+    for model, field in html_fields():
+        query = models.Q()
+        for variant in name_variants(name):
+            query |= models.Q(**{f"{field.name}__contains": variant})
+        for pk in model._default_manager.filter(query).values_list("pk", flat=True):
+            found.append((model, pk, field.name))
+    return found
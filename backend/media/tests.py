@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from blog.models import Post
+from projects.models import Project
+from wallet.models import Card
+
+from .models import MediaBlob
+
+
+def _image_bytes(color: tuple[int, int, int], format: str = "PNG") -> bytes:
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.new("RGB", (64, 48), color).save(output, format=format)
+    return output.getvalue()
+
+
+@override_settings(
+    IMAGE_VARIANTS_ASYNC=False,
+    IMAGE_VARIANT_FORMATS=("webp",),
+    SNAPSHOT_ASYNC_REBUILD=False,
+)
+class MediaDeduplicationTests(TestCase):
+    def setUp(self) -> None:
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.media_root = media.name
+        settings_override = self.settings(MEDIA_ROOT=media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _project(self, title: str, data: bytes) -> Project:
+        with self.captureOnCommitCallbacks(execute=True):
+            return Project.objects.create(
+                title=title,
+                description="",
+                repo="https://github.com/test/repo",
+                thumbnail=SimpleUploadedFile(f"{title}.png", data, content_type="image/png"),
+            )
+
+    def test_duplicate_upload_reuses_stored_object(self) -> None:
+        data = _image_bytes((10, 120, 200))
+        first = self._project("first", data)
+        second = self._project("second", data)
+        other = self._project("other", _image_bytes((200, 10, 10)))
+
+        self.assertEqual(first.thumbnail.name, second.thumbnail.name)
+        self.assertTrue(first.thumbnail.name.endswith(".webp"))
+        self.assertNotEqual(other.thumbnail.name, first.thumbnail.name)
+        self.assertEqual(MediaBlob.objects.count(), 2)
+        stored = os.listdir(os.path.join(self.media_root, "project_thumbnails"))
+        self.assertEqual(
+            sorted(f for f in stored if f.endswith(".webp")),
+            sorted(os.path.basename(p.thumbnail.name) for p in (first, other)),
+        )
+
+    def test_shared_object_survives_until_last_reference_is_deleted(self) -> None:
+        data = _image_bytes((10, 120, 200))
+        first = self._project("first", data)
+        second = self._project("second", data)
+        path = os.path.join(self.media_root, first.thumbnail.name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertTrue(os.path.exists(path))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(MediaBlob.objects.exists())
+
+    def test_shared_variants_survive_until_last_reference_is_deleted(self) -> None:
+        """With overwriting storage (GCS) rows sharing a source share variant files too."""
+        storage = Project._meta.get_field("thumbnail").storage
+        data = _image_bytes((10, 120, 200))
+        with mock.patch.object(storage, "_allow_overwrite", True):
+            first = self._project("first", data)
+            second = self._project("second", data)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        variants = {
+            name for entries in first.image_variants["variants"].values() for _, name in entries
+        }
+        self.assertTrue(variants)
+        self.assertEqual(second.image_variants["variants"], first.image_variants["variants"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        for name in variants:
+            self.assertTrue(storage.exists(name), name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        for name in variants:
+            self.assertFalse(storage.exists(name), name)
+
+    def test_dedupe_command_rewrites_references(self) -> None:
+        webp = ContentFile(_image_bytes((0, 90, 0), format="WEBP"))
+        keep = default_storage.save("blog_images/2024/01/a.webp", webp)
+        webp.seek(0)
+        duplicate = default_storage.save("card_images/b.webp", webp)
+
+        card = Card.objects.create(card_name="Card", description="", image=duplicate)
+        post = Post.objects.create(
+            title="Post",
+            body=f'<p><img src="{default_storage.url(duplicate)}"></p>',
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("dedupe_media", stdout=StringIO())
+
+        card.refresh_from_db()
+        post.refresh_from_db()
+        self.assertEqual(card.image.name, keep)
+        self.assertIn(default_storage.url(keep), post.body)
+        self.assertFalse(default_storage.exists(duplicate))
+        self.assertTrue(default_storage.exists(keep))
+
+    def test_dedupe_command_protects_unindexed_canonical_copy(self) -> None:
+        """Duplicates uploaded before the index existed still share one guarded file."""
+        webp = ContentFile(_image_bytes((90, 0, 90), format="WEBP"))
+        first = default_storage.save("card_images/a.webp", webp)
+        webp.seek(0)
+        second = default_storage.save("card_images/b.webp", webp)
+        self.assertFalse(MediaBlob.objects.exists())
+
+        keep = Card.objects.create(card_name="Keep", description="", image=first)
+        drop = Card.objects.create(card_name="Drop", description="", image=second)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("dedupe_media", stdout=StringIO())
+        drop.refresh_from_db()
+        self.assertEqual(drop.image.name, first)
+        # A guard only: the digest of the stored WebP would never match an upload
+        self.assertEqual(
+            list(MediaBlob.objects.filter(name=first).values_list("digest", flat=True)), [None]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            drop.delete()
+        self.assertTrue(default_storage.exists(first))
+        keep.refresh_from_db()
+        self.assertEqual(keep.image.width, 64)
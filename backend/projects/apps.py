@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "projects"
+
+    def ready(self) -> None:
+        from config.cache import connect_cache_invalidation
+        from config.images import connect_image_variants
+
+        from .models import Project, Tag
+
+        connect_cache_invalidation(Project, Tag)
+        connect_image_variants(Project, "thumbnail")
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='image_placeholder',
+            field=models.CharField(blank=True, default='', editable=False, max_length=512),
+        ),
+    ]
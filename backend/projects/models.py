@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from django.db import models
 
+from config.image_probe import ProbedImageField
+
 
 class Tag(models.Model):
     name = models.CharField(max_length=50)
@@ -18,13 +20,19 @@ class Project(models.Model):
     slug = models.SlugField(max_length=100, unique=True, blank=True, null=True)
     image_width = models.PositiveIntegerField(null=True, blank=True)
     image_height = models.PositiveIntegerField(null=True, blank=True)
-    thumbnail = models.ImageField(
+    # Tiny inline WebP (data URI) painted until the image loads; see config/images.py
+    image_placeholder = models.CharField(
+        max_length=512, blank=True, default="", editable=False
+    )
+    thumbnail = ProbedImageField(
         upload_to="project_thumbnails/",
         blank=True,
         null=True,
         width_field="image_width",
         height_field="image_height",
     )
+    # Manifest of responsive copies of thumbnail, written by config/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     emoji = models.CharField(
         max_length=10, blank=True, help_text="Emoji icon for project switcher"
     )
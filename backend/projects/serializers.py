@@ -5,6 +5,8 @@ from typing import Any, Optional
 from rest_framework import serializers
 from rest_framework.request import Request
 
+from config.images import ImageSrcsetField
+
 from .models import Project, Tag
 
 
@@ -16,6 +18,7 @@ class TagSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
 
 class ProjectSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
     thumbnail_url = serializers.SerializerMethodField()
+    thumbnail_srcset = ImageSrcsetField("thumbnail")
     tags = TagSerializer(many=True, read_only=True)
 
     class Meta:
@@ -27,8 +30,10 @@ class ProjectSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
             "repo",
             "deployed_url",
             "thumbnail_url",
+            "thumbnail_srcset",
             "image_width",
             "image_height",
+            "image_placeholder",
             "emoji",
             "order",
             "switcher_order",
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import io
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
 from django.urls import reverse
+from prometheus_client import REGISTRY
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
-from .models import Project
+from config.testing import QueryBudgetMixin
+
+from config.image_probe import HEAD_BYTES, parse_dimensions, probe_dimensions
+from config.storage import WebPOptimizedStorage
+
+from .models import Project, Tag
 
 
 class ProjectAPITests(APITestCase):
@@ -35,3 +54,505 @@ class ProjectAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["title"], "Test Project")
         self.assertEqual(response.data["description"], "Test Description")
+
+
+@override_settings(API_CACHE_TTL=60 * 60 * 24, API_BROWSER_TTL=60)
+class ProjectCacheInvalidationTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project = Project.objects.create(
+                title="Cached Project",
+                description="Before edit",
+                repo="https://github.com/test/cached",
+                order=1,
+            )
+        self.list_url = reverse("projects-list")
+
+    def test_list_is_served_from_cache(self) -> None:
+        """A second request must not touch the database."""
+        self.client.get(self.list_url)
+        with self.assertNumQueries(0):
+            response: Response = self.client.get(self.list_url)
+        self.assertEqual(response.data[0]["description"], "Before edit")
+
+    def test_save_invalidates_cached_list(self) -> None:
+        """Saving a project drops the cached response immediately."""
+        self.client.get(self.list_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.description = "After edit"
+            self.project.save()
+
+        response: Response = self.client.get(self.list_url)
+        self.assertEqual(response.data[0]["description"], "After edit")
+
+    def test_tag_change_invalidates_cached_list(self) -> None:
+        """Adding a tag (m2m_changed) or renaming one bumps the cache generation."""
+        self.client.get(self.list_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag = Tag.objects.create(name="Django")
+            self.project.tags.add(tag)
+        response: Response = self.client.get(self.list_url)
+        self.assertEqual(response.data[0]["tags"], [{"id": tag.pk, "name": "Django"}])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.name = "DRF"
+            tag.save()
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.data[0]["tags"][0]["name"], "DRF")
+
+    def test_browser_max_age_is_short(self) -> None:
+        """Browsers only get API_BROWSER_TTL, not the server-side TTL."""
+        self.client.get(self.list_url)
+        response: Response = self.client.get(self.list_url)
+        self.assertIn("max-age=60", response["Cache-Control"])
+
+
+@override_settings(API_CACHE_TTL=60 * 60 * 24, API_BROWSER_TTL=60)
+class ProjectInstrumentationTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        Project.objects.create(
+            title="Timed Project",
+            description="Measured",
+            repo="https://github.com/test/timed",
+            order=1,
+        )
+        self.list_url = reverse("projects-list")
+
+    def sample(self, name: str, **labels: str) -> float:
+        return REGISTRY.get_sample_value(name, {"view": "projects-list", **labels}) or 0.0
+
+    def test_server_timing_is_staff_only(self) -> None:
+        """Anonymous visitors never see the Server-Timing header."""
+        response: Response = self.client.get(self.list_url)
+        self.assertNotIn("Server-Timing", response)
+
+        staff = get_user_model().objects.create_user("staff", password="x", is_staff=True)
+        self.client.force_login(staff)
+        response = self.client.get(self.list_url)
+        self.assertIn("db;dur=", response["Server-Timing"])
+
+    def test_server_timing_reports_cache_and_serialization(self) -> None:
+        """A miss runs the view (serialize stage); the replayed hit does not."""
+        staff = get_user_model().objects.create_user("staff", password="x", is_staff=True)
+        self.client.force_login(staff)
+
+        miss: Response = self.client.get(self.list_url)
+        self.assertIn("cache;desc=miss", miss["Server-Timing"])
+        self.assertIn("serialize;dur=", miss["Server-Timing"])
+
+        hit: Response = self.client.get(self.list_url)
+        self.assertIn("cache;desc=hit", hit["Server-Timing"])
+        self.assertNotIn("serialize", hit["Server-Timing"])
+        # The cached copy must not carry the first request's timings
+        self.assertEqual(hit["Server-Timing"].count("cache;"), 1)
+
+    def test_metrics_are_labelled_by_view(self) -> None:
+        """Queries, cache results and response size land on /metrics per view."""
+        requests_before = self.sample("http_view_db_queries_count")
+        misses_before = self.sample("http_view_cache_total", result="miss")
+        hits_before = self.sample("http_view_cache_total", result="hit")
+        queries_before = self.sample("http_view_db_queries_sum")
+
+        self.client.get(self.list_url)
+        self.client.get(self.list_url)
+
+        self.assertEqual(self.sample("http_view_db_queries_count") - requests_before, 2)
+        self.assertEqual(self.sample("http_view_cache_total", result="miss") - misses_before, 1)
+        self.assertEqual(self.sample("http_view_cache_total", result="hit") - hits_before, 1)
+        self.assertGreater(self.sample("http_view_db_queries_sum") - queries_before, 0)
+        self.assertGreater(self.sample("http_view_response_bytes_sum"), 0)
+
+        metrics = self.client.get("/metrics").content.decode()
+        self.assertIn('http_view_cache_total{result="hit",view="projects-list"}', metrics)
+
+
+class ProjectConditionalGetTests(APITestCase):
+    def setUp(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project = Project.objects.create(
+                title="Conditional Project",
+                description="Original",
+                repo="https://github.com/test/conditional",
+                order=1,
+            )
+        self.list_url = reverse("projects-list")
+        self.detail_url = reverse("projects-detail", kwargs={"pk": self.project.pk})
+
+    def test_list_and_detail_emit_etag(self) -> None:
+        self.assertTrue(self.client.get(self.list_url).has_header("ETag"))
+        self.assertTrue(self.client.get(self.detail_url).has_header("ETag"))
+
+    def test_matching_etag_returns_304_without_serializing(self) -> None:
+        etag = self.client.get(self.list_url)["ETag"]
+        # Only the COUNT aggregate runs; the tags prefetch/serialization is skipped
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        etag = self.client.get(self.detail_url)["ETag"]
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_edit_changes_etag(self) -> None:
+        etag = self.client.get(self.list_url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.description = "Edited"
+            self.project.save()
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class ProjectQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self) -> None:
+        self.tags = [Tag.objects.create(name="Frontend"), Tag.objects.create(name="Backend")]
+
+    def _populate(self, size: int) -> None:
+        existing = Project.objects.count()
+        projects = Project.objects.bulk_create(
+            Project(
+                title=f"Project {index}",
+                slug=f"project-{index}",
+                description="Description",
+                repo="https://github.com/test/project",
+                order=index,
+            )
+            for index in range(existing, size)
+        )
+        Through = Project.tags.through
+        Through.objects.bulk_create(
+            Through(project_id=project.pk, tag_id=tag.pk)
+            for project in projects
+            for tag in self.tags
+        )
+
+    def test_project_list_runs_constant_queries(self) -> None:
+        # Validator aggregate + projects + prefetched tags
+        self.assertConstantQueries(
+            reverse("projects-list") + "?all=true", 3, self._populate
+        )
+
+
+class ProjectPaginationTests(APITestCase):
+    def setUp(self) -> None:
+        for index in range(5):
+            Project.objects.create(
+                title=f"Project {index}",
+                description="Description",
+                repo="https://github.com/test/project",
+                order=index % 2,
+            )
+        self.list_url = reverse("projects-list")
+
+    def test_limit_returns_first_page_with_cursor(self) -> None:
+        """?limit= pages through projects instead of truncating the list."""
+        response: Response = self.client.get(self.list_url, {"all": "true", "limit": 3})
+        self.assertEqual(len(response.data["results"]), 3)
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNone(response.data["next"])
+
+
+def _jpeg(width: int, height: int) -> SimpleUploadedFile:
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 40, 40)).save(output, format="JPEG")
+    return SimpleUploadedFile("shot.jpg", output.getvalue(), content_type="image/jpeg")
+
+
+@override_settings(
+    IMAGE_VARIANTS_ASYNC=False,
+    IMAGE_VARIANT_WIDTHS=(320, 640),
+    IMAGE_VARIANT_FORMATS=("webp",),
+    SNAPSHOT_ASYNC_REBUILD=False,
+)
+class ProjectImageVariantTests(APITestCase):
+    def setUp(self) -> None:
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.media_root = media.name
+        settings_override = self.settings(MEDIA_ROOT=media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project = Project.objects.create(
+                title="Pictured",
+                description="Has a thumbnail",
+                repo="https://github.com/test/pictured",
+                thumbnail=_jpeg(1000, 500),
+            )
+        self.project.refresh_from_db()
+
+    def test_upload_generates_variants_and_srcset(self) -> None:
+        manifest = self.project.image_variants
+        self.assertEqual(manifest["source"], self.project.thumbnail.name)
+        self.assertEqual([width for width, _ in manifest["variants"]["webp"]], [320, 640])
+        for _, name in manifest["variants"]["webp"]:
+            self.assertTrue(os.path.exists(os.path.join(self.media_root, name)))
+
+        response = self.client.get(reverse("projects-detail", kwargs={"pk": self.project.pk}))
+        srcset = response.data["thumbnail_srcset"]["webp"]
+        self.assertIn("-320w.webp 320w", srcset)
+        self.assertIn("-640w.webp 640w", srcset)
+
+    def test_replacing_image_swaps_variants(self) -> None:
+        old_names = [name for _, name in self.project.image_variants["variants"]["webp"]]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.thumbnail = _jpeg(400, 300)
+            self.project.save()
+        self.project.refresh_from_db()
+
+        self.assertEqual(
+            [width for width, _ in self.project.image_variants["variants"]["webp"]], [320, 400]
+        )
+        for name in old_names:
+            self.assertFalse(os.path.exists(os.path.join(self.media_root, name)))
+
+    def test_placeholder_is_a_tiny_inline_webp(self) -> None:
+        placeholder = self.project.image_placeholder
+        self.assertTrue(placeholder.startswith("data:image/webp;base64,"))
+        self.assertLess(len(placeholder), 512)
+
+        response = self.client.get(reverse("projects-detail", kwargs={"pk": self.project.pk}))
+        self.assertEqual(response.data["image_placeholder"], placeholder)
+
+    def test_backfill_fills_missing_placeholder_and_dimensions(self) -> None:
+        Project.objects.filter(pk=self.project.pk).update(
+            image_placeholder="", image_width=None, image_height=None
+        )
+
+        checkpoint = os.path.join(self.media_root, "checkpoint.json")
+
+        call_command(
+            "backfill_image_dimensions", "--dry-run", checkpoint=checkpoint, stdout=StringIO()
+        )
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.image_placeholder, "")
+
+        call_command(
+            "backfill_image_dimensions", "--placeholders", checkpoint=checkpoint, stdout=StringIO()
+        )
+
+        self.project.refresh_from_db()
+        self.assertTrue(self.project.image_placeholder.startswith("data:image/webp;base64,"))
+        self.assertEqual((self.project.image_width, self.project.image_height), (1000, 500))
+        self.assertFalse(os.path.exists(checkpoint))
+
+    def test_backfill_only_reads_headers_by_default(self) -> None:
+        Project.objects.filter(pk=self.project.pk).update(
+            image_placeholder="", image_width=None, image_height=None
+        )
+        checkpoint = os.path.join(self.media_root, "checkpoint.json")
+
+        with mock.patch(
+            "info.management.commands.backfill_image_dimensions.decode_source",
+            side_effect=AssertionError("full read"),
+        ):
+            call_command("backfill_image_dimensions", checkpoint=checkpoint, stdout=StringIO())
+
+        row = Project.objects.values("image_width", "image_height", "image_placeholder").get(
+            pk=self.project.pk
+        )
+        self.assertEqual(row, {"image_width": 1000, "image_height": 500, "image_placeholder": ""})
+
+    def test_backfill_keeps_checkpoints_of_unselected_models(self) -> None:
+        checkpoint = os.path.join(self.media_root, "checkpoint.json")
+        with open(checkpoint, "w") as f:
+            json.dump({"project": self.project.pk, "post": 7}, f)
+
+        call_command(
+            "backfill_image_dimensions",
+            "--models",
+            "post",
+            checkpoint=checkpoint,
+            stdout=StringIO(),
+        )
+
+        with open(checkpoint) as f:
+            self.assertEqual(json.load(f), {"project": self.project.pk})
+
+    def test_backfill_resumes_after_checkpoint(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            later = Project.objects.create(
+                title="Later",
+                description="",
+                repo="https://github.com/test/later",
+                thumbnail=_jpeg(600, 400),
+            )
+        Project.objects.update(image_width=None, image_height=None)
+        checkpoint = os.path.join(self.media_root, "checkpoint.json")
+        with open(checkpoint, "w") as f:
+            json.dump({"project": self.project.pk}, f)
+
+        call_command(
+            "backfill_image_dimensions",
+            "--models",
+            "project",
+            "--workers",
+            "2",
+            checkpoint=checkpoint,
+            stdout=StringIO(),
+        )
+
+        # values_list: loading an instance would fill the dimensions itself
+        dimensions = dict(Project.objects.values_list("pk", "image_width"))
+        self.assertIsNone(dimensions[self.project.pk])
+        self.assertEqual(dimensions[later.pk], 600)
+
+    def test_stale_manifest_is_not_served(self) -> None:
+        Project.objects.filter(pk=self.project.pk).update(thumbnail="project_thumbnails/other.webp")
+        response = self.client.get(reverse("projects-detail", kwargs={"pk": self.project.pk}))
+        self.assertIsNone(response.data["thumbnail_srcset"])
+
+
+class WebPOptimizedStorageTests(APITestCase):
+    def setUp(self) -> None:
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.storage = WebPOptimizedStorage(location=media.name)
+
+    def _stored(self, name: str, upload: SimpleUploadedFile) -> tuple[str, tuple[int, int], str]:
+        from PIL import Image
+
+        stored = self.storage.save(name, upload)
+        with Image.open(self.storage.path(stored)) as img:
+            return stored, img.size, img.mode
+
+    @override_settings(IMAGE_MAX_PIXELS=200_000)
+    def test_oversized_jpeg_is_downscaled_on_ingest(self) -> None:
+        name, size, _ = self._stored("big.jpg", _jpeg(1600, 1200))
+        self.assertTrue(name.endswith(".webp"))
+        self.assertLessEqual(size[0] * size[1], 200_000)
+        self.assertAlmostEqual(size[0] / size[1], 4 / 3, places=2)
+
+    @override_settings(IMAGE_MAX_PIXELS=None)
+    def test_no_cap_keeps_full_resolution(self) -> None:
+        _, size, _ = self._stored("big.jpg", _jpeg(1600, 1200))
+        self.assertEqual(size, (1600, 1200))
+
+    @override_settings(IMAGE_MAX_PIXELS=10_000)
+    def test_upload_is_left_open_for_the_caller(self) -> None:
+        """ImageField still reads the upload after storage has converted it."""
+        upload = _jpeg(640, 480)
+        self.storage.save("shot.jpg", upload)
+        self.assertFalse(upload.closed)
+
+    @override_settings(
+        IMAGE_MAX_PIXELS=100 * 100, IMAGE_VARIANTS_ASYNC=False, SNAPSHOT_ASYNC_REBUILD=False
+    )
+    def test_recorded_dimensions_match_the_downscaled_file(self) -> None:
+        from PIL import Image
+
+        with self.settings(MEDIA_ROOT=self.storage.location):
+            project = Project.objects.create(
+                title="Downscaled",
+                description="",
+                repo="https://github.com/test/downscaled",
+                thumbnail=_jpeg(640, 480),
+            )
+        with Image.open(self.storage.path(project.thumbnail.name)) as img:
+            stored_size = img.size
+        self.assertEqual(stored_size, (115, 86))
+        recorded = Project.objects.values_list("image_width", "image_height").get(pk=project.pk)
+        self.assertEqual(recorded, stored_size)
+
+    @override_settings(IMAGE_MAX_PIXELS=10_000)
+    def test_transparent_png_stays_lossless_rgba(self) -> None:
+        from PIL import Image
+
+        output = io.BytesIO()
+        Image.new("RGBA", (400, 200), (0, 0, 255, 128)).save(output, format="PNG")
+        upload = SimpleUploadedFile("logo.png", output.getvalue(), content_type="image/png")
+
+        _, size, mode = self._stored("logo.png", upload)
+        self.assertEqual(mode, "RGBA")
+        self.assertLessEqual(size[0] * size[1], 10_000)
+
+
+class ImageProbeTests(APITestCase):
+    def setUp(self) -> None:
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.storage = WebPOptimizedStorage(location=media.name)
+
+    def _encoded(self, format: str, mode: str = "RGB", **params: object) -> bytes:
+        from PIL import Image
+
+        output = io.BytesIO()
+        Image.new(mode, (321, 123)).save(output, format=format, **params)
+        return output.getvalue()
+
+    def test_headers_parse_to_pillow_sizes(self) -> None:
+        cases = {
+            "webp lossy": self._encoded("WEBP"),
+            "webp lossless": self._encoded("WEBP", lossless=True),
+            "webp alpha": self._encoded("WEBP", mode="RGBA"),
+            "png": self._encoded("PNG"),
+            "gif": self._encoded("GIF"),
+            "jpeg": self._encoded("JPEG"),
+            "progressive jpeg": self._encoded("JPEG", progressive=True),
+        }
+        for label, data in cases.items():
+            with self.subTest(label):
+                self.assertEqual(parse_dimensions(data[:HEAD_BYTES]), (321, 123))
+
+    def test_probe_reads_only_the_header(self) -> None:
+        from PIL import Image
+
+        output = io.BytesIO()
+        Image.effect_noise((321, 123), 64).save(output, format="WEBP", quality=100)
+        self.assertGreater(len(output.getvalue()), HEAD_BYTES)
+        name = self.storage.save("photo.webp", ContentFile(output.getvalue()))
+        reads: list[int] = []
+        read_head = self.storage.read_head
+
+        def counting_read_head(name: str, size: int) -> bytes:
+            data = read_head(name, size)
+            reads.append(len(data))
+            return data
+
+        with mock.patch.object(self.storage, "read_head", counting_read_head), mock.patch(
+            "config.image_probe.get_image_dimensions", side_effect=AssertionError("full read")
+        ):
+            self.assertEqual(probe_dimensions(self.storage, name), (321, 123))
+        self.assertEqual(reads, [HEAD_BYTES])
+
+    def test_jpeg_with_large_exif_needs_a_second_range(self) -> None:
+        from PIL import Image
+
+        exif = Image.Exif()
+        exif[0x010E] = "x" * 20_000  # ImageDescription
+        data = self._encoded("JPEG", exif=exif.tobytes())
+        self.assertIsNone(parse_dimensions(data[:HEAD_BYTES]))
+
+        name = self.storage.save("exif.jpeg", ContentFile(data))
+        self.assertEqual(probe_dimensions(self.storage, name), (321, 123))
+
+    def test_unknown_format_falls_back_to_full_read(self) -> None:
+        name = self.storage.save("photo.bmp", ContentFile(self._encoded("BMP")))
+        self.assertEqual(probe_dimensions(self.storage, name), (321, 123))
+
+    @override_settings(
+        IMAGE_MAX_PIXELS=200_000, IMAGE_VARIANTS_ASYNC=False, SNAPSHOT_ASYNC_REBUILD=False
+    )
+    def test_width_field_records_the_stored_image(self) -> None:
+        with self.settings(MEDIA_ROOT=self.storage.location):
+            project = Project.objects.create(
+                title="Big",
+                description="",
+                repo="https://github.com/test/big",
+                thumbnail=_jpeg(1600, 1200),
+            )
+        self.assertLessEqual(project.image_width * project.image_height, 200_000)
+        stored = Project.objects.values_list("image_width", "image_height").get(pk=project.pk)
+        self.assertEqual(stored, (project.image_width, project.image_height))
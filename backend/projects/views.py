@@ -4,8 +4,6 @@ from typing import Optional
 
 from django.db.models import Q, QuerySet
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django.conf import settings
 from django.http import HttpResponseRedirect, Http404, HttpRequest
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -13,22 +11,39 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 from typing import Any
 
-from .models import Project
+from config.cache import versioned_cache_page
+from config.mixins import ConditionalGetMixin
+from config.pagination import KeysetCursorPagination
+
+from .models import Project, Tag
 from .serializers import ProjectSerializer
 
 
-@method_decorator(cache_page(settings.CACHE_TTL), name="dispatch")
-class ProjectViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
+class ProjectCursorPagination(KeysetCursorPagination):
+    """
+    Only paginates when the client asks (?limit= or ?cursor=); the switcher and
+    projects page still receive the full flat list.
+    """
+
+    ordering = ("order", "id")
+    page_size_query_param = "limit"
+    paginate_by_default = False
+
+
+@method_decorator(versioned_cache_page(Project, Tag), name="dispatch")
+class ProjectViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
     serializer_class = ProjectSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = ProjectCursorPagination
+    cache_models = (Project, Tag)
 
     def get_queryset(self) -> QuerySet[Project]:
         """
-        Ordering is applied here (before any slicing) because DRF's filter backends run
-        after get_queryset() returns. Slicing a queryset before ordering raises a Django
-        TypeError, so we must call .order_by() first, then apply the limit slice last.
+        ?limit= is handled by ProjectCursorPagination as the page size, so the
+        queryset is never sliced here and later pages stay reachable via the cursor.
+        Tags are prefetched so the nested TagSerializer doesn't run one query per project.
         """
-        queryset: QuerySet[Project] = Project.objects.order_by('order')
+        queryset: QuerySet[Project] = Project.objects.order_by('order').prefetch_related("tags")
 
         is_visible: Optional[str] = self.request.query_params.get("is_visible")
         get_all: Optional[str] = self.request.query_params.get("all")
@@ -40,13 +55,6 @@ class ProjectViewSet(viewsets.ReadOnlyModelViewSet):  # type: ignore[type-arg]
         else:
             queryset = queryset.filter(is_visible_switcher=True)
 
-        limit: Optional[str] = self.request.query_params.get("limit")
-        if limit:
-            try:
-                return queryset[:int(limit)]
-            except ValueError:
-                pass
-
         return queryset
 
     def get_object(self) -> Project:
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class SnapshotsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "snapshots"
+
+    def ready(self) -> None:
+        from config.cache import add_bump_listener
+
+        from .builder import on_generation_bump
+
+        add_bump_listener(on_generation_bump)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Any, Callable, Optional
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from blog.models import Post
+from blog.serializers import PostListSerializer
+from info.models import Info
+from info.serializers import InfoSerializer
+from projects.models import Project
+from projects.serializers import ProjectSerializer
+from wallet.models import Card
+from wallet.serializers import CardSerializer
+from config.background import schedule_job
+
+from .seo import SEO_PRERENDER_LABELS, prerender_seo_pages
+
+logger = logging.getLogger(__name__)
+
+HOME_SNAPSHOT_KEY = "snapshot:home"
+
+# Any of these changing alters the homepage payload (tags and categories are
+# nested into projects and posts).
+HOME_SNAPSHOT_LABELS = frozenset(
+    {
+        "info.info",
+        "projects.project",
+        "projects.tag",
+        "blog.post",
+        "blog.category",
+        "wallet.card",
+    }
+)
+
+
+class BaseURLRequest:
+    """
+    Stands in for the request in serializer context. The snapshot is built off
+    any request, but must carry the same absolute URLs /api/ responses do.
+    """
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url.rstrip("/") + "/"
+
+    def build_absolute_uri(self, location: str) -> str:
+        return urljoin(self.base_url, location)
+
+
+def build_home_snapshot() -> dict[str, Any]:
+    """
+    Serializes everything the homepage renders into one pre-rendered JSON blob.
+    Returns the cache entry: raw body bytes, a strong ETag and the moment the
+    next scheduled post goes live (after which the blob is stale).
+    """
+    now = timezone.now()
+    context = {"request": BaseURLRequest(settings.API_BASE_URL)}
+    payload = {
+        "info": InfoSerializer(Info.objects.all(), many=True, context=context).data,
+        "projects": ProjectSerializer(
+            Project.objects.filter(Q(is_visible=True) | Q(is_visible_switcher=True))
+            .order_by("order")
+            .prefetch_related("tags"),
+            many=True,
+            context=context,
+        ).data,
+        "posts": PostListSerializer(
+            Post.objects.filter(status="published", publish_date__lte=now)
+            .defer("body", "search_text", "search_vector")
+            .prefetch_related("categories"),
+            many=True,
+            context=context,
+        ).data,
+        "cards": CardSerializer(Card.objects.all(), many=True, context=context).data,
+        "generated_at": now.isoformat(),
+    }
+    body: bytes = JSONRenderer().render(payload)
+    next_publish = Post.next_scheduled_publish_date()
+
+    return {
+        "body": body,
+        "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        "expires_at": next_publish.timestamp() if next_publish else None,
+    }
+
+
+def rebuild_home_snapshot() -> dict[str, Any]:
+    snapshot = build_home_snapshot()
+    cache.set(HOME_SNAPSHOT_KEY, snapshot, timeout=None)
+    logger.info(
+        f"Home snapshot rebuilt: {len(snapshot['body'])} bytes, ETag {snapshot['etag']}"
+    )
+    return snapshot
+
+
+def get_home_snapshot() -> dict[str, Any]:
+    """
+    Returns the stored snapshot, building it inline only when the cache is cold
+    or a scheduled post has gone live since it was built.
+    """
+    snapshot: Optional[dict[str, Any]] = cache.get(HOME_SNAPSHOT_KEY)
+    if snapshot is None:
+        return rebuild_home_snapshot()
+
+    expires_at: Optional[float] = snapshot.get("expires_at")
+    if expires_at is not None and expires_at <= timezone.now().timestamp():
+        return rebuild_home_snapshot()
+    return snapshot
+
+
+def schedule_rebuild(name: str, job: Callable[[], Any]) -> None:
+    """
+    Runs ``job`` on the snapshot worker thread, or inline when
+    SNAPSHOT_ASYNC_REBUILD is off. Several bumps from one admin save (post_save
+    plus m2m_changed) collapse into a single run.
+    """
+    schedule_job(
+        name,
+        job,
+        queue="snapshots",
+        inline=not getattr(settings, "SNAPSHOT_ASYNC_REBUILD", True),
+    )
+
+
+def _rebuild_home_snapshot_safely() -> None:
+    try:
+        rebuild_home_snapshot()
+    except Exception:
+        # Drop the stale blob so the next request rebuilds it inline
+        cache.delete(HOME_SNAPSHOT_KEY)
+        raise
+
+
+def schedule_home_snapshot_rebuild() -> None:
+    schedule_rebuild("home-snapshot", _rebuild_home_snapshot_safely)
+
+
+def schedule_seo_prerender() -> None:
+    if getattr(settings, "SEO_PRERENDER_ROOT", None):
+        schedule_rebuild("seo-prerender", prerender_seo_pages)
+
+
+def on_generation_bump(label: str) -> None:
+    if label in HOME_SNAPSHOT_LABELS:
+        schedule_home_snapshot_rebuild()
+    if label in SEO_PRERENDER_LABELS:
+        schedule_seo_prerender()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from snapshots.seo import prerender_seo_pages
+
+
+class Command(BaseCommand):
+    help = "Writes crawler meta HTML for the homepage and every published post to disk for nginx to serve"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--root",
+            help="Output directory (defaults to SEO_PRERENDER_ROOT)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        root = options["root"] or getattr(settings, "SEO_PRERENDER_ROOT", None)
+        if not root:
+            raise CommandError("SEO_PRERENDER_ROOT is not set; pass --root.")
+
+        stats = prerender_seo_pages(root)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Prerendered SEO pages to {root}: {stats['written']} written, "
+                f"{stats['unchanged']} unchanged, {stats['removed']} removed."
+            )
+        )
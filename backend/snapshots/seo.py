@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from blog.models import Post
+from blog.views import render_post_meta
+from info.models import Info
+from info.views import render_home_meta
+
+logger = logging.getLogger(__name__)
+
+# Any of these changing alters at least one prerendered page (categories feed
+# article:section, Info feeds the author and the whole homepage).
+SEO_PRERENDER_LABELS = frozenset({"blog.post", "blog.category", "info.info"})
+
+# Layout under SEO_PRERENDER_ROOT, mirrored by the try_files rules in nginx.conf
+BLOG_DIR = "blog"
+HOME_PAGE = Path("home") / "index.html"
+PAGE_NAME = "index.html"
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """
+    Atomically replaces ``path`` with ``content`` unless it already matches, so
+    nginx never serves a half-written file. Returns whether the file changed.
+    """
+    data = content.encode()
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        # mkstemp creates 0600 files; nginx runs as another user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def prerender_seo_pages(root: Optional[str | Path] = None) -> dict[str, int]:
+    """
+    Writes the crawler meta HTML for the homepage and every live post under
+    ``root`` (SEO_PRERENDER_ROOT by default), and removes pages for posts that
+    were unpublished, rescheduled or deleted.
+
+    Returns counts of pages written, unchanged and removed.
+    """
+    root = Path(root or settings.SEO_PRERENDER_ROOT)
+    # No request to build absolute URLs from; resolve media against the API host
+    # (as BaseURLRequest does for the snapshot), since SITE_URL is the frontend
+    base_url = settings.API_BASE_URL.rstrip("/") + "/"
+    now = timezone.now()
+    stats = {"written": 0, "unchanged": 0, "removed": 0}
+
+    info = Info.objects.first()
+    author_name: str = info.site_header if info else "Rajiv Wallace"
+
+    pages: dict[Path, str] = {HOME_PAGE: render_home_meta(info, base_url)}
+    posts = (
+        Post.objects.filter(status="published", publish_date__lte=now)
+        .defer("body", "search_text", "search_vector")
+        .prefetch_related("categories")
+    )
+    for post in posts:
+        post_slug: str = post.slug or str(post.pk)
+        pages[Path(BLOG_DIR) / post_slug / PAGE_NAME] = render_post_meta(
+            post, author_name, base_url
+        )
+
+    for relative_path, content in pages.items():
+        changed = _write_if_changed(root / relative_path, content)
+        stats["written" if changed else "unchanged"] += 1
+
+    live_slugs = {path.parent.name for path in pages if path.parts[0] == BLOG_DIR}
+    blog_root = root / BLOG_DIR
+    if blog_root.is_dir():
+        for entry in blog_root.iterdir():
+            if entry.is_dir() and entry.name not in live_slugs:
+                shutil.rmtree(entry, ignore_errors=True)
+                stats["removed"] += 1
+
+    logger.info(
+        f"SEO pages prerendered to {root}: {stats['written']} written, "
+        f"{stats['unchanged']} unchanged, {stats['removed']} removed"
+    )
+    return stats
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import io
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from blog.models import Post
+from info.models import Info
+from projects.models import Project
+from wallet.models import Card
+
+
+def _png() -> bytes:
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.new("RGB", (32, 24), (0, 120, 200)).save(output, format="PNG")
+    return output.getvalue()
+
+
+@override_settings(SNAPSHOT_ASYNC_REBUILD=False)
+class HomeSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.project = Project.objects.create(
+            title="Snapshot Project",
+            description="Included in the homepage payload",
+            repo="https://github.com/test/snapshot",
+            order=1,
+        )
+        self.url = reverse("snapshot-home")
+
+    def test_snapshot_contains_homepage_sections(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = response.json()
+        self.assertEqual(set(data), {"info", "projects", "posts", "cards", "generated_at"})
+        self.assertEqual(data["projects"][0]["title"], "Snapshot Project")
+
+    def test_warm_snapshot_runs_no_queries(self) -> None:
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_matching_etag_returns_304(self) -> None:
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_model_change_rebuilds_snapshot(self) -> None:
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Card.objects.create(card_name="New Card", description="<p>Fresh</p>")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["cards"][0]["card_name"], "New Card")
+
+    @override_settings(API_BASE_URL="http://testserver", IMAGE_VARIANTS_ASYNC=False)
+    def test_media_urls_match_the_api(self) -> None:
+        """Built off-request, the snapshot still carries absolute URLs like /api/."""
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        with self.settings(MEDIA_ROOT=media.name):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.project.thumbnail = SimpleUploadedFile(
+                    "shot.png", _png(), content_type="image/png"
+                )
+                self.project.is_visible = True
+                self.project.save()
+
+            api = self.client.get(reverse("projects-list"), {"is_visible": "true"}).json()
+            snapshot = self.client.get(self.url).json()
+
+        url = snapshot["projects"][0]["thumbnail_url"]
+        self.assertTrue(url.startswith("http://testserver/"))
+        self.assertEqual(url, api[0]["thumbnail_url"])
+
+
+@override_settings(SNAPSHOT_ASYNC_REBUILD=False)
+class SeoPrerenderTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        settings_override = self.settings(SEO_PRERENDER_ROOT=tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        Info.objects.create(site_header="Jane Doe", bio="A long enough bio.")
+        self.post = Post.objects.create(
+            title="Prerendered Post",
+            body="<p>Written to disk for nginx.</p>",
+            status="published",
+            publish_date=timezone.now() - timedelta(days=1),
+        )
+        self.page = self.root / "blog" / self.post.slug / "index.html"
+
+    def test_command_writes_home_and_live_posts_only(self) -> None:
+        Post.objects.create(
+            title="Scheduled Post",
+            body="<p>Not yet</p>",
+            status="published",
+            publish_date=timezone.now() + timedelta(days=1),
+        )
+        call_command("prerender_seo", stdout=StringIO())
+
+        self.assertTrue((self.root / "home" / "index.html").is_file())
+        self.assertEqual([p.name for p in (self.root / "blog").iterdir()], [self.post.slug])
+        # Byte-for-byte what the Django fallback would have served
+        response = self.client.get(reverse("seo-blog-post", kwargs={"slug": self.post.slug}))
+        self.assertEqual(self.page.read_bytes(), response.content)
+
+    @override_settings(
+        API_BASE_URL="http://api.example.com",
+        SITE_URL="http://example.com",
+        IMAGE_VARIANTS_ASYNC=False,
+    )
+    def test_media_urls_point_at_the_api_host(self) -> None:
+        """Local media is served by the API, not the frontend at SITE_URL."""
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        with self.settings(MEDIA_ROOT=media.name):
+            self.post.image = SimpleUploadedFile("cover.png", _png(), content_type="image/png")
+            self.post.save()
+            call_command("prerender_seo", stdout=StringIO())
+
+        self.assertIn(f"http://api.example.com{self.post.image.url}", self.page.read_text())
+
+    def test_admin_saves_rewrite_and_remove_pages(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = "Renamed Post"
+            self.post.save()
+        self.assertIn("Renamed Post", self.page.read_text())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.status = "draft"
+            self.post.save()
+        self.assertFalse(self.page.exists())
+        self.assertTrue((self.root / "home" / "index.html").is_file())
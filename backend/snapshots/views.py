@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_http_methods
+
+from .builder import get_home_snapshot
+
+
+@require_http_methods(["GET", "HEAD"])
+def home_snapshot(request: HttpRequest) -> HttpResponse:
+    """
+    Serves the pre-rendered homepage payload (info, projects, posts, cards).
+
+    The body is stored as raw JSON bytes, so a hit costs one cache GET and a
+    byte write: no ORM queries and no serializer work.
+    """
+    snapshot = get_home_snapshot()
+    etag: str = snapshot["etag"]
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(snapshot["body"], content_type="application/json")
+
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, max_age=settings.API_BROWSER_TTL)
+    return response
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class WalletConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "wallet"
+
+    def ready(self) -> None:
+        from config.cache import connect_cache_invalidation
+        from config.images import connect_image_variants
+
+        from .models import Card
+
+        connect_cache_invalidation(Card)
+        connect_image_variants(Card, "image")
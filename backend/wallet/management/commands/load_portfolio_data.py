@@ -4,7 +4,7 @@ from typing import Any
 
 from django.core.management.base import BaseCommand
 
-from wallet.models import Card
+from info.datasets import DatasetLoader
 
 
 class Command(BaseCommand):
@@ -37,19 +37,9 @@ class Command(BaseCommand):
             },
         ]
 
-        for data in cards_data:
-            obj, created = Card.objects.get_or_create(
-                card_name=data["card_name"],
-                defaults={
-                    "description": data["description"],
-                    "annual_fee": data["annual_fee"],
-                    "referral_link": data["referral_link"],
-                    "order": data["order"],
-                },
-            )
-            if created:
-                self.stdout.write(self.style.SUCCESS(f"Created card: {obj.card_name}"))
-            else:
-                self.stdout.write(f"Card already exists: {obj.card_name}")
+        # Cards that already exist (by name) are left untouched
+        created = DatasetLoader(log=self.stdout.write).load({"cards": cards_data})
+        if not created:
+            self.stdout.write("All cards already exist")
 
         self.stdout.write(self.style.SUCCESS("Successfully seeded portfolio data."))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wallet", "0002_card_image_height_card_image_width_alter_card_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="card",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:52
+
+import config.image_probe
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wallet", "0004_image_placeholder"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="card",
+            name="image",
+            field=config.image_probe.ProbedImageField(
+                blank=True,
+                height_field="image_height",
+                null=True,
+                upload_to="card_images/",
+                width_field="image_width",
+            ),
+        ),
+    ]
@@ -3,6 +3,8 @@ from __future__ import annotations
 from django.db import models
 from django_ckeditor_5.fields import CKEditor5Field
 
+from config.image_probe import ProbedImageField
+
 
 class Card(models.Model):
     """
@@ -19,13 +21,19 @@ class Card(models.Model):
     referral_link = models.URLField(("Referral Link"), blank=True)
     image_width = models.PositiveIntegerField(null=True, blank=True)
     image_height = models.PositiveIntegerField(null=True, blank=True)
-    image = models.ImageField(
+    # Tiny inline WebP (data URI) painted until the image loads; see config/images.py
+    image_placeholder = models.CharField(
+        max_length=512, blank=True, default="", editable=False
+    )
+    image = ProbedImageField(
         upload_to="card_images/",
         blank=True,
         null=True,
         width_field="image_width",
         height_field="image_height",
     )
+    # Manifest of responsive copies of image, written by config/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     order = models.PositiveIntegerField(
         default=0, help_text="Set the display order of cards."
     )
@@ -5,11 +5,14 @@ from typing import Optional
 from rest_framework import serializers
 from rest_framework.request import Request
 
+from config.images import ImageSrcsetField
+
 from .models import Card
 
 
 class CardSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
     image_url = serializers.SerializerMethodField()
+    image_srcset = ImageSrcsetField("image")
 
     class Meta:
         model = Card
@@ -20,8 +23,10 @@ class CardSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
             "annual_fee",
             "referral_link",
             "image_url",
+            "image_srcset",
             "image_width",
             "image_height",
+            "image_placeholder",
             "order",
         ]
 
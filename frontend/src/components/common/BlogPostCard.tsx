@@ -1,10 +1,11 @@
 import { Link } from "react-router-dom";
-import { BlogPost } from "../../types";
+import { BlogPostSummary } from "../../types";
 import { Calendar } from "./Icons";
 import imageUtils from "../../utils/imageUtils";
+import ResponsiveImage from "./ResponsiveImage";
 
 interface BlogPostCardProps {
-  post: BlogPost;
+  post: BlogPostSummary;
   isEager?: boolean;
 }
 
@@ -20,8 +21,11 @@ export const BlogPostCard = ({ post, isEager = false }: BlogPostCardProps) => {
   return (
     <div className="bg-bg-light dark:bg-bg-dark text-brand-light dark:text-brand-dark border-2 border-gray-200 dark:border-neutral-800 rounded-lg overflow-hidden shadow-sm transition-all duration-200 hover:shadow-md hover:scale-[1.02] md:flex group">
       <div className="bg-transparent flex items-center justify-center w-full md:w-1/3 md:aspect-[4/3] flex-shrink-0 overflow-hidden relative">
-        <img
+        <ResponsiveImage
           src={imageUtils.getImageUrl(post.image_url, "blogCard")}
+          srcset={post.image_srcset}
+          placeholder={post.image_placeholder}
+          sizes="(min-width: 768px) 33vw, 100vw"
           alt={post.title}
           width={post.image_width}
           height={post.image_height}
@@ -58,10 +62,9 @@ export const BlogPostCard = ({ post, isEager = false }: BlogPostCardProps) => {
           </div>
         )}
 
-        <div
-          className="text-gray-600 dark:text-gray-400 line-clamp-4 prose prose-sm dark:prose-invert max-w-none"
-          dangerouslySetInnerHTML={{ __html: post.body }}
-        />
+        <p className="text-gray-600 dark:text-gray-400 line-clamp-4 prose prose-sm dark:prose-invert max-w-none">
+          {post.excerpt}
+        </p>
       </div>
     </div>
   );
@@ -0,0 +1,60 @@
+import React from "react";
+import { ImageSrcset } from "../../types";
+
+interface ResponsiveImageProps extends React.ImgHTMLAttributes<HTMLImageElement> {
+  /** Variant srcsets from the API; falls back to a plain <img> when absent */
+  srcset?: ImageSrcset | null;
+  /** Rendered width of the image slot, so the browser can pick a variant */
+  sizes: string;
+  /** Inline data URI shown behind the image until it has loaded */
+  placeholder?: string;
+}
+
+/**
+ * Renders an uploaded image as a <picture> offering the AVIF variants first
+ * and the WebP ones as the <img> srcset, with `src` as the full-size
+ * fallback. `display: contents` keeps the <img> as the layout child of the
+ * caller's container. The placeholder is painted as the image's own
+ * background and dropped on load so it never shows through transparency.
+ */
+const ResponsiveImage = ({
+  srcset,
+  sizes,
+  placeholder,
+  style,
+  onLoad,
+  ...imgProps
+}: ResponsiveImageProps) => {
+  const placeholderStyle: React.CSSProperties | undefined = placeholder
+    ? {
+        backgroundImage: `url("${placeholder}")`,
+        backgroundSize: "cover",
+        backgroundPosition: "center",
+        ...style,
+      }
+    : style;
+
+  const handleLoad = (e: React.SyntheticEvent<HTMLImageElement>) => {
+    if (placeholder) e.currentTarget.style.backgroundImage = "none";
+    onLoad?.(e);
+  };
+
+  if (!srcset) {
+    return <img {...imgProps} style={placeholderStyle} onLoad={handleLoad} />;
+  }
+
+  return (
+    <picture className="contents">
+      {srcset.avif && <source type="image/avif" srcSet={srcset.avif} sizes={sizes} />}
+      <img
+        {...imgProps}
+        srcSet={srcset.webp}
+        sizes={srcset.webp ? sizes : undefined}
+        style={placeholderStyle}
+        onLoad={handleLoad}
+      />
+    </picture>
+  );
+};
+
+export default ResponsiveImage;
@@ -1,6 +1,6 @@
 import { useState } from "react";
 import { useSearchParams } from "react-router-dom";
-import { BlogPost } from "../../types";
+import { BlogPostSummary, Page } from "../../types";
 import { Search } from "../common/Icons";
 import { BlogPostCard } from "../common/BlogPostCard";
 import apiService from "../../services/api";
@@ -18,10 +18,39 @@ const BlogPage = () => {
   if (activeTag) params.categories__name = activeTag;
 
   const {
-    data: posts,
+    data: firstPage,
     isLoading,
     error,
-  } = useApi<BlogPost[]>(() => apiService.blog.getAll(params), [searchTerm, activeTag]);
+  } = useApi<Page<BlogPostSummary>>(() => apiService.blog.getPage(params), [searchTerm, activeTag]);
+
+  // Pages loaded with "Load more" belong to the first page they continue; a new search or tag
+  // fetches a new first page, which starts over
+  const [more, setMore] = useState<{
+    after: Page<BlogPostSummary> | null;
+    posts: BlogPostSummary[];
+    next: string | null;
+    error: string | null;
+  }>({ after: null, posts: [], next: null, error: null });
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+
+  const loaded = more.after === firstPage
+    ? more
+    : { after: firstPage, posts: [], next: firstPage?.next ?? null, error: null };
+  const posts = firstPage ? [...firstPage.results, ...loaded.posts] : null;
+
+  const loadMore = async () => {
+    setIsLoadingMore(true);
+    const response = await apiService.blog.getPage(params, loaded.next);
+    setMore(response.data
+      ? {
+          after: firstPage,
+          posts: [...loaded.posts, ...response.data.results],
+          next: response.data.next,
+          error: null,
+        }
+      : { ...loaded, error: response.error });
+    setIsLoadingMore(false);
+  };
 
   const {
     data: tags = [],
@@ -74,7 +103,7 @@ const BlogPage = () => {
         )}
       </div>
 
-      <DataLoader<BlogPost>
+      <DataLoader<BlogPostSummary>
         isLoading={isLoading}
         error={error}
         data={posts}
@@ -102,6 +131,24 @@ const BlogPage = () => {
               {filteredPosts.map((post) => (
                 <BlogPostCard key={post.id} post={post} />
               ))}
+
+              {loaded.error && (
+                <div className="text-center text-sm text-red-800 dark:text-red-300">
+                  {loaded.error}
+                </div>
+              )}
+
+              {loaded.next && (
+                <div className="flex justify-center">
+                  <button
+                    onClick={() => { void loadMore(); }}
+                    disabled={isLoadingMore}
+                    className="inline-flex items-center justify-center rounded-md font-medium transition-colors duration-200 px-4 py-2 bg-transparent border-2 border-gray-200 dark:border-neutral-800 text-brand-light dark:text-brand-dark hover:border-brand-light dark:hover:border-brand-dark disabled:opacity-50"
+                  >
+                    {isLoadingMore ? "Loading..." : "Load more posts"}
+                  </button>
+                </div>
+              )}
             </div>
           );
         }}
@@ -1,5 +1,5 @@
 import { Link } from "react-router-dom";
-import { BlogPost, PageProps } from "../../types";
+import { BlogPostSummary, PageProps } from "../../types";
 import apiService from "../../services/api";
 import useApi from "../../hooks/useApi";
 import DataLoader from "../common/DataLoader";
@@ -11,7 +11,7 @@ const Blog = ({ limit = 3 }: PageProps) => {
     data: posts,
     isLoading,
     error,
-  } = useApi<BlogPost[]>(() => apiService.blog.getAll());
+  } = useApi<BlogPostSummary[]>(() => apiService.home.posts(limit + 1));
 
   return (
     <div id="blog" className="mx-auto px-4 py-8">
@@ -24,7 +24,7 @@ const Blog = ({ limit = 3 }: PageProps) => {
         </Link>
       </div>
 
-      <DataLoader<BlogPost>
+      <DataLoader<BlogPostSummary>
         isLoading={isLoading}
         error={error}
         data={posts}
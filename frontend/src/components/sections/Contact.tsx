@@ -8,6 +8,7 @@ const Contact = () => {
     name: "",
     email: "",
     message: "",
+    website: "",
   });
   const [notification, setNotification] = useState<NotificationType>(null);
   const [isSubmitting, setIsSubmitting] = useState<boolean>(false);
@@ -30,7 +31,7 @@ const Contact = () => {
   );
 
   const resetForm = useCallback((): void => {
-    setFormData({ name: "", email: "", message: "" });
+    setFormData({ name: "", email: "", message: "", website: "" });
   }, []);
 
   const handleSubmit = async (
@@ -144,6 +145,19 @@ const Contact = () => {
             />
           </div>
 
+          {/* Honeypot for bots; kept off-screen rather than display:none so form fillers still see it */}
+          <div className="absolute -left-[9999px]" aria-hidden="true">
+            <label htmlFor="website">Website</label>
+            <input
+              id="website"
+              type="text"
+              tabIndex={-1}
+              autoComplete="off"
+              value={formData.website}
+              onChange={handleChange}
+            />
+          </div>
+
           <div className="space-y-2">
             <label htmlFor="message" className="block text-sm font-medium">
               Message
@@ -4,6 +4,7 @@ import { Project, PageProps } from "../../types";
 import apiService from "../../services/api";
 import useApi from "../../hooks/useApi";
 import imageUtils from "../../utils/imageUtils";
+import ResponsiveImage from "../common/ResponsiveImage";
 import DataLoader from "../common/DataLoader";
 import { CardSkeleton } from "../common/Skeleton";
 
@@ -14,7 +15,7 @@ const Projects = ({ limit = 3 }: PageProps) => {
     isLoading,
     error,
   } = useApi<Project[]>(() => 
-    apiService.projects.getAll(isProjectsPage ? { is_visible: true } : { is_visible: true, limit })
+    isProjectsPage ? apiService.projects.getAll({ is_visible: true }) : apiService.home.projects(limit)
   );
 
   return (
@@ -82,8 +83,11 @@ const ProjectCard = ({ project, isEager = false }: ProjectCardProps) => {
   return (
     <div className="bg-bg-light dark:bg-bg-dark text-brand-light dark:text-brand-dark border-2 border-gray-200 dark:border-neutral-800 rounded-lg overflow-hidden shadow-sm transition-all duration-200 hover:shadow-md hover:scale-[1.02] group">
       <div className="bg-transparent flex items-center justify-center w-full md:aspect-[4/3] overflow-hidden relative">
-        <img
+        <ResponsiveImage
           src={imageUrl}
+          srcset={project.thumbnail_srcset}
+          placeholder={project.image_placeholder}
+          sizes="(min-width: 1024px) 300px, (min-width: 768px) 50vw, 100vw"
           alt={project.title || "Project thumbnail"}
           width={project.image_width}
           height={project.image_height}
@@ -5,6 +5,7 @@ import { ExternalLink, ChevronRight, X } from "../common/Icons";
 import apiService from "../../services/api";
 import useApi from "../../hooks/useApi";
 import imageUtils from "../../utils/imageUtils";
+import ResponsiveImage from "../common/ResponsiveImage";
 import DataLoader from "../common/DataLoader";
 import { CardSkeleton } from "../common/Skeleton";
 
@@ -23,7 +24,7 @@ const Wallet = ({ limit = 4 }: { limit?: number }) => {
     data: cards,
     isLoading,
     error,
-  } = useApi<CardType[]>(() => apiService.cards.getAll(isWalletPage ? undefined : { limit }));
+  } = useApi<CardType[]>(() => isWalletPage ? apiService.cards.getAll() : apiService.home.cards(limit));
 
   return (
     <div id="wallet" className="mx-auto px-4 py-8">
@@ -115,8 +116,11 @@ const CreditCard = ({
       onClick={onClick}
     >
       <div className="bg-transparent flex items-center justify-center w-full md:aspect-[4/3] overflow-hidden relative">
-        <img
+        <ResponsiveImage
           src={thumbnailUrl}
+          srcset={card.image_srcset}
+          placeholder={card.image_placeholder}
+          sizes="(min-width: 768px) 256px, 50vw"
           alt={card.card_name}
           width={card.image_width}
           height={card.image_height}
@@ -190,8 +194,11 @@ const CardDetailModal = ({
         
         {/* Full width hero image spanning the top */}
         <div className="w-full sm:aspect-[4/3] relative bg-transparent overflow-hidden flex-shrink-0">
-          <img
+          <ResponsiveImage
             src={imageUrl}
+            srcset={card.image_srcset}
+            placeholder={card.image_placeholder}
+            sizes="(min-width: 640px) 576px, 100vw"
             alt={card.card_name}
             width={card.image_width}
             height={card.image_height}
@@ -28,6 +28,51 @@ describe('apiService', () => {
     expect(result.status).toBe(200);
   });
 
+  test('blog.getPage fetches one page and continues from its next cursor', async () => {
+    const pages = [
+      { next: 'http://testserver/api/post/?cursor=abc', previous: null, results: [{ id: 1 }, { id: 2 }] },
+      { next: null, previous: 'http://testserver/api/post/', results: [{ id: 3 }] }
+    ];
+    const fetchSpy = vi.spyOn(globalThis, 'fetch');
+    pages.forEach(page => {
+      fetchSpy.mockResolvedValueOnce({ ok: true, status: 200, json: async () => page } as any);
+    });
+
+    const first = await apiService.blog.getPage({ categories__name: 'Tech' });
+    expect(fetchSpy).toHaveBeenCalledTimes(1);
+    expect(first.data).toEqual(pages[0]);
+
+    const second = await apiService.blog.getPage({ categories__name: 'Tech' }, first.data!.next);
+    expect(fetchSpy).toHaveBeenCalledTimes(2);
+    expect(String(fetchSpy.mock.calls[1][0])).toContain('categories__name=Tech&cursor=abc');
+    expect(second.data?.results).toEqual([{ id: 3 }]);
+    expect(second.data?.next).toBeNull();
+  });
+
+  test('homepage sections share one snapshot request', async () => {
+    const snapshot = {
+      info: [{ id: 1 }],
+      projects: [{ id: 1, is_visible: true }, { id: 2, is_visible: false }, { id: 3, is_visible: true }],
+      posts: [{ id: 1 }, { id: 2 }, { id: 3 }],
+      cards: [{ id: 1 }, { id: 2 }],
+      generated_at: '2026-01-01T00:00:00Z'
+    };
+    const fetchSpy = vi.spyOn(globalThis, 'fetch').mockResolvedValue(
+      { ok: true, status: 200, json: async () => snapshot } as any
+    );
+
+    const [projects, posts, cards] = await Promise.all([
+      apiService.home.projects(3),
+      apiService.home.posts(2),
+      apiService.home.cards(4)
+    ]);
+
+    expect(fetchSpy).toHaveBeenCalledTimes(1);
+    expect(projects.data).toEqual([{ id: 1, is_visible: true }, { id: 3, is_visible: true }]);
+    expect(posts.data).toEqual([{ id: 1 }, { id: 2 }]);
+    expect(cards.data).toEqual(snapshot.cards);
+  });
+
   test('handles HTTP error responses gracefully', async () => {
     const mockResponse = {
       ok: false,
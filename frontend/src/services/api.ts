@@ -1,5 +1,5 @@
 import { 
-  ApiResponse, BlogPost, Project, Info, Card, ContactForm
+  ApiResponse, BlogPost, BlogPostSummary, BlogSearchResult, Project, Info, Card, ContactForm, HomeSnapshot, Page
 } from "../types";
 
 // Configuration
@@ -40,7 +40,8 @@ const API_URL = getApiUrl();
 async function fetchApi<T>(
   endpoint: string,
   options: RequestInit = {},
-  maxRetries = API_CONFIG.RETRY_ATTEMPTS
+  maxRetries = API_CONFIG.RETRY_ATTEMPTS,
+  unwrapPages = true
 ): Promise<ApiResponse<T>> {
   let path = endpoint;
   let queryString = "";
@@ -108,7 +109,7 @@ async function fetchApi<T>(
         
         // With pagination disabled in Django, we should get direct arrays
         // But handle legacy pagination format just in case
-        if (rawData && typeof rawData === 'object' && 'results' in rawData) {
+        if (unwrapPages && rawData && typeof rawData === 'object' && 'results' in rawData) {
           data = rawData.results as T;
           if (import.meta.env.DEV) {
             console.log(`Extracted paginated data for ${endpoint}:`, data);
@@ -175,6 +176,25 @@ async function fetchApi<T>(
   }
 }
 
+/**
+ * Fetches one page of a cursor-paginated listing. `next` is the URL from the previous page's
+ * `next` link (or null for the first page); its cursor is appended to `endpoint`, which keeps
+ * the caller's filters. Unpaginated endpoints that return a plain array come back as a single page.
+ */
+async function fetchPage<T>(endpoint: string, next: string | null = null): Promise<ApiResponse<Page<T>>> {
+  const cursor = next ? new URL(next, window.location.href).searchParams.get("cursor") : null;
+  const separator = endpoint.includes("?") ? "&" : "?";
+  const pageEndpoint = cursor ? `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}` : endpoint;
+  const response = await fetchApi<Page<T> | T[]>(pageEndpoint, {}, API_CONFIG.RETRY_ATTEMPTS, false);
+  if (response.error || response.data === null) {
+    return { data: null, error: response.error, status: response.status };
+  }
+  const page = Array.isArray(response.data)
+    ? { next: null, previous: null, results: response.data }
+    : response.data;
+  return { data: page, error: null, status: response.status };
+}
+
 /**
  * Dedicated fetch function for downloading blob files (like PDFs).
  * 
@@ -242,6 +262,16 @@ async function fetchBlob(
 }
 
 // API service object
+// In-flight (or recently finished) homepage snapshot request, shared by the homepage sections.
+// Reused for as long as the browser may cache the response (API_BROWSER_TTL).
+const HOME_SNAPSHOT_REUSE_MS = 60 * 1000;
+let homeSnapshotRequest: { promise: Promise<ApiResponse<HomeSnapshot>>; startedAt: number } | null = null;
+
+async function fromHomeSnapshot<T>(select: (snapshot: HomeSnapshot) => T): Promise<ApiResponse<T>> {
+  const response = await apiService.snapshot.home();
+  return { ...response, data: response.data ? select(response.data) : null };
+}
+
 const apiService = {
   baseUrl: API_URL,
   
@@ -283,14 +313,22 @@ const apiService = {
   
   // Blog endpoints
   blog: {
-    getAll: (params?: Record<string, string | number | boolean>): Promise<ApiResponse<BlogPost[]>> => {
+    getPage: (
+      params?: Record<string, string | number | boolean>,
+      next: string | null = null
+    ): Promise<ApiResponse<Page<BlogPostSummary>>> => {
       const searchParams = new URLSearchParams();
       if (params) {
         Object.entries(params).forEach(([key, value]) => searchParams.append(key, String(value)));
       }
       const queryString = searchParams.toString() ? `?${searchParams.toString()}` : '';
       if (import.meta.env.DEV) console.log('📝 Fetching blog posts...');
-      return fetchApi<BlogPost[]>(`post${queryString}`);
+      // /api/post/ is cursor-paginated; the blog page asks for the next page when the reader does
+      return fetchPage<BlogPostSummary>(`post${queryString}`, next);
+    },
+    search: (query: string): Promise<ApiResponse<BlogSearchResult[]>> => {
+      if (import.meta.env.DEV) console.log(`🔎 Searching blog posts for "${query}"...`);
+      return fetchApi<BlogSearchResult[]>(`post/search?q=${encodeURIComponent(query)}`);
     },
     getTags: (): Promise<ApiResponse<string[]>> => {
       if (import.meta.env.DEV) console.log('📝 Fetching blog tags...');
@@ -372,6 +410,34 @@ const apiService = {
     }
   },
 
+  // Pre-rendered homepage payload (info, projects, posts and cards in one request)
+  snapshot: {
+    home: (): Promise<ApiResponse<HomeSnapshot>> => {
+      // Every homepage section reads from the same request instead of fetching its own
+      if (!homeSnapshotRequest || Date.now() - homeSnapshotRequest.startedAt > HOME_SNAPSHOT_REUSE_MS) {
+        if (import.meta.env.DEV) console.log('🏠 Fetching homepage snapshot...');
+        const promise = fetchApi<HomeSnapshot>('snapshot/home').then(response => {
+          if (response.error) homeSnapshotRequest = null;
+          return response;
+        });
+        homeSnapshotRequest = { promise, startedAt: Date.now() };
+      }
+      return homeSnapshotRequest.promise;
+    }
+  },
+
+  // Homepage sections, sliced out of the shared snapshot the way their own endpoints would filter
+  home: {
+    info: (): Promise<ApiResponse<Info[]>> =>
+      fromHomeSnapshot(snapshot => snapshot.info),
+    projects: (limit: number): Promise<ApiResponse<Project[]>> =>
+      fromHomeSnapshot(snapshot => snapshot.projects.filter(project => project.is_visible).slice(0, limit)),
+    posts: (limit: number): Promise<ApiResponse<BlogPostSummary[]>> =>
+      fromHomeSnapshot(snapshot => snapshot.posts.slice(0, limit)),
+    cards: (limit: number): Promise<ApiResponse<Card[]>> =>
+      fromHomeSnapshot(snapshot => snapshot.cards.slice(0, limit))
+  },
+
   // Utility methods
   utils: {
     // Test API connectivity
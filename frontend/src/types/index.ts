@@ -7,6 +7,15 @@ export interface ApiResponse<T = unknown> {
   status: number;
 }
 
+/**
+ * Cursor-paginated listing, as returned by KeysetCursorPagination
+ */
+export interface Page<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
 /**
  * Navigation Item Type
  */
@@ -17,6 +26,15 @@ export interface NavigationItem {
   sectionRef?: string | null;
 }
 
+/**
+ * srcset strings ("<url> 320w, <url> 640w, ...") for the responsive variants
+ * of an uploaded image, per format. Null until the variants are generated.
+ */
+export interface ImageSrcset {
+  avif?: string;
+  webp?: string;
+}
+
 /**
  * Bio/Profile information type
  */
@@ -27,8 +45,11 @@ export interface Info {
   greeting: string;
   bio: string;
   profile_photo_url: string | null;
+  profile_photo_srcset?: ImageSrcset | null;
   image_width?: number;
   image_height?: number;
+  /** Tiny blurred data URI to paint while the image loads */
+  image_placeholder?: string;
   github: string;
   linkedin: string;
   substack?: string;
@@ -44,8 +65,11 @@ export interface BlogPost {
   author?: string;
   body: string;
   image_url: string;
+  image_srcset?: ImageSrcset | null;
   image_width?: number;
   image_height?: number;
+  /** Tiny blurred data URI to paint while the image loads */
+  image_placeholder?: string;
   created_on?: string;
   publish_date?: string;
   status?: string;
@@ -56,6 +80,35 @@ export interface BlogPost {
   order?: number;
 }
 
+/**
+ * Compact blog post returned by list endpoints: a plain-text excerpt and
+ * reading time in place of the body HTML
+ */
+export interface BlogPostSummary extends Omit<BlogPost, "body"> {
+  excerpt: string;
+  reading_time: number;
+}
+
+/**
+ * Ranked blog search hit from /api/post/search/
+ */
+export interface BlogSearchResult {
+  id: number;
+  title: string;
+  slug?: string;
+  publish_date?: string;
+  image_url: string | null;
+  image_srcset?: ImageSrcset | null;
+  image_width?: number;
+  image_height?: number;
+  /** Tiny blurred data URI to paint while the image loads */
+  image_placeholder?: string;
+  tags?: string[];
+  rank: number;
+  /** HTML-escaped snippet with matches wrapped in <mark> */
+  headline: string;
+}
+
 /**
  * Project type
  */
@@ -64,8 +117,11 @@ export interface Project {
   title: string;
   description: string;
   thumbnail_url: string;
+  thumbnail_srcset?: ImageSrcset | null;
   image_width?: number;
   image_height?: number;
+  /** Tiny blurred data URI to paint while the image loads */
+  image_placeholder?: string;
   repo: string;
   deployed_url?: string;
   emoji?: string;
@@ -91,12 +147,26 @@ export interface Card {
   description: string;
   annual_fee?: string;
   image_url?: string;
+  image_srcset?: ImageSrcset | null;
   image_width?: number;
   image_height?: number;
+  /** Tiny blurred data URI to paint while the image loads */
+  image_placeholder?: string;
   referral_link?: string;
   order?: number;
 }
 
+/**
+ * Pre-rendered homepage payload served by /api/snapshot/home/
+ */
+export interface HomeSnapshot {
+  info: Info[];
+  projects: Project[];
+  posts: BlogPostSummary[];
+  cards: Card[];
+  generated_at: string;
+}
+
 /**
  * Contact form data
  */
@@ -104,6 +174,8 @@ export interface ContactForm {
   name: string;
   email: string;
   message: string;
+  // Honeypot: hidden from people, so anything filled in here came from a bot
+  website?: string;
 }
 
 